@@ -0,0 +1,424 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from helpers.frameHelper import FrameHelper
+
+CODE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIRECTORY = os.path.dirname(CODE_DIRECTORY)
+REPORT_VERSION = 1
+
+DEFAULT_COVER_SIZES = ["1KB", "1MB", "16MB"]
+DEFAULT_DICTIONARY_SIZES = [10, 1000, 100000]
+SIZE_UNITS = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30, "B": 1}
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Runs the benchmark suite and writes the report as JSON. Every case runs in a fresh interpreter, so that
+    the start-up time and the peak memory of one case are not influenced by the others.
+
+    Synthetic covers and dictionaries are generated from the seed and are therefore identical between runs.
+    The realistic baseline uses `examples/the_apology.txt` and `password.json`.
+
+    Args:
+        arguments (list[str] | None): The command-line arguments without the program name
+            (default is None, which uses sys.argv).
+
+    Returns:
+        int: The exit code.
+
+    Example:
+        $ python ./code/benchmark.py --output before.json
+        $ python ./code/benchmark.py --output after.json --compare before.json
+    """
+    parser = argparse.ArgumentParser(prog="benchmark.py", description="Measures the encode and decode throughput.")
+    parser.add_argument("--cover-sizes", default=",".join(DEFAULT_COVER_SIZES),
+                        help="comma separated cover sizes from 1KB to 1GB (default is %(default)s)")
+    parser.add_argument("--dictionary-sizes", default=",".join(map(str, DEFAULT_DICTIONARY_SIZES)),
+                        help="comma separated numbers of synonym pairs (default is %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the generated data (default is 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="the number of timed runs per case, the best counts")
+    parser.add_argument("--in-memory-limit", default="64MB",
+                        help="the largest cover also measured with write and read in memory (default is 64MB)")
+    parser.add_argument("--work-dir", help="a directory for the generated files (default is a temporary one)")
+    parser.add_argument("--output", default="-", help="the file to write the JSON report to (default is stdout)")
+    parser.add_argument("--compare", help="a previous report to print the relative change against")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parsedArguments = parser.parse_args(arguments)
+
+    if parsedArguments.case is not None:
+        with open(parsedArguments.case) as file:
+            print(json.dumps(runCase(json.load(file))))
+        return 0
+
+    with tempfile.TemporaryDirectory() as temporaryDirectory:
+        workDirectory = parsedArguments.work_dir or temporaryDirectory
+        os.makedirs(workDirectory, exist_ok=True)
+
+        cases = [createBaselineCase(workDirectory)]
+        for pairCount in [int(size) for size in parsedArguments.dictionary_sizes.split(",")]:
+            for coverSize in [parseSize(size) for size in parsedArguments.cover_sizes.split(",")]:
+                cases.append(createSyntheticCase(workDirectory, parsedArguments.seed, coverSize, pairCount))
+
+        inMemoryLimit = parseSize(parsedArguments.in_memory_limit)
+        results = []
+        for case in cases:
+            case["repeat"] = parsedArguments.repeat
+            case["inMemory"] = case["coverBytes"] <= inMemoryLimit
+            results.append(runCaseInSubprocess(workDirectory, case))
+            print(f"{results[-1]['name']}: done", file=sys.stderr)
+
+    report = {
+        "version": REPORT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": parsedArguments.seed,
+        "results": results
+    }
+
+    serializedReport = json.dumps(report, indent=2)
+    if parsedArguments.output == "-":
+        print(serializedReport)
+    else:
+        with open(parsedArguments.output, "w") as file:
+            file.write(serializedReport)
+
+    if parsedArguments.compare is not None:
+        with open(parsedArguments.compare) as file:
+            for line in compareReports(json.load(file), report):
+                print(line, file=sys.stderr)
+
+    return 0
+
+def parseSize(size: str) -> int:
+    """
+    Parses a size like "16MB" into a number of bytes.
+
+    Args:
+        size (str): The size, a number followed by B, KB, MB or GB.
+
+    Returns:
+        int: The number of bytes.
+
+    Example:
+        >>> parseSize("2KB")
+        2048
+    """
+    size = size.strip().upper()
+    for unit in ("KB", "MB", "GB", "B"):
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * SIZE_UNITS[unit])
+    return int(size)
+
+def generateWords(rng: random.Random, count: int) -> list[str]:
+    """
+    Generates distinct lowercase words of 3 to 10 letters.
+
+    Args:
+        rng (random.Random): The seeded random number generator.
+        count (int): The number of words.
+
+    Returns:
+        list[str]: The words in the order they were generated.
+    """
+    words: dict[str, None] = {}
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(words) < count:
+        words["".join(rng.choices(letters, k=rng.randint(3, 10)))] = None
+    return list(words)
+
+def generateCover(rng: random.Random, path: str, size: int, carriers: list[str], fillers: list[str],
+                  carrierRatio: float = 0.5) -> tuple[int, int]:
+    """
+    Writes a cover of about `size` bytes, in which a share of `carrierRatio` of the words are carriers.
+
+    Args:
+        rng (random.Random): The seeded random number generator.
+        path (str): The path of the file to write.
+        size (int): The size of the cover in bytes.
+        carriers (list[str]): The words of the synonym pairs.
+        fillers (list[str]): Words that are no carriers.
+        carrierRatio (float): The share of carrier words (default is 0.5).
+
+    Returns:
+        tuple[int, int]: The number of words and the number of carrier words of the cover.
+    """
+    separators = [" "] * 10 + [", ", ". ", "\n"]
+    wordCount = 0
+    carrierCount = 0
+    written = 0
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        while written < size:
+            isCarrier = rng.choices((True, False), (carrierRatio, 1 - carrierRatio), k=4096)
+            words = [rng.choice(carriers) if carrier else rng.choice(fillers) for carrier in isCarrier]
+            pieces = []
+
+            # every word is followed by a separator, so that all of them count as carriers
+            for word, separator, carrier in zip(words, rng.choices(separators, k=len(words)), isCarrier):
+                if written + len(word) + len(separator) > size:
+                    size = written
+                    break
+                pieces.append(word + separator)
+                written += len(word) + len(separator)
+                wordCount += 1
+                carrierCount += carrier
+
+            file.write("".join(pieces))
+
+    return wordCount, carrierCount
+
+def createSyntheticCase(workDirectory: str, seed: int, coverSize: int, pairCount: int) -> dict:
+    """
+    Generates the dictionary, the cover and the secret of a synthetic case.
+
+    Args:
+        workDirectory (str): The directory for the generated files.
+        seed (int): The seed of the generated data.
+        coverSize (int): The size of the cover in bytes.
+        pairCount (int): The number of synonym pairs.
+
+    Returns:
+        dict: The description of the case, see `runCase`.
+    """
+    rng = random.Random(f"{seed}-{pairCount}")
+    words = generateWords(rng, 2 * pairCount + 1000)
+    carriers, fillers = words[:2 * pairCount], words[2 * pairCount:]
+
+    configPath = os.path.join(workDirectory, f"config-{seed}-{pairCount}.json")
+    if not os.path.exists(configPath):
+        with open(configPath, "w") as file:
+            json.dump([{"word": carriers[i], "synonym": carriers[i + 1]} for i in range(0, len(carriers), 2)], file)
+
+    rng = random.Random(f"{seed}-{pairCount}-{coverSize}")
+    coverPath = os.path.join(workDirectory, f"cover-{seed}-{pairCount}-{coverSize}.txt")
+    wordCount, carrierCount = generateCover(rng, coverPath, coverSize, carriers, fillers)
+
+    return {
+        "name": f"synthetic-{formatSize(coverSize)}-{pairCount}",
+        "config": configPath,
+        "cover": coverPath,
+        "coverBytes": os.path.getsize(coverPath),
+        "coverWords": wordCount,
+        "pairs": pairCount,
+        "secretBytes": fittingSecretLength(carrierCount),
+        "seed": seed
+    }
+
+def createBaselineCase(workDirectory: str) -> dict:
+    """
+    Describes the realistic case of `examples/the_apology.txt` with the synonyms of `password.json`.
+
+    Args:
+        workDirectory (str): The directory for the generated files.
+
+    Returns:
+        dict: The description of the case, see `runCase`.
+    """
+    coverPath = os.path.join(ROOT_DIRECTORY, "examples", "the_apology.txt")
+    configPath = os.path.join(ROOT_DIRECTORY, "password.json")
+
+    with open(configPath) as file:
+        pairs = json.load(file)
+    carriers = {word for pair in pairs for word in (pair["word"], pair["synonym"])}
+    with open(coverPath, encoding="utf-8") as file:
+        text = file.read()
+
+    # the words that are followed by a non-alphabetic character, like the Steganograph counts them
+    words = "".join(character if character.isalpha() else " " for character in text + " ").split()
+    carrierCount = sum(word in carriers for word in words)
+
+    return {
+        "name": "baseline-the_apology",
+        "config": configPath,
+        "cover": coverPath,
+        "coverBytes": os.path.getsize(coverPath),
+        "coverWords": len(words),
+        "pairs": len(pairs),
+        "secretBytes": fittingSecretLength(carrierCount),
+        "seed": 0
+    }
+
+def fittingSecretLength(capacityBits: int, fill: float = 0.9) -> int | None:
+    """
+    Returns the length of a binary secret whose frame fills the given share of the capacity.
+
+    Args:
+        capacityBits (int): The number of bits the cover can hold.
+        fill (float): The share of the capacity to use (default is 0.9).
+
+    Returns:
+        int | None: The length of the secret in bytes, or None if not even an empty frame fits.
+    """
+    frameBytes = int(capacityBits * fill) // 8
+    secretBytes = frameBytes - 3 - len(FrameHelper.encode_varint(frameBytes))
+    return secretBytes if secretBytes >= 0 else None
+
+def formatSize(size: int) -> str:
+    for unit in ("GB", "MB", "KB"):
+        if size >= SIZE_UNITS[unit] and size % SIZE_UNITS[unit] == 0:
+            return f"{size // SIZE_UNITS[unit]}{unit}"
+    return f"{size}B"
+
+def runCaseInSubprocess(workDirectory: str, case: dict) -> dict:
+    """
+    Runs a case in a fresh interpreter.
+
+    Args:
+        workDirectory (str): The directory for the case description.
+        case (dict): The description of the case.
+
+    Returns:
+        dict: The result of the case, see `runCase`.
+    """
+    if case["secretBytes"] is None:
+        return {**case, "error": "The cover is too small to hide a secret."}
+
+    casePath = os.path.join(workDirectory, "case.json")
+    with open(casePath, "w") as file:
+        json.dump(case, file)
+
+    started = time.perf_counter()
+    process = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", casePath],
+                             capture_output=True, text=True, cwd=CODE_DIRECTORY)
+    elapsed = time.perf_counter() - started
+    if process.returncode != 0:
+        # a case killed by a signal, e.g. by the OOM killer, leaves no traceback
+        lines = process.stderr.strip().splitlines()
+        return {**case, "error": lines[-1] if lines else f"exit code {process.returncode}"}
+
+    result = json.loads(process.stdout)
+    result["processSeconds"] = elapsed
+    return result
+
+def runCase(case: dict) -> dict:
+    """
+    Measures a single case in the current interpreter, which should not have imported the Steganograph yet.
+
+    Args:
+        case (dict): The description of the case with the keys name, config, cover, coverBytes, coverWords,
+            pairs, secretBytes, seed, repeat and inMemory.
+
+    Returns:
+        dict: The case with the start-up times, the throughput and the peak memory of every operation and the
+            memory of the compiled configuration.
+    """
+    started = time.perf_counter()
+    from steganography import Steganograph
+    imported = time.perf_counter()
+    steganograph = Steganograph(case["config"])
+    configured = time.perf_counter()
+
+    secret = random.Random(case["seed"]).randbytes(case["secretBytes"])
+    encodedPath = case["cover"] + ".encoded"
+
+    def encodeStream() -> None:
+        with open(case["cover"], encoding="utf-8", newline="") as source, \
+                open(encodedPath, "w", encoding="utf-8", newline="") as destination:
+            steganograph.write_stream(source, destination, secret)
+
+    def decodeStream() -> None:
+        if steganograph.read_mapped_file(encodedPath) != secret:
+            raise AssertionError("The decoded secret differs from the encoded one.")
+
+    operations = {"encodeStream": measure(encodeStream, case["repeat"])}
+    operations["decodeStream"] = measure(decodeStream, case["repeat"])
+
+    if case["inMemory"]:
+        with open(case["cover"], encoding="utf-8", newline="") as file:
+            cover = file.read()
+        encoded = steganograph.write(cover, secret)
+
+        def decode() -> None:
+            if steganograph.read(encoded) != secret:
+                raise AssertionError("The decoded secret differs from the encoded one.")
+
+        operations["encode"] = measure(lambda: steganograph.write(cover, secret), case["repeat"])
+        operations["decode"] = measure(decode, case["repeat"])
+
+    os.remove(encodedPath)
+
+    for operation in operations.values():
+        operation["wordsPerSecond"] = case["coverWords"] / operation["seconds"]
+        operation["bytesPerSecond"] = case["coverBytes"] / operation["seconds"]
+
+    return {
+        **case,
+        "startup": {"importSeconds": imported - started, "configSeconds": configured - imported},
+        "operations": operations,
+        "codebookBytes": tracePeakMemory(lambda: Steganograph(case["config"])),
+        "peakMemoryBytes": max(operation["peakMemoryBytes"] for operation in operations.values())
+    }
+
+def measure(function, repeat: int) -> dict:
+    """
+    Runs a function `repeat` times and once more with tracemalloc, which is too slow for the timed runs.
+
+    Args:
+        function (Callable[[], object]): The function to measure.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        dict: The best time in seconds and the peak memory the function allocated in bytes.
+    """
+    timings = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+
+    return {"seconds": min(timings), "peakMemoryBytes": tracePeakMemory(function)}
+
+def tracePeakMemory(function) -> int:
+    """
+    Returns the peak of the memory allocated by Python while running a function. Unlike the resident set size
+    of the process, it does not depend on the platform or on the memory of the parent process.
+
+    Args:
+        function (Callable[[], object]): The function to run.
+
+    Returns:
+        int: The peak memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def compareReports(previous: dict, current: dict) -> list[str]:
+    """
+    Compares the throughput and the memory of the cases both reports contain.
+
+    Args:
+        previous (dict): The earlier report.
+        current (dict): The later report.
+
+    Returns:
+        list[str]: One line per case and operation with the relative change, positive meaning faster.
+    """
+    previousResults = {result["name"]: result for result in previous["results"]}
+    lines = []
+    for result in current["results"]:
+        before = previousResults.get(result["name"])
+        if before is None or "operations" not in result or "operations" not in before:
+            continue
+        for name, operation in result["operations"].items():
+            if name in before["operations"]:
+                change = operation["wordsPerSecond"] / before["operations"][name]["wordsPerSecond"] - 1
+                lines.append(f"{result['name']} {name}: {change:+.1%} words/s")
+        if result["peakMemoryBytes"] and before["peakMemoryBytes"]:
+            change = result["peakMemoryBytes"] / before["peakMemoryBytes"] - 1
+            lines.append(f"{result['name']} peak memory: {change:+.1%}")
+    return lines
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import argparse
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+from helpers.codecHelper import CodecHelper
+from steganography import Steganograph
+
+STANDARD_STREAM = "-"
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Runs the non-interactive command-line interface. Unlike `main.py` it never opens a dialog, so it can be
+    used in scripts and containers without a display. A path of "-" stands for stdin or stdout.
+
+    Args:
+        arguments (list[str] | None): The command-line arguments without the program name
+            (default is None, which uses sys.argv).
+
+    Returns:
+        int: The exit code, 0 on success and 1 if the command failed.
+
+    Example:
+        $ python ./code/cli.py encode --config password.json --secret "Hello" --output hidden.txt cover.txt
+        $ python ./code/cli.py decode --config password.json hidden.txt
+        Hello
+    """
+    parser = createParser()
+    parsedArguments = parser.parse_args(arguments)
+
+    try:
+        # converting streams the configuration itself instead of loading it into a Steganograph
+        if parsedArguments.command is convertCommand:
+            convertCommand(parsedArguments)
+            return 0
+
+        steganograph = Steganograph(parsedArguments.config, framed=getattr(parsedArguments, "framed", False),
+                                    checksum=getattr(parsedArguments, "checksum", False),
+                                    compression=getattr(parsedArguments, "compression", None),
+                                    cacheDirectory=parsedArguments.cache_dir, ignoreCase=parsedArguments.ignore_case,
+                                    compact=parsedArguments.compact)
+        parsedArguments.command(steganograph, parsedArguments)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    return 0
+
+def createParser() -> argparse.ArgumentParser:
+    """
+    Creates the parser for the arguments of the `encode`, `decode`, `capacity` and `convert` commands.
+
+    Returns:
+        argparse.ArgumentParser: The parser, storing the function of the chosen command as `command`.
+    """
+    parser = argparse.ArgumentParser(prog="cli.py", description="Hides texts in the synonyms of a cover text.")
+    commands = parser.add_subparsers(required=True, metavar="COMMAND")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", required=True, help="the JSON file with the synonyms")
+    common.add_argument("--cache-dir", help="a directory to cache the compiled configuration in")
+    common.add_argument("--ignore-case", action="store_true", help="find carriers regardless of their case")
+    common.add_argument("--compact", action="store_true", help="keep the synonyms in a compact, shareable table")
+
+    encode = commands.add_parser("encode", parents=[common], help="hide a secret in a cover text")
+    encode.add_argument("cover", nargs="?", default=STANDARD_STREAM, help="the cover text (default is stdin)")
+    secret = encode.add_mutually_exclusive_group(required=True)
+    secret.add_argument("--secret", help="the text to hide")
+    secret.add_argument("--secret-file", help="a file whose bytes are hidden")
+    output = encode.add_mutually_exclusive_group()
+    output.add_argument("--output", default=STANDARD_STREAM, help="the file to write to (default is stdout)")
+    output.add_argument("--in-place", action="store_true",
+                        help="replace only the changing words in the cover file instead of writing a copy")
+    encode.add_argument("--framed", action="store_true", help="write the secret as length-prefixed frame")
+    encode.add_argument("--checksum", action="store_true", help="add a CRC32 checksum to a framed secret")
+    encode.add_argument("--compression", choices=CodecHelper.names() + ["auto"],
+                        help="compress the secret before hiding it, which implies --framed")
+    encode.set_defaults(command=encodeCommand)
+
+    decode = commands.add_parser("decode", parents=[common], help="read the secret hidden in a text")
+    decode.add_argument("text", nargs="?", default=STANDARD_STREAM, help="the text to read (default is stdin)")
+    decode.add_argument("--output", default=STANDARD_STREAM, help="the file to write to (default is stdout)")
+    decode.set_defaults(command=decodeCommand)
+
+    capacity = commands.add_parser("capacity", parents=[common], help="print how much a cover text can hold")
+    capacity.add_argument("cover", nargs="?", default=STANDARD_STREAM, help="the cover text (default is stdin)")
+    capacity.add_argument("--framed", action="store_true", help="count the bytes of a length-prefixed frame")
+    capacity.add_argument("--checksum", action="store_true", help="count the bytes of a frame with a CRC32 checksum")
+    capacity.set_defaults(command=capacityCommand)
+
+    convert = commands.add_parser("convert", help="convert a configuration into a codebook file, "
+                                                  "which can be passed as --config instead")
+    convert.add_argument("--config", required=True, help="the JSON file with the synonyms")
+    convert.add_argument("--ignore-case", action="store_true", help="find carriers regardless of their case")
+    convert.add_argument("output", help="the codebook file to write")
+    convert.set_defaults(command=convertCommand)
+
+    return parser
+
+def encodeCommand(steganograph: Steganograph, arguments: argparse.Namespace) -> None:
+    """
+    Hides the secret in the cover text, streaming the cover from its file or stdin to the output.
+    With --in-place only the words that change are written to the cover file.
+
+    Args:
+        steganograph (Steganograph): The initialized Steganograph.
+        arguments (argparse.Namespace): The parsed arguments of the `encode` command.
+    """
+    if arguments.secret_file is not None:
+        with open(arguments.secret_file, "rb") as file:
+            hiddenText: str | bytes = file.read()
+    else:
+        hiddenText = arguments.secret
+
+    if arguments.in_place:
+        if arguments.cover == STANDARD_STREAM:
+            raise ValueError("A cover file is needed to hide a secret in place.")
+        steganograph.write_in_place(arguments.cover, hiddenText)
+        return
+
+    with openInput(arguments.cover) as source, openOutput(arguments.output) as destination:
+        steganograph.write_stream(source, destination, hiddenText)
+
+def decodeCommand(steganograph: Steganograph, arguments: argparse.Namespace) -> None:
+    """
+    Reads the secret from a file or stdin and writes it to the output. A file is memory-mapped, so that
+    only the part up to the end of the secret is read.
+
+    Args:
+        steganograph (Steganograph): The initialized Steganograph.
+        arguments (argparse.Namespace): The parsed arguments of the `decode` command.
+    """
+    if arguments.text == STANDARD_STREAM:
+        hiddenText = steganograph.read_stream(sys.stdin)
+    else:
+        hiddenText = steganograph.read_mapped_file(arguments.text)
+
+    if isinstance(hiddenText, str):
+        with openOutput(arguments.output) as destination:
+            destination.write(hiddenText if arguments.output != STANDARD_STREAM else hiddenText + "\n")
+    elif arguments.output == STANDARD_STREAM:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(hiddenText)
+        sys.stdout.buffer.flush()
+    else:
+        with open(arguments.output, "wb") as file:
+            file.write(hiddenText)
+
+def capacityCommand(steganograph: Steganograph, arguments: argparse.Namespace) -> None:
+    """
+    Prints the number of bits and secret bytes the cover text can hold, the latter without the end marker
+    or, with --framed, the frame.
+
+    Args:
+        steganograph (Steganograph): The initialized Steganograph.
+        arguments (argparse.Namespace): The parsed arguments of the `capacity` command.
+    """
+    with openInput(arguments.cover) as source:
+        coverIndex = steganograph.index_cover(source.read())
+
+    print(f"{coverIndex.capacity_bits} bits, {steganograph.secret_capacity(coverIndex)} bytes")
+
+def convertCommand(arguments: argparse.Namespace) -> None:
+    """
+    Converts the configuration into a codebook file, reading the configuration item by item.
+
+    Args:
+        arguments (argparse.Namespace): The parsed arguments of the `convert` command.
+    """
+    Steganograph.convert_config(arguments.config, arguments.output, ignoreCase=arguments.ignore_case)
+
+@contextmanager
+def openInput(path: str) -> Iterator[TextIO]:
+    """
+    Opens a text file for reading, or returns stdin for "-". Newlines are kept as they are.
+
+    Args:
+        path (str): The path of the file or "-".
+
+    Returns:
+        Iterator[TextIO]: A context manager yielding the open file.
+    """
+    if path == STANDARD_STREAM:
+        yield sys.stdin
+        return
+
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        yield file
+
+@contextmanager
+def openOutput(path: str) -> Iterator[TextIO]:
+    """
+    Opens a text file for writing, or returns stdout for "-". A file is written to a temporary file next to it
+    that only replaces the file once everything was written, so a failed command leaves no partial output
+    and the output may be the cover itself.
+
+    Args:
+        path (str): The path of the file or "-".
+
+    Returns:
+        Iterator[TextIO]: A context manager yielding the open file.
+    """
+    if path == STANDARD_STREAM:
+        yield sys.stdout
+        return
+
+    descriptor, temporaryPath = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with open(descriptor, "w", encoding="utf-8", newline="") as file:
+            yield file
+        os.replace(temporaryPath, path)
+    except BaseException:
+        os.remove(temporaryPath)
+        raise
+
+if __name__ == "__main__":
+    sys.exit(main())
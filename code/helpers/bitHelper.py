@@ -1,3 +1,169 @@
+from collections.abc import Sequence
+from typing import Iterable, Iterator
+
+class BitArray(Sequence):
+    """
+    A compact sequence of bits backed by a bytearray, the first bit being the most significant bit of the
+    first byte. Single bits and groups of bits are read with shifts, so a payload of n bytes takes n bytes
+    of memory instead of 8n Python integers. A BitArray compares equal to any sequence of the same bits.
+
+    Attributes:
+        data (bytearray): The bytes holding the bits, the last byte padded with zeros.
+        length (int): The number of bits.
+
+    Methods:
+        from_bits(bits: Iterable[int]) -> BitArray:
+            Creates a BitArray from an iterable of bits.
+
+        append(bit: int) -> None:
+            Appends a single bit.
+
+        value(start: int, count: int) -> int:
+            Combines `count` bits starting at `start` into an integer.
+
+        to_bytes() -> bytes:
+            Returns the bits as bytes.
+    """
+    __slots__ = ('data', 'length')
+
+    data: bytearray
+    length: int
+
+    def __init__(self, data: bytes | bytearray = b"", length: int | None = None):
+        """
+        Initializes the BitArray with the bits of the given bytes.
+
+        Args:
+            data (bytes | bytearray): The bytes holding the bits.
+            length (int | None): The number of bits to use (default is all bits of `data`).
+
+        Example:
+            >>> BitArray(b"A")
+            BitArray([0, 1, 0, 0, 0, 0, 0, 1])
+        """
+        if length is None:
+            length = len(data) * 8
+
+        # keep the bits behind the end zero, so that appending and combining bits can rely on them
+        self.data = bytearray(data[:(length + 7) >> 3])
+        self.length = length
+        if length & 7:
+            self.data[-1] &= 0xFF << (8 - (length & 7)) & 0xFF
+
+    @staticmethod
+    def from_bits(bits: Iterable[int]) -> "BitArray":
+        """
+        Creates a BitArray from an iterable of bits.
+
+        Args:
+            bits (Iterable[int]): The bits (0 or 1).
+
+        Returns:
+            BitArray: The bits in compact form.
+        """
+        if isinstance(bits, BitArray):
+            return bits
+
+        bitArray = BitArray()
+        for bit in bits:
+            bitArray.append(bit)
+        return bitArray
+
+    def append(self, bit: int) -> None:
+        """
+        Appends a single bit.
+
+        Args:
+            bit (int): The bit to append (0 or 1).
+        """
+        if self.length & 7 == 0:
+            self.data.append(0)
+        if bit:
+            self.data[self.length >> 3] |= 0x80 >> (self.length & 7)
+        self.length += 1
+
+    def value(self, start: int, count: int) -> int:
+        """
+        Combines `count` bits starting at `start` into an integer, the first bit being the most significant.
+        Bits after the end of the array are treated as zeros.
+
+        Args:
+            start (int): The index of the first bit.
+            count (int): The number of bits to combine.
+
+        Returns:
+            int: The value of the bits.
+
+        Example:
+            >>> BitArray(b"A").value(0, 4)
+            4
+        """
+        if count == 1:
+            return self.data[start >> 3] >> (7 - (start & 7)) & 1 if start < self.length else 0
+
+        end = start + count
+        firstByte, lastByte = start >> 3, (end + 7) >> 3
+        chunk = int.from_bytes(self.data[firstByte:lastByte], 'big')
+
+        # bytes behind the array count as zeros, then the bits after `end` are shifted out
+        chunk <<= 8 * (lastByte - max(firstByte, min(lastByte, len(self.data))))
+        chunk >>= lastByte * 8 - end
+        return chunk & ((1 << count) - 1)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the bits as bytes, the last byte padded with zeros.
+
+        Returns:
+            bytes: The bytes holding the bits.
+        """
+        return bytes(self.data)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step == 1:
+                # a contiguous slice is shifted as a whole instead of bit by bit
+                length = max(0, stop - start)
+                padding = -length % 8
+                return BitArray((self.value(start, length) << padding).to_bytes((length + padding) >> 3, 'big'), length)
+            return BitArray.from_bits(self[position] for position in range(start, stop, step))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("BitArray index out of range")
+        return self.data[index >> 3] >> (7 - (index & 7)) & 1
+
+    def __iter__(self) -> Iterator[int]:
+        remaining = self.length
+        for byte in self.data:
+            for shift in range(7, 7 - min(8, remaining), -1):
+                yield byte >> shift & 1
+            remaining -= 8
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitArray):
+            return self.length == other.length and self.data == other.data
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes, bytearray)):
+            return len(other) == self.length and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __add__(self, other: Iterable[int]) -> "BitArray":
+        result = BitArray(self.data, self.length)
+        if isinstance(other, BitArray) and self.length & 7 == 0:
+            result.data += other.data
+            result.length += other.length
+            return result
+        for bit in other:
+            result.append(bit)
+        return result
+
+    def __repr__(self) -> str:
+        return f"BitArray({list(self)})"
+
 class BitHelper:
     """
     A utility class that provides static methods to convert strings to bit arrays and bits to characters,
@@ -5,31 +171,44 @@ class BitHelper:
     """
 
     @staticmethod
-    def string_to_bit_array(s: str, encoding='utf-8') -> list[int]:
+    def string_to_bit_array(s: str, encoding='utf-8') -> BitArray:
         """
-        Converts a string to a list of bits, using the specified encoding.
+        Converts a string to a sequence of bits, using the specified encoding. The bits are backed by
+        the encoded bytes and compare equal to a list of the same bits.
 
         Args:
             s (str): The input string to be converted.
             encoding (str): The encoding to use for the conversion (default is 'utf-8').
 
         Returns:
-            list[int]: A list of integers (0 or 1) representing the bit array for the given string.
+            BitArray: The bits (0 or 1) of the given string.
 
         Example:
-            >>> BitHelper.string_to_bit_array('A')
-            [0, 1, 0, 0, 0, 0, 0, 1]
+            >>> BitHelper.string_to_bit_array('A') == [0, 1, 0, 0, 0, 0, 0, 1]
+            True
         """
-        byte_array = s.encode(encoding)
-        return [int(bit) for byte in byte_array for bit in format(byte, '08b')]
+        return BitArray(s.encode(encoding))
 
     @staticmethod
-    def bits_to_char(bits: list[int], encoding='utf-8') -> str:
+    def as_bit_array(bits: Iterable[int]) -> BitArray:
+        """
+        Returns the given bits as a BitArray, converting them only if necessary.
+
+        Args:
+            bits (Iterable[int]): The bits (0 or 1).
+
+        Returns:
+            BitArray: The bits in compact form.
+        """
+        return BitArray.from_bits(bits)
+
+    @staticmethod
+    def bits_to_char(bits: Sequence[int], encoding='utf-8') -> str:
         """
         Converts a list of bits back to a string using the specified encoding.
 
         Args:
-            bits (list[int]): A list of bits to convert.
+            bits (Sequence[int]): A list or BitArray of bits to convert.
             encoding (str): The encoding used for conversion (default is 'utf-8').
 
         Returns:
@@ -42,8 +221,12 @@ class BitHelper:
         if len(bits) % 8 != 0:
             raise ValueError("Bit list length must be a multiple of 8.")
 
-        # Group bits into bytes and convert each byte from binary to integer
+        if isinstance(bits, BitArray):
+            return bits.to_bytes().decode(encoding)
+
+        # Group bits into bytes and shift each group of eight bits into a byte
         byte_array = bytes(
-            int(''.join(map(str, bits[i:i+8])), 2) for i in range(0, len(bits), 8))
+            b0 << 7 | b1 << 6 | b2 << 5 | b3 << 4 | b4 << 3 | b5 << 2 | b6 << 1 | b7
+            for b0, b1, b2, b3, b4, b5, b6, b7 in zip(*[iter(bits)] * 8))
 
         return byte_array.decode(encoding)
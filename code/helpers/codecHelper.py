@@ -0,0 +1,293 @@
+import heapq
+import zlib
+from typing import Callable
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_LZMA = 2
+CODEC_HUFFMAN = 3
+# the codec id is stored in three bits of the flags of a frame
+MAX_CODEC_ID = 7
+
+# Relative frequencies of the bytes of short English messages, scaled to integers. All other bytes, including
+# those of multi-byte UTF-8 characters, get the weight 1, so they stay encodable with longer codes.
+HUFFMAN_WEIGHTS = {
+    " ": 1800, "e": 1000, "t": 720, "a": 650, "o": 600, "i": 560, "n": 560, "s": 510, "h": 480, "r": 470,
+    "d": 330, "l": 320, "c": 220, "u": 220, "m": 200, "w": 180, "f": 180, "g": 160, "y": 160, "p": 150,
+    "b": 120, "v": 80, "k": 60, ".": 60, ",": 60, "I": 40, "T": 30, "A": 25, "S": 20, "H": 20, "W": 20,
+    "M": 15, "B": 15, "C": 15, "'": 20, "\n": 20, "?": 10, "!": 10, "-": 10, "j": 10, "x": 10, "q": 8, "z": 7,
+    "0": 10, "1": 10, "2": 8, "3": 6, "4": 6, "5": 6, "6": 5, "7": 5, "8": 5, "9": 5, ":": 5, "\"": 5
+}
+HUFFMAN_END = 256
+
+class PayloadCodec:
+    """
+    A class representing a way to compress the payload of a frame. The id of the codec is stored in the frame,
+    so that a reader picks the matching decompression automatically.
+
+    Attributes:
+        codecId (int): The id stored in the frame, from 0 to MAX_CODEC_ID.
+        name (str): The name used to select the codec.
+        compress (Callable[[bytes], bytes]): Compresses a payload.
+        decompress (Callable[[bytes], bytes]): Restores a compressed payload.
+    """
+
+    codecId: int
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+    def __init__(self, codecId: int, name: str, compress: Callable[[bytes], bytes],
+                 decompress: Callable[[bytes], bytes]):
+        """
+        Initializes the PayloadCodec object.
+
+        Args:
+            codecId (int): The id stored in the frame.
+            name (str): The name used to select the codec.
+            compress (Callable[[bytes], bytes]): Compresses a payload.
+            decompress (Callable[[bytes], bytes]): Restores a compressed payload.
+        """
+        self.codecId = codecId
+        self.name = name
+        self.compress = compress
+        self.decompress = decompress
+
+class HuffmanModel:
+    """
+    A static canonical Huffman code over bytes, built from HUFFMAN_WEIGHTS. Because the model is fixed, no code
+    table has to be embedded, which makes it effective for messages too short for zlib or lzma to pay off.
+    The code of HUFFMAN_END terminates the encoded bits, the rest of the last byte is padded with zeros.
+
+    Attributes:
+        codes (dict[int, tuple[int, int]]): Maps every symbol to its code and the length of the code.
+
+    Methods:
+        encode(data: bytes) -> bytes:
+            Encodes bytes with the static code.
+
+        decode(data: bytes) -> bytes:
+            Decodes bytes encoded with `encode`.
+    """
+
+    codes: dict[int, tuple[int, int]]
+
+    def __init__(self, weights: dict[int, int]):
+        """
+        Builds the canonical code from the weight of every symbol. Ties are broken by the symbol, so the same
+        weights always produce the same code.
+
+        Args:
+            weights (dict[int, int]): The weight of every symbol.
+        """
+        # every heap entry holds its weight, a tie breaker and the symbols below it
+        heap = [(weight, symbol, [symbol]) for symbol, weight in sorted(weights.items())]
+        heapq.heapify(heap)
+        lengths = dict.fromkeys(weights, 0)
+        while len(heap) > 1:
+            firstWeight, firstOrder, firstSymbols = heapq.heappop(heap)
+            secondWeight, secondOrder, secondSymbols = heapq.heappop(heap)
+            for symbol in firstSymbols + secondSymbols:
+                lengths[symbol] += 1
+            heapq.heappush(heap, (firstWeight + secondWeight, min(firstOrder, secondOrder), firstSymbols + secondSymbols))
+
+        # canonical codes: consecutive numbers in the order of length and symbol
+        self.codes = {}
+        self.__decodeTable: dict[tuple[int, int], int] = {}
+        code = 0
+        previousLength = 0
+        for symbol in sorted(lengths, key=lambda symbol: (lengths[symbol], symbol)):
+            code <<= lengths[symbol] - previousLength
+            previousLength = lengths[symbol]
+            self.codes[symbol] = (code, previousLength)
+            self.__decodeTable[(previousLength, code)] = symbol
+            code += 1
+
+    def encode(self, data: bytes) -> bytes:
+        """
+        Encodes bytes with the static code.
+
+        Args:
+            data (bytes): The bytes to encode.
+
+        Returns:
+            bytes: The encoded bits including the end code, padded to whole bytes.
+        """
+        codes = self.codes
+        encoded = bytearray()
+        # the bits not yet written as a byte, at most 7 plus the longest code
+        value = 0
+        length = 0
+        for symbol in data:
+            code, codeLength = codes[symbol]
+            value = value << codeLength | code
+            length += codeLength
+            while length >= 8:
+                length -= 8
+                encoded.append(value >> length & 0xFF)
+            value &= (1 << length) - 1
+        code, codeLength = codes[HUFFMAN_END]
+        value = value << codeLength | code
+        length += codeLength
+
+        padding = -length % 8
+        encoded += (value << padding).to_bytes((length + padding) // 8, 'big')
+        return bytes(encoded)
+
+    def decode(self, data: bytes) -> bytes:
+        """
+        Decodes bytes encoded with `encode`.
+
+        Args:
+            data (bytes): The encoded bytes.
+
+        Returns:
+            bytes: The decoded bytes.
+
+        Raises:
+            ValueError: If the data ends without the end code.
+        """
+        decodeTable = self.__decodeTable
+        decoded = bytearray()
+        code = 0
+        length = 0
+        for byte in data:
+            for shift in range(7, -1, -1):
+                code = code << 1 | byte >> shift & 1
+                length += 1
+                symbol = decodeTable.get((length, code))
+                if symbol is None:
+                    continue
+                if symbol == HUFFMAN_END:
+                    return bytes(decoded)
+                decoded.append(symbol)
+                code = length = 0
+        raise ValueError("The hidden text is corrupted.")
+
+class CodecHelper:
+    """
+    A utility class holding the registry of payload codecs. The built-in codecs are "none", "zlib" (raw deflate),
+    "lzma" (raw LZMA2) and "huffman" (a static code for short English messages). Further codecs can be
+    registered with the ids that are still free.
+    """
+
+    __codecs: dict[int, PayloadCodec] = {}
+    __huffmanModel: HuffmanModel | None = None
+
+    @staticmethod
+    def register(codec: PayloadCodec) -> None:
+        """
+        Registers a codec, so that it can be selected by its name and is used for frames carrying its id.
+
+        Args:
+            codec (PayloadCodec): The codec to register.
+
+        Raises:
+            ValueError: If the id is out of range or already used by another codec.
+        """
+        existing = CodecHelper.__codecs.get(codec.codecId)
+        if not 0 <= codec.codecId <= MAX_CODEC_ID or (existing is not None and existing.name != codec.name):
+            raise ValueError(f"The codec id {codec.codecId} is invalid.")
+        CodecHelper.__codecs[codec.codecId] = codec
+
+    @staticmethod
+    def names() -> list[str]:
+        """
+        Returns the names of all registered codecs.
+
+        Returns:
+            list[str]: The names ordered by id.
+        """
+        return [CodecHelper.__codecs[codecId].name for codecId in sorted(CodecHelper.__codecs)]
+
+    @staticmethod
+    def compress(payload: bytes, name: str) -> tuple[int, bytes]:
+        """
+        Compresses a payload with the codec of the given name. The name "auto" tries every codec and keeps
+        the smallest result, which is the uncompressed payload if no codec makes it smaller.
+
+        Args:
+            payload (bytes): The payload to compress.
+            name (str): The name of the codec or "auto".
+
+        Returns:
+            tuple[int, bytes]: The id of the codec used and the compressed payload.
+
+        Raises:
+            ValueError: If no codec has the given name.
+
+        Example:
+            >>> CodecHelper.compress(b"hello there", "auto")
+            (3, b'...')
+        """
+        if name == "auto":
+            candidates = [(codec.codecId, codec.compress(payload)) for codec in CodecHelper.__codecs.values()]
+            return min(candidates, key=lambda candidate: (len(candidate[1]), candidate[0]))
+
+        for codec in CodecHelper.__codecs.values():
+            if codec.name == name:
+                return codec.codecId, codec.compress(payload)
+        raise ValueError(f'The compression "{name}" is unknown.')
+
+    @staticmethod
+    def decompress(codecId: int, data: bytes) -> bytes:
+        """
+        Restores a payload compressed with the codec of the given id.
+
+        Args:
+            codecId (int): The id stored in the frame.
+            data (bytes): The compressed payload.
+
+        Returns:
+            bytes: The original payload.
+
+        Raises:
+            ValueError: If the codec is unknown or the data cannot be decompressed.
+        """
+        codec = CodecHelper.__codecs.get(codecId)
+        if codec is None:
+            raise ValueError(f"The hidden text uses the unknown compression {codecId}.")
+        try:
+            return codec.decompress(data)
+        except ValueError:
+            raise
+        except Exception as error:
+            raise ValueError("The hidden text is corrupted.") from error
+
+    @staticmethod
+    def huffman_model() -> HuffmanModel:
+        """
+        Returns the static Huffman model, building it on first use.
+
+        Returns:
+            HuffmanModel: The model built from HUFFMAN_WEIGHTS.
+        """
+        if CodecHelper.__huffmanModel is None:
+            weights = {symbol: 1 for symbol in range(256)}
+            weights.update({ord(character): weight for character, weight in HUFFMAN_WEIGHTS.items()})
+            weights[HUFFMAN_END] = 10
+            CodecHelper.__huffmanModel = HuffmanModel(weights)
+        return CodecHelper.__huffmanModel
+
+def _deflate(payload: bytes) -> bytes:
+    # raw deflate without the zlib header and checksum, which would cost six bytes per message
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return compressor.compress(payload) + compressor.flush()
+
+def _lzmaFilters() -> list[dict]:
+    import lzma
+    return [{"id": lzma.FILTER_LZMA2, "preset": 9}]
+
+def _lzmaCompress(payload: bytes) -> bytes:
+    import lzma
+    return lzma.compress(payload, format=lzma.FORMAT_RAW, filters=_lzmaFilters())
+
+def _lzmaDecompress(data: bytes) -> bytes:
+    import lzma
+    return lzma.decompress(data, format=lzma.FORMAT_RAW, filters=_lzmaFilters())
+
+CodecHelper.register(PayloadCodec(CODEC_NONE, "none", bytes, bytes))
+CodecHelper.register(PayloadCodec(CODEC_ZLIB, "zlib", _deflate, lambda data: zlib.decompress(data, -15)))
+CodecHelper.register(PayloadCodec(CODEC_LZMA, "lzma", _lzmaCompress, _lzmaDecompress))
+CodecHelper.register(PayloadCodec(CODEC_HUFFMAN, "huffman", lambda payload: CodecHelper.huffman_model().encode(payload),
+                                  lambda data: CodecHelper.huffman_model().decode(data)))
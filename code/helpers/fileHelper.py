@@ -1,6 +1,24 @@
+import codecs
 import json
-import tkinter as tk
-from tkinter import filedialog
+import mmap
+import os
+import tempfile
+from typing import Iterable, Iterator, TextIO
+
+SQLITE_MAGIC = b"SQLite format 3\0"
+
+def __getattr__(name: str):
+    # tkinter is imported on first use only, so that headless callers such as the command-line
+    # interface neither need a display nor pay for the import
+    if name in ("tk", "filedialog"):
+        _importTkinter()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _importTkinter() -> None:
+    global tk, filedialog
+    import tkinter as tk
+    from tkinter import filedialog
 
 class FileHelper:
     """
@@ -17,8 +35,29 @@ class FileHelper:
         read_json_file(path: str) -> dict | list:
             Reads a JSON file from the given path and returns the parsed JSON data.
 
+        iter_json_array(path: str, chunkSize: int) -> Iterator:
+            Parses a JSON file holding an array and yields its elements one by one.
+
         write_file(path: str, content: str) -> None:
             Writes the provided content to the file at the given path, overwriting any existing content.
+
+        read_binary_file(path: str) -> bytes:
+            Reads the raw bytes of the file at the given path.
+
+        write_binary_file(path: str, content: bytes) -> None:
+            Atomically replaces the file at the given path with the provided bytes.
+
+        iter_chunks(source: TextIO | Iterable[str], chunkSize: int) -> Iterator[str]:
+            Yields the content of a text file object or an iterable of strings chunk by chunk.
+
+        iter_mapped_chunks(path: str, chunkSize: int, encoding: str) -> Iterator[str]:
+            Memory-maps a file and yields its decoded content chunk by chunk.
+
+        map_binary_file(path: str) -> mmap.mmap:
+            Memory-maps a file read-only.
+
+        is_sqlite_file(path: str) -> bool:
+            Returns whether a file starts with the header of an SQLite database.
     """
 
     @staticmethod
@@ -34,6 +73,9 @@ class FileHelper:
             >>> file_path = FileHelper.select_file()
             Selected file: 'C:/path/to/selected_file.txt'
         """
+        if "filedialog" not in globals():
+            _importTkinter()
+
         # Create a hidden Tkinter window
         root = tk.Tk()
         root.withdraw()  # Hide the root window
@@ -61,8 +103,8 @@ class FileHelper:
             >>> print(content)
             'This is the content of the file.'
         """
-        file = open(path, "r")
-        return file.read()
+        with open(path, "r") as file:
+            return file.read()
 
     @staticmethod
     def read_json_file(path: str) -> dict | list:
@@ -80,8 +122,82 @@ class FileHelper:
             >>> print(data)
             {'key': 'value', 'settings': {...}}
         """
-        file = open(path, "r")
-        return json.load(file)
+        with open(path, "r") as file:
+            return json.load(file)
+
+    @staticmethod
+    def iter_json_array(path: str, chunkSize: int = 65536) -> Iterator:
+        """
+        Parses a JSON file holding an array and yields its elements one by one. The file is read in chunks,
+        so only the element being parsed has to fit into memory, however large the array is.
+
+        Args:
+            path (str): The path to the JSON file to be read.
+            chunkSize (int): The number of characters read at once (default is 65536).
+
+        Returns:
+            Iterator: The parsed elements of the array.
+
+        Raises:
+            ValueError: If the file holds no valid JSON array.
+
+        Example:
+            >>> for item in FileHelper.iter_json_array("password.json"):
+            ...     print(item)
+            {'word': 'happy', 'synonym': 'joyful'}
+        """
+        decoder = json.JSONDecoder()
+        with open(path, "r", encoding="utf-8") as file:
+            buffer = ""
+            position = 0
+            opened = False
+            itemExpected = True
+            closingAllowed = False
+
+            while True:
+                # skip the whitespace in front of the next token, reading on where the buffer ends
+                while True:
+                    while position < len(buffer) and buffer[position] in " \t\n\r":
+                        position += 1
+                    if position < len(buffer):
+                        break
+                    buffer, position = file.read(chunkSize), 0
+                    if not buffer:
+                        raise ValueError("The configuration file has a wrong format.")
+
+                character = buffer[position]
+                if character == "]" and opened and (closingAllowed or not itemExpected):
+                    if buffer[position + 1:].strip() or file.read().strip():
+                        raise ValueError("The configuration file has a wrong format.")
+                    return
+                if not opened or not itemExpected:
+                    if character != ("," if opened else "["):
+                        raise ValueError("The configuration file has a wrong format.")
+                    # an empty array may be closed right away, but no item may be missing after a comma
+                    closingAllowed = not opened
+                    opened = itemExpected = True
+                    position += 1
+                    continue
+
+                while True:
+                    try:
+                        item, end = decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        end = -1
+                    # an element not followed by a separator, like the digits of a number, may continue in
+                    # the next chunk
+                    if 0 <= end < len(buffer) and buffer[end] in ",] \t\n\r":
+                        break
+                    chunk = file.read(chunkSize)
+                    if not chunk:
+                        if end < 0:
+                            raise ValueError("The configuration file has a wrong format.")
+                        break
+                    buffer, position = buffer[position:] + chunk, 0
+
+                yield item
+                position = end
+                itemExpected = False
 
     @staticmethod
     def write_file(path: str, content: str) -> None:
@@ -98,3 +214,156 @@ class FileHelper:
         """
         with open(path, "w") as file:  # Open file in write mode, which overwrites existing content
             file.write(content)
+
+    @staticmethod
+    def read_binary_file(path: str) -> bytes:
+        """
+        Reads the raw bytes of the file at the specified path.
+
+        Args:
+            path (str): The path to the file to be read.
+
+        Returns:
+            bytes: The contents of the file.
+
+        Example:
+            >>> FileHelper.read_binary_file("example.txt")
+            b'This is the content of the file.'
+        """
+        with open(path, "rb") as file:
+            return file.read()
+
+    @staticmethod
+    def write_binary_file(path: str, content: bytes) -> None:
+        """
+        Writes the provided bytes to a temporary file next to the specified path and renames it to the path,
+        so that readers either see the old or the complete new file.
+
+        Args:
+            path (str): The path to the file where the content will be written.
+            content (bytes): The content to write to the file.
+
+        Example:
+            >>> FileHelper.write_binary_file("output.bin", b"content")
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporaryPath = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temporaryPath, path)
+        except BaseException:
+            os.remove(temporaryPath)
+            raise
+
+    @staticmethod
+    def map_binary_file(path: str) -> mmap.mmap:
+        """
+        Memory-maps the file at the specified path read-only. Processes mapping the same file share its pages,
+        and only the pages that are accessed are read.
+
+        Args:
+            path (str): The path to the file to be mapped.
+
+        Returns:
+            mmap.mmap: The read-only mapping, which stays valid after the file is closed.
+
+        Raises:
+            ValueError: If the file is empty, as an empty file cannot be mapped.
+
+        Example:
+            >>> mapped = FileHelper.map_binary_file("example.bin")
+            >>> mapped[:4]
+            b'CCB1'
+        """
+        with open(path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def is_sqlite_file(path: str) -> bool:
+        """
+        Returns whether a file starts with the header of an SQLite database. Only the header is read,
+        so the check does not need to import sqlite3.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            bool: True if the file starts with the SQLite header, False if not or if it cannot be read.
+
+        Example:
+            >>> FileHelper.is_sqlite_file("password.json")
+            False
+        """
+        try:
+            with open(path, "rb") as file:
+                return file.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+        except OSError:
+            return False
+
+    @staticmethod
+    def iter_chunks(source: TextIO | Iterable[str], chunkSize: int) -> Iterator[str]:
+        """
+        Yields the content of a text source chunk by chunk. File objects are read with `chunkSize`
+        characters at a time, a plain string is yielded as a whole and any other iterable is passed through.
+
+        Args:
+            source (TextIO | Iterable[str]): A text file object, a string or an iterable of strings.
+            chunkSize (int): The number of characters read from a file object at once.
+
+        Returns:
+            Iterator[str]: The chunks of the source.
+
+        Example:
+            >>> with open("example.txt") as file:
+            ...     for chunk in FileHelper.iter_chunks(file, 4096):
+            ...         print(len(chunk))
+        """
+        if isinstance(source, str):
+            yield source
+            return
+
+        read = getattr(source, "read", None)
+        if read is None:
+            yield from source
+            return
+
+        while chunk := read(chunkSize):
+            yield chunk
+
+    @staticmethod
+    def iter_mapped_chunks(path: str, chunkSize: int, encoding: str = "utf-8") -> Iterator[str]:
+        """
+        Memory-maps the file at the specified path and yields its content decoded chunk by chunk.
+        Only the chunks that are actually consumed are paged in and decoded, so a consumer that stops
+        early never touches the rest of the file. The file is unmapped once the iterator is exhausted or closed.
+
+        Args:
+            path (str): The path to the file to be read.
+            chunkSize (int): The number of bytes decoded at once.
+            encoding (str): The encoding of the file (default is 'utf-8').
+
+        Returns:
+            Iterator[str]: The decoded chunks of the file.
+
+        Example:
+            >>> chunks = FileHelper.iter_mapped_chunks("example.txt", 65536)
+            >>> next(chunks)
+            'This is the content of the file.'
+        """
+        with open(path, "rb") as file:
+            # an empty file cannot be mapped
+            if file.seek(0, 2) == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                decoder = codecs.getincrementaldecoder(encoding)()
+
+                for offset in range(0, len(mapped), chunkSize):
+                    chunk = decoder.decode(mapped[offset:offset + chunkSize])
+                    if chunk:
+                        yield chunk
+
+                rest = decoder.decode(b"", final=True)
+                if rest:
+                    yield rest
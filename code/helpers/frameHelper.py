@@ -0,0 +1,186 @@
+import zlib
+
+# The first byte of a frame. 0xFF never starts valid UTF-8, so a frame cannot be mistaken for a secret
+# written in the END_OF_SECRET format.
+FRAME_MARKER = 0xFF
+FRAME_VERSION = 1
+# Frames with a compressed payload use a new version, so that older readers reject them instead of
+# returning the compressed bytes.
+COMPRESSED_FRAME_VERSION = 2
+
+FLAG_CHECKSUM = 0x01
+FLAG_TEXT = 0x02
+CODEC_SHIFT = 2
+CODEC_MASK = 0x1C
+# the codec id of an uncompressed payload, CODEC_NONE of `CodecHelper`, which is only imported for
+# compressed frames
+UNCOMPRESSED = 0
+
+class FrameHelper:
+    """
+    A utility class that wraps a payload into a length-prefixed frame, which `FrameDecoder` unwraps again.
+
+    A frame consists of the FRAME_MARKER, the FRAME_VERSION, a flags byte, the payload length as
+    varint (7 bits per byte, least significant group first), the payload and, if the checksum flag
+    is set, the CRC32 of the payload in big-endian byte order. Because the length is known in advance,
+    a decoder knows exactly how many bytes to read and does not have to search for an end marker.
+
+    A compressed payload is stored in a frame of the COMPRESSED_FRAME_VERSION whose flags hold the id of
+    the codec in the bits of CODEC_MASK. Length and checksum then refer to the compressed payload.
+    """
+
+    @staticmethod
+    def encode(payload: bytes, isText: bool = False, checksum: bool = False, compression: str | None = None) -> bytes:
+        """
+        Wraps a payload into a frame.
+
+        Args:
+            payload (bytes): The payload to wrap.
+            isText (bool): Whether the payload is UTF-8 encoded text (default is False).
+            checksum (bool): Whether to append the CRC32 of the payload (default is False).
+            compression (str | None): The name of the codec compressing the payload, or "auto" for the one
+                producing the smallest frame (default is None, which does not compress).
+
+        Returns:
+            bytes: The framed payload.
+
+        Raises:
+            ValueError: If the compression is unknown.
+
+        Example:
+            >>> FrameHelper.encode(b"hi", isText=True).hex()
+            'ff0102026869'
+        """
+        codecId = UNCOMPRESSED
+        if compression is not None:
+            from helpers.codecHelper import CodecHelper
+            codecId, payload = CodecHelper.compress(payload, compression)
+
+        flags = (FLAG_TEXT if isText else 0) | (FLAG_CHECKSUM if checksum else 0) | codecId << CODEC_SHIFT
+        version = FRAME_VERSION if codecId == UNCOMPRESSED else COMPRESSED_FRAME_VERSION
+        frame = bytearray((FRAME_MARKER, version, flags))
+        frame += FrameHelper.encode_varint(len(payload))
+        frame += payload
+        if checksum:
+            frame += zlib.crc32(payload).to_bytes(4, 'big')
+        return bytes(frame)
+
+    @staticmethod
+    def encode_varint(value: int) -> bytes:
+        """
+        Encodes a non-negative integer as varint, 7 bits per byte with the highest bit marking
+        that another byte follows.
+
+        Args:
+            value (int): The integer to encode.
+
+        Returns:
+            bytes: The encoded integer.
+
+        Example:
+            >>> FrameHelper.encode_varint(300).hex()
+            'ac02'
+        """
+        encoded = bytearray()
+        while value > 0x7F:
+            encoded.append(value & 0x7F | 0x80)
+            value >>= 7
+        encoded.append(value)
+        return bytes(encoded)
+
+class FrameDecoder:
+    """
+    Parses a frame byte by byte. The marker byte is expected to be consumed already.
+
+    Attributes:
+        payload (bytearray): The payload read so far.
+        isText (bool): Whether the payload is UTF-8 encoded text.
+        codecId (int): The id of the codec the payload is compressed with.
+        isComplete (bool): Whether the whole frame was read.
+
+    Methods:
+        push(byte: int) -> bool:
+            Consumes the next byte of the frame and returns whether the frame is complete.
+
+        result() -> str | bytes:
+            Returns the payload of the complete frame.
+    """
+
+    def __init__(self):
+        """
+        Initializes a decoder expecting the version byte of a frame.
+        """
+        self.payload = bytearray()
+        self.isText = False
+        self.codecId = UNCOMPRESSED
+        self.isComplete = False
+        self.__checksumLength = 0
+        self.__checksum = bytearray()
+        self.__length = 0
+        self.__lengthShift = 0
+        self.__state = self.__readVersion
+
+    def push(self, byte: int) -> bool:
+        """
+        Consumes the next byte of the frame.
+
+        Args:
+            byte (int): The byte to consume.
+
+        Returns:
+            bool: True once the frame is complete.
+
+        Raises:
+            ValueError: If the frame has an unsupported version.
+        """
+        self.__state(byte)
+        return self.isComplete
+
+    def result(self) -> str | bytes:
+        """
+        Returns the payload of the complete frame, decompressed with the codec named in its flags.
+
+        Returns:
+            str | bytes: The decoded text for a text payload, otherwise the raw bytes.
+
+        Raises:
+            ValueError: If the checksum of the frame does not match its payload, or if the payload
+                cannot be decompressed.
+        """
+        if self.__checksumLength and zlib.crc32(self.payload) != int.from_bytes(self.__checksum, 'big'):
+            raise ValueError("The hidden text is corrupted.")
+        payload = bytes(self.payload)
+        if self.codecId != UNCOMPRESSED:
+            from helpers.codecHelper import CodecHelper
+            payload = CodecHelper.decompress(self.codecId, payload)
+        if self.isText:
+            return payload.decode('utf-8')
+        return payload
+
+    def __readVersion(self, byte: int) -> None:
+        if byte not in (FRAME_VERSION, COMPRESSED_FRAME_VERSION):
+            raise ValueError(f"The hidden text has an unsupported format version {byte}.")
+        self.__state = self.__readFlags
+
+    def __readFlags(self, byte: int) -> None:
+        self.isText = bool(byte & FLAG_TEXT)
+        self.codecId = (byte & CODEC_MASK) >> CODEC_SHIFT
+        self.__checksumLength = 4 if byte & FLAG_CHECKSUM else 0
+        self.__state = self.__readLength
+
+    def __readLength(self, byte: int) -> None:
+        self.__length |= (byte & 0x7F) << self.__lengthShift
+        self.__lengthShift += 7
+        if byte & 0x80 == 0:
+            self.__state = self.__readPayload
+            self.__complete()
+
+    def __readPayload(self, byte: int) -> None:
+        if len(self.payload) < self.__length:
+            self.payload.append(byte)
+        else:
+            self.__checksum.append(byte)
+        self.__complete()
+
+    def __complete(self) -> None:
+        self.isComplete = len(self.payload) == self.__length and len(self.__checksum) == self.__checksumLength
@@ -0,0 +1,71 @@
+import re
+from itertools import groupby
+from typing import Iterator
+
+# Candidate runs of letters. `[^\W\d_]` also matches a few numeric characters that are not alphabetic
+# (e.g. '²' or 'Ⅻ'), so every candidate is verified with `str.isalpha` before it is used as a word.
+WORD_CANDIDATE_PATTERN = re.compile(r'[^\W\d_]+')
+
+class TokenHelper:
+    """
+    A utility class that splits a text into words in a single pass. A word is a maximal run of
+    characters for which `str.isalpha` is true, everything in between is treated as separator.
+    """
+
+    @staticmethod
+    def iter_words(text: str, start: int = 0, end: int | None = None) -> Iterator[tuple[int, int, str]]:
+        """
+        Yields every word of the text together with its position.
+
+        Args:
+            text (str): The text to split into words.
+            start (int): The index at which the search starts (default is 0).
+            end (int | None): The index at which the search stops (default is the end of the text).
+                A word reaching this index is cut off at it.
+
+        Returns:
+            Iterator[tuple[int, int, str]]: The start index, end index and content of every word.
+
+        Example:
+            >>> list(TokenHelper.iter_words("Hi, you²!"))
+            [(0, 2, 'Hi'), (4, 7, 'you')]
+        """
+        if end is None:
+            end = len(text)
+
+        for match in WORD_CANDIDATE_PATTERN.finditer(text, start, end):
+            word = match.group()
+
+            if word.isalpha():
+                yield match.start(), match.end(), word
+                continue
+
+            # split the rare candidates containing non-alphabetic characters into their alphabetic runs
+            position = match.start()
+            for isAlpha, group in groupby(word, str.isalpha):
+                part = ''.join(group)
+                if isAlpha:
+                    yield position, position + len(part), part
+                position += len(part)
+
+    @staticmethod
+    def complete_prefix_length(text: str) -> int:
+        """
+        Returns the length of the longest prefix of the text that ends with a non-alphabetic character.
+        Every word inside this prefix is complete, while the rest of the text may be a word that continues
+        in a following chunk.
+
+        Args:
+            text (str): The text to inspect.
+
+        Returns:
+            int: The index after the last non-alphabetic character, or 0 if there is none.
+
+        Example:
+            >>> TokenHelper.complete_prefix_length("I am hap")
+            5
+        """
+        index = len(text)
+        while index > 0 and text[index - 1].isalpha():
+            index -= 1
+        return index
@@ -24,16 +24,21 @@ while True:
     if actionInput == "2":
         print("Select the text file you want to hide a text in:")
         textToWriteToPath = FileHelper.select_file()
-        textToWriteTo = FileHelper.read_file(textToWriteToPath)
         print("Type in the text you would like to hide inside the file:")
         hiddenText = input()
-        updatedtext = steganograph.write(textToWriteTo, hiddenText)
-        FileHelper.write_file(textToWriteToPath, updatedtext)
-        print("Successfully hidden your text inside the text file.")
+        # only the words carrying the secret are written to the file, which is read and written as UTF-8
+        try:
+            steganograph.write_in_place(textToWriteToPath, hiddenText)
+            print("Successfully hidden your text inside the text file.")
+        except (OSError, ValueError) as error:  # includes the UnicodeDecodeError of a file that is no UTF-8
+            print(error)
     elif actionInput == "3":
         exit()
     else:
         print("Select the txt file you want to read a hidden text from:")
-        textToReadFrom = FileHelper.read_file(FileHelper.select_file())
-        hiddenText = steganograph.read(textToReadFrom)
-        print(f'The hidden text is: "{hiddenText}"')
\ No newline at end of file
+        # read as UTF-8 like the files written by option 2, whatever the locale encoding is
+        try:
+            hiddenText = steganograph.read_mapped_file(FileHelper.select_file())
+            print(f'The hidden text is: "{hiddenText}"')
+        except (OSError, ValueError) as error:  # includes the UnicodeDecodeError of a file that is no UTF-8
+            print(error)
\ No newline at end of file
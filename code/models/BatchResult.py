@@ -0,0 +1,53 @@
+class BatchResult:
+    """
+    A class representing the outcome of a single item of a batch operation. Every item of a batch
+    produces a result, so a failing item does not abort the rest of the batch.
+
+    Attributes:
+        item (object): The path or job the result belongs to.
+        value (str | None): The hidden text of a read, or the path of the written file of a write.
+        error (Exception | None): The error raised while processing the item, if any.
+
+    Methods:
+        __init__(item: object, value: str | None, error: Exception | None):
+            Initializes the BatchResult object.
+
+        succeeded() -> bool:
+            Returns whether the item was processed without an error.
+    """
+
+    item: object
+    value: str | None
+    error: Exception | None
+
+    def __init__(self, item: object, value: str | None = None, error: Exception | None = None):
+        """
+        Initializes the BatchResult object with its item and either a value or an error.
+
+        Args:
+            item (object): The path or job the result belongs to.
+            value (str | None): The result value of a successfully processed item.
+            error (Exception | None): The error raised while processing the item.
+
+        Example:
+            >>> result = BatchResult("encoded.txt", value="secret")
+            >>> result.succeeded()
+            True
+        """
+        self.item = item
+        self.value = value
+        self.error = error
+
+    def succeeded(self) -> bool:
+        """
+        Returns whether the item was processed without an error.
+
+        Returns:
+            bool: True if no error was raised for the item.
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BatchResult({self.item!r}, error={self.error!r})"
+        return f"BatchResult({self.item!r}, value={self.value!r})"
@@ -0,0 +1,199 @@
+import hashlib
+from typing import Iterable
+
+from models.PhraseMatcher import PhraseMatcher
+from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
+
+class Codebook:
+    """
+    A compiled lookup table that maps every word of the configured synonym pairs and groups to its pair
+    and value, so that a word of the cover text can be resolved in constant time. A pair is treated as
+    a group of two words carrying one bit. If a synonym is a phrase of several words separated by single
+    spaces, a `PhraseMatcher` is compiled in addition.
+
+    A codebook ignoring the case is keyed by the casefolded words, so that words are looked up with a single
+    `casefold` call. For every word it precomputes the variants written for a carrier in lower case, in
+    title case and in upper case.
+
+    Attributes:
+        synonyms (list[Synonym | SynonymGroup]): The pairs and groups the codebook was compiled from.
+            The index of a pair in this list is its pair id.
+        forms (list[list[str]]): The words of every pair, ordered by the value they encode.
+        bitCounts (list[int]): The number of bits every pair carries.
+        entries (dict[str, tuple[int, int]]): Maps each word to its pair id and the value it encodes.
+        matcher (PhraseMatcher | None): The matcher for texts, if any synonym is a phrase.
+        ignoreCase (bool): Whether words are looked up by their casefolded form.
+        casedForms (list[list[tuple[str, str, str]]] | None): The lower, title and upper case variant of every
+            word if the case is ignored.
+
+    Methods:
+        __init__(synonyms: list[Synonym | SynonymGroup]):
+            Compiles the lookup table from the given pairs and groups.
+
+        lookup(word: str) -> tuple[int, int] | None:
+            Returns the pair id and value of the given word, or None if the word is no carrier.
+
+        form(pairId: int, value: int) -> str:
+            Returns the word of a pair that encodes the given value.
+
+        casedForm(pairId: int, value: int, original: str) -> str:
+            Returns the word encoding the given value with the capitalization of the word it replaces.
+
+        fingerprint() -> str:
+            Returns a hash identifying the content of the codebook.
+
+        hashForms(forms: Iterable[list[str]], ignoreCase: bool) -> str:
+            Returns the fingerprint of a codebook with the given words.
+
+        caseVariants(word: str) -> tuple[str, str, str]:
+            Returns the lower, title and upper case variant written for a word.
+    """
+
+    synonyms: list[Synonym | SynonymGroup]
+    forms: list[list[str]]
+    bitCounts: list[int]
+    entries: dict[str, tuple[int, int]]
+    matcher: PhraseMatcher | None
+    ignoreCase: bool = False
+    casedForms: list[list[tuple[str, str, str]]] | None = None
+
+    def __init__(self, synonyms: list[Synonym | SynonymGroup], ignoreCase: bool = False):
+        """
+        Compiles the lookup table from the given pairs and groups. If a word occurs more than once,
+        the first occurrence wins, which matches the order of a linear scan over the pairs.
+
+        Args:
+            synonyms (list[Synonym | SynonymGroup]): The pairs and groups to compile.
+            ignoreCase (bool): Whether words are looked up regardless of their case (default is False).
+
+        Raises:
+            ValueError: If a phrase could not be decoded unambiguously, see `PhraseMatcher`.
+
+        Example:
+            >>> codebook = Codebook([Synonym("quick", "fast"), SynonymGroup(["big", "large", "huge", "vast"])])
+            >>> codebook.lookup("fast")
+            (0, 1)
+            >>> codebook.lookup("huge")
+            (1, 2)
+        """
+        self.synonyms = synonyms
+        self.forms = [synonym.words for synonym in synonyms]
+        self.bitCounts = [synonym.bitCount() for synonym in synonyms]
+        self.ignoreCase = ignoreCase
+        self.__fingerprint: str | None = None
+
+        keys = [[word.casefold() for word in words] for words in self.forms] if ignoreCase else self.forms
+
+        # insert in reverse order, so that the first occurrence of a duplicated word overwrites the others
+        self.entries = {
+            word: (pairId, value)
+            for pairId in range(len(keys) - 1, -1, -1)
+            for value, word in reversed(list(enumerate(keys[pairId])))
+        }
+
+        hasPhrases = any(" " in word for word in self.entries)
+        self.matcher = PhraseMatcher(keys, ignoreCase) if hasPhrases else None
+
+        if ignoreCase:
+            self.casedForms = [[Codebook.caseVariants(word) for word in words] for words in self.forms]
+
+    def lookup(self, word: str) -> tuple[int, int] | None:
+        """
+        Returns the pair id and value of the given word.
+
+        Args:
+            word (str): The word to look up, in any case if the case is ignored.
+
+        Returns:
+            tuple[int, int] | None: The pair id and the value (for a pair 0 for `word` and 1 for `synonym`),
+            or None if the word is not part of any pair.
+        """
+        return self.entries.get(word.casefold() if self.ignoreCase else word)
+
+    def form(self, pairId: int, value: int) -> str:
+        """
+        Returns the word of a pair that encodes the given value.
+
+        Args:
+            pairId (int): The id of the pair.
+            value (int): The value to encode, smaller than 2 to the power of the bit count of the pair.
+
+        Returns:
+            str: The word encoding the value, for a pair the main word for 0 and its synonym for 1.
+        """
+        return self.forms[pairId][value]
+
+    def casedForm(self, pairId: int, value: int, original: str) -> str:
+        """
+        Returns the word of a pair that encodes the given value, written like the word it replaces: in upper
+        case if that is in upper case, in title case if only its first letter is upper case, and as configured
+        otherwise. Only available if the case is ignored.
+
+        Args:
+            pairId (int): The id of the pair.
+            value (int): The value to encode.
+            original (str): The word of the text that is replaced.
+
+        Returns:
+            str: The word encoding the value.
+
+        Example:
+            >>> Codebook([Synonym("happy", "joyful")], ignoreCase=True).casedForm(0, 1, "Happy")
+            'Joyful'
+        """
+        lowerForm, titleForm, upperForm = self.casedForms[pairId][value]
+        if original[:1].isupper():
+            return upperForm if original[1:].isupper() else titleForm
+        return lowerForm
+
+    def fingerprint(self) -> str:
+        """
+        Returns a hash over all pairs in their order. Two codebooks with the same fingerprint encode
+        and decode every text identically.
+
+        Returns:
+            str: The hexadecimal SHA-256 hash of the pairs.
+        """
+        if self.__fingerprint is None:
+            self.__fingerprint = Codebook.hashForms(self.forms, self.ignoreCase)
+        return self.__fingerprint
+
+    @staticmethod
+    def hashForms(forms: Iterable[list[str]], ignoreCase: bool) -> str:
+        """
+        Returns the fingerprint of a codebook with the given words.
+
+        Args:
+            forms (Iterable[list[str]]): The words of every pair, ordered by the value they encode.
+            ignoreCase (bool): Whether the codebook ignores the case.
+
+        Returns:
+            str: The hexadecimal SHA-256 hash of the pairs.
+        """
+        digest = hashlib.sha256(b"ignoreCase\1" if ignoreCase else b"")
+        for words in forms:
+            digest.update(("\0".join(words) + "\1").encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def caseVariants(word: str) -> tuple[str, str, str]:
+        """
+        Returns the variants of a word written for a replaced word in lower, title and upper case. A variant
+        that would not be read as the same word again, like the upper case of the dotless "ı", falls back to
+        the word as configured.
+
+        Args:
+            word (str): The word as configured.
+
+        Returns:
+            tuple[str, str, str]: The word itself, its first letter in title case and the word in upper case.
+        """
+        parts = word.split(" ")
+        variants = [word]
+        for variant in (word[:1].title() + word[1:], word.upper()):
+            variantParts = variant.split(" ")
+            readsBack = variant.casefold() == word.casefold() and len(variantParts) == len(parts) \
+                and all(part.isalpha() == original.isalpha() for part, original in zip(variantParts, parts))
+            variants.append(variant if readsBack else word)
+        return variants[0], variants[1], variants[2]
@@ -0,0 +1,391 @@
+import struct
+import sys
+import zlib
+from array import array
+from typing import Iterator, Sequence
+
+from helpers.fileHelper import FileHelper
+from models.Codebook import Codebook
+from models.PhraseMatcher import PhraseMatcher
+from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
+
+# magic, format version, flags, number of pairs, words, distinct strings, table slots and bytes of all strings
+HEADER = struct.Struct("<4sBB2xIIIIQ64s")
+MAGIC = b"CCB1"
+FORMAT_VERSION = 1
+FLAG_IGNORE_CASE = 0x01
+FLAG_PHRASES = 0x02
+
+class CompactCodebook:
+    """
+    A codebook stored in a single flat buffer instead of millions of Python objects, for very large
+    configurations. It can be used wherever a `Codebook` is used and encodes and decodes identically.
+
+    The buffer holds the UTF-8 bytes of every distinct string once, arrays mapping every word to its pair
+    and its string, the index of the first word of every pair, the bit counts and an open-addressing hash
+    table over the words. Its size is a few bytes per word plus the strings. A buffer written with `save`
+    is memory-mapped by `load`, so all processes loading the same file share one copy in the page cache,
+    and a mapped codebook is sent to worker processes as its path only.
+
+    Strings are decoded on first use. If any synonym is a phrase, the `PhraseMatcher` is still built
+    from Python objects in every process.
+
+    Attributes:
+        synonyms (CompactSynonyms): A read-only sequence creating the pairs and groups on access.
+        bitCounts (memoryview): The number of bits every pair carries.
+        entries (CompactEntries): The hash table, mapping each word to its pair id and value like a dictionary.
+        matcher (PhraseMatcher | None): The matcher for texts, if any synonym is a phrase.
+        ignoreCase (bool): Whether words are looked up by their casefolded form.
+        path (str | None): The file the buffer is mapped from, if any.
+
+    Methods:
+        __init__(buffer: bytes | mmap.mmap, path: str | None):
+            Opens a codebook stored in a buffer.
+
+        build(synonyms: Sequence[Synonym | SynonymGroup], ignoreCase: bool) -> CompactCodebook:
+            Compiles the buffer from the given pairs and groups.
+
+        load(path: str) -> CompactCodebook / save(path: str) -> None:
+            Memory-maps a codebook file or writes the buffer to one.
+
+        lookup(word: str) -> tuple[int, int] | None:
+            Returns the pair id and value of the given word, or None if the word is no carrier.
+
+        form(pairId: int, value: int) -> str:
+            Returns the word of a pair that encodes the given value.
+
+        casedForm(pairId: int, value: int, original: str) -> str:
+            Returns the word encoding the given value with the capitalization of the word it replaces.
+
+        fingerprint() -> str:
+            Returns the hash identifying the content, equal to the one of a `Codebook` of the same pairs.
+    """
+
+    synonyms: "CompactSynonyms"
+    bitCounts: memoryview
+    entries: "CompactEntries"
+    matcher: PhraseMatcher | None
+    ignoreCase: bool
+    path: str | None
+
+    def __init__(self, buffer, path: str | None = None):
+        """
+        Opens a codebook stored in a buffer without copying it.
+
+        Args:
+            buffer (bytes | mmap.mmap): The buffer created by `build`.
+            path (str | None): The file the buffer is mapped from (default is None).
+
+        Raises:
+            ValueError: If the buffer holds no compact codebook of a supported version.
+        """
+        if len(buffer) < HEADER.size:
+            raise ValueError("The compact codebook has a wrong format.")
+        magic, version, flags, pairCount, wordCount, stringCount, tableSize, stringBytes, fingerprint = \
+            HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("The compact codebook has a wrong format.")
+
+        self.__buffer = buffer
+        self.path = path
+        self.ignoreCase = bool(flags & FLAG_IGNORE_CASE)
+        self.__fingerprint = fingerprint.decode("ascii")
+
+        view = memoryview(buffer)
+        offset = HEADER.size
+        sections = []
+        for count in (pairCount + 1, wordCount, wordCount, wordCount, tableSize, stringCount + 1):
+            sections.append(view[offset:offset + 4 * count].cast("I"))
+            offset += 4 * count
+        self.__pairStarts, self.__wordPairIds, self.__wordStrings, self.__keyStrings, table, stringOffsets = sections
+        self.bitCounts = view[offset:offset + pairCount]
+        offset += pairCount
+        if len(buffer) != offset + stringBytes:
+            raise ValueError("The compact codebook has a wrong format.")
+
+        self.__stringOffsets = stringOffsets
+        self.__strings = view[offset:]
+        self.__decoded: dict[int, str] = {}
+        self.__casedForms: dict[int, tuple[str, str, str]] = {}
+        self.entries = CompactEntries(table, self.__keyStrings, self.__wordPairIds, self.__pairStarts, stringOffsets,
+                                      self.__strings)
+        self.synonyms = CompactSynonyms(self)
+        self.matcher = None
+        if flags & FLAG_PHRASES:
+            keys = [[self.__string(self.__keyStrings[index]) for index in self.__wordRange(pairId)]
+                    for pairId in range(pairCount)]
+            self.matcher = PhraseMatcher(keys, self.ignoreCase)
+
+    @staticmethod
+    def build(synonyms: Sequence[Synonym | SynonymGroup], ignoreCase: bool = False) -> "CompactCodebook":
+        """
+        Compiles the buffer from the given pairs and groups. If a word occurs more than once, the first
+        occurrence wins, like in a `Codebook`.
+
+        Args:
+            synonyms (Sequence[Synonym | SynonymGroup]): The pairs and groups to compile.
+            ignoreCase (bool): Whether words are looked up regardless of their case (default is False).
+
+        Returns:
+            CompactCodebook: The codebook over the new buffer.
+
+        Raises:
+            ValueError: If a phrase could not be decoded unambiguously, see `PhraseMatcher`.
+
+        Example:
+            >>> codebook = CompactCodebook.build([Synonym("quick", "fast")])
+            >>> codebook.lookup("fast")
+            (0, 1)
+        """
+        stringIds: dict[str, int] = {}
+        strings = bytearray()
+        stringOffsets = array("I", [0])
+        pairStarts = array("I", [0])
+        wordPairIds, wordStrings, keyStrings = array("I"), array("I"), array("I")
+        bitCounts = bytearray()
+        hasPhrases = False
+
+        def intern(string: str) -> int:
+            # every distinct string is stored once
+            stringId = stringIds.get(string)
+            if stringId is None:
+                stringId = stringIds[string] = len(stringOffsets) - 1
+                strings.extend(string.encode("utf-8"))
+                stringOffsets.append(len(strings))
+            return stringId
+
+        for pairId, synonym in enumerate(synonyms):
+            words = synonym.words
+            for word in words:
+                wordPairIds.append(pairId)
+                wordStrings.append(intern(word))
+                keyStrings.append(intern(word.casefold()) if ignoreCase else wordStrings[-1])
+                hasPhrases = hasPhrases or " " in word
+            pairStarts.append(len(wordPairIds))
+            bitCounts.append(synonym.bitCount())
+
+        # a power of two with at most half of the slots used keeps the probe sequences short
+        tableSize = 1 << max(1, (2 * len(wordPairIds)).bit_length())
+        table = array("I", bytes(4 * tableSize))
+        mask = tableSize - 1
+        for wordIndex in range(len(wordPairIds)):
+            stringId = keyStrings[wordIndex]
+            key = bytes(strings[stringOffsets[stringId]:stringOffsets[stringId + 1]])
+            slot = zlib.crc32(key) & mask
+            while table[slot]:
+                otherId = keyStrings[table[slot] - 1]
+                if otherId == stringId:
+                    break
+                slot = (slot + 1) & mask
+            else:
+                table[slot] = wordIndex + 1
+
+        fingerprint = Codebook.hashForms((synonym.words for synonym in synonyms), ignoreCase)
+        flags = (FLAG_IGNORE_CASE if ignoreCase else 0) | (FLAG_PHRASES if hasPhrases else 0)
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(bitCounts), len(wordPairIds), len(stringOffsets) - 1,
+                             tableSize, len(strings), fingerprint.encode("ascii"))
+        parts = [header]
+        for section in (pairStarts, wordPairIds, wordStrings, keyStrings, table, stringOffsets):
+            parts.append(section.tobytes())
+        parts += [bytes(bitCounts), bytes(strings)]
+        return CompactCodebook(b"".join(parts))
+
+    @staticmethod
+    def load(path: str) -> "CompactCodebook":
+        """
+        Memory-maps a codebook file written by `save`. The file must not be changed while it is mapped.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            CompactCodebook: The codebook over the mapped file.
+
+        Raises:
+            ValueError: If the file holds no compact codebook of a supported version.
+        """
+        return CompactCodebook(FileHelper.map_binary_file(path), path)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the buffer to a file, replacing it atomically.
+
+        Args:
+            path (str): The path of the file to write.
+
+        Example:
+            >>> CompactCodebook.build(synonyms).save("synonyms.codebook")
+            >>> codebook = CompactCodebook.load("synonyms.codebook")
+        """
+        FileHelper.write_binary_file(path, bytes(self.__buffer))
+
+    def lookup(self, word: str) -> tuple[int, int] | None:
+        """
+        Returns the pair id and value of the given word.
+
+        Args:
+            word (str): The word to look up, in any case if the case is ignored.
+
+        Returns:
+            tuple[int, int] | None: The pair id and the value, or None if the word is not part of any pair.
+        """
+        return self.entries.get(word.casefold() if self.ignoreCase else word)
+
+    def form(self, pairId: int, value: int) -> str:
+        """
+        Returns the word of a pair that encodes the given value.
+
+        Args:
+            pairId (int): The id of the pair.
+            value (int): The value to encode, smaller than 2 to the power of the bit count of the pair.
+
+        Returns:
+            str: The word encoding the value.
+        """
+        return self.__string(self.__wordStrings[self.__pairStarts[pairId] + value])
+
+    def casedForm(self, pairId: int, value: int, original: str) -> str:
+        """
+        Returns the word of a pair that encodes the given value, written like the word it replaces.
+        See `Codebook.casedForm`.
+
+        Args:
+            pairId (int): The id of the pair.
+            value (int): The value to encode.
+            original (str): The word of the text that is replaced.
+
+        Returns:
+            str: The word encoding the value.
+        """
+        wordIndex = self.__pairStarts[pairId] + value
+        variants = self.__casedForms.get(wordIndex)
+        if variants is None:
+            variants = self.__casedForms[wordIndex] = Codebook.caseVariants(self.form(pairId, value))
+
+        lowerForm, titleForm, upperForm = variants
+        if original[:1].isupper():
+            return upperForm if original[1:].isupper() else titleForm
+        return lowerForm
+
+    def fingerprint(self) -> str:
+        """
+        Returns a hash over all pairs in their order, computed when the buffer was built.
+
+        Returns:
+            str: The hexadecimal SHA-256 hash of the pairs.
+        """
+        return self.__fingerprint
+
+    def words(self, pairId: int) -> list[str]:
+        """
+        Returns the words of a pair, ordered by the value they encode.
+
+        Args:
+            pairId (int): The id of the pair.
+
+        Returns:
+            list[str]: The words of the pair.
+        """
+        return [self.__string(self.__wordStrings[index]) for index in self.__wordRange(pairId)]
+
+    def __wordRange(self, pairId: int) -> range:
+        return range(self.__pairStarts[pairId], self.__pairStarts[pairId + 1])
+
+    def __string(self, stringId: int) -> str:
+        # decoded strings are kept, so every string used exists once
+        string = self.__decoded.get(stringId)
+        if string is None:
+            encoded = self.__strings[self.__stringOffsets[stringId]:self.__stringOffsets[stringId + 1]]
+            string = self.__decoded[stringId] = sys.intern(str(encoded, "utf-8"))
+        return string
+
+    def __reduce__(self):
+        # a mapped codebook is opened again by the receiving process instead of copying its buffer
+        if self.path is not None:
+            return CompactCodebook.load, (self.path,)
+        return CompactCodebook, (bytes(self.__buffer),)
+
+    def __len__(self) -> int:
+        return len(self.bitCounts)
+
+class CompactEntries:
+    """
+    The open-addressing hash table of a `CompactCodebook`, used like the `entries` dictionary of a `Codebook`.
+    Words are hashed with CRC32 of their UTF-8 bytes, which is the same in every process.
+
+    Methods:
+        get(word: str) -> tuple[int, int] | None:
+            Returns the pair id and value of the given word.
+    """
+
+    def __init__(self, table: memoryview, keyStrings: memoryview, wordPairIds: memoryview, pairStarts: memoryview,
+                 stringOffsets: memoryview, strings: memoryview):
+        """
+        Initializes the table over the sections of a codebook buffer.
+        """
+        self.__table = table
+        self.__mask = len(table) - 1
+        self.__keyStrings = keyStrings
+        self.__wordPairIds = wordPairIds
+        self.__pairStarts = pairStarts
+        self.__stringOffsets = stringOffsets
+        self.__strings = strings
+
+    def get(self, word: str) -> tuple[int, int] | None:
+        """
+        Returns the pair id and value of the given word.
+
+        Args:
+            word (str): The word, already casefolded if the case is ignored.
+
+        Returns:
+            tuple[int, int] | None: The pair id and the value, or None if the word is not part of any pair.
+        """
+        key = word.encode("utf-8", "surrogatepass")
+        table, mask = self.__table, self.__mask
+        slot = zlib.crc32(key) & mask
+        while entry := table[slot]:
+            stringId = self.__keyStrings[entry - 1]
+            start = self.__stringOffsets[stringId]
+            end = self.__stringOffsets[stringId + 1]
+            if end - start == len(key) and self.__strings[start:end] == key:
+                pairId = self.__wordPairIds[entry - 1]
+                return pairId, entry - 1 - self.__pairStarts[pairId]
+            slot = (slot + 1) & mask
+        return None
+
+class CompactSynonyms(Sequence):
+    """
+    A read-only sequence of the pairs and groups of a `CompactCodebook`, creating them on access only.
+    """
+
+    def __init__(self, codebook: CompactCodebook):
+        """
+        Initializes the sequence of a codebook.
+
+        Args:
+            codebook (CompactCodebook): The codebook holding the pairs.
+        """
+        self.__codebook = codebook
+
+    def __getitem__(self, pairId):
+        if isinstance(pairId, slice):
+            return [self[index] for index in range(*pairId.indices(len(self)))]
+        if pairId < 0:
+            pairId += len(self)
+        if not 0 <= pairId < len(self):
+            raise IndexError("pair id out of range")
+
+        words = self.__codebook.words(pairId)
+        return Synonym(words[0], words[1]) if len(words) == 2 else SynonymGroup(words)
+
+    def __len__(self) -> int:
+        return len(self.__codebook)
+
+    def __iter__(self) -> Iterator[Synonym | SynonymGroup]:
+        return (self[pairId] for pairId in range(len(self)))
+
+    def __reduce__(self):
+        # restored as the sequence of the restored codebook, so that both stay the same object
+        return getattr, (self.__codebook, "synonyms")
@@ -0,0 +1,211 @@
+import hashlib
+import json
+from array import array
+
+from helpers.fileHelper import FileHelper
+from helpers.frameHelper import FrameHelper
+
+class CoverIndex:
+    """
+    A class holding the positions of all carrier words of a cover text, built from a single scan of it.
+    An index can be reused for any number of secrets and lets `Steganograph.write` check the capacity
+    in constant time and replace the carriers without tokenizing the cover again.
+
+    Attributes:
+        FORMAT_VERSION (int): The version of the serialized format.
+        starts (array): The start index of every carrier word.
+        ends (array): The end index of every carrier word.
+        pairIds (array): The pair id of every carrier word.
+        capacityBits (int): The number of bits all carrier words hold together.
+        textLength (int): The length of the indexed text.
+        textHash (str): The SHA-256 hash of the indexed text.
+        codebookFingerprint (str): The fingerprint of the codebook the index was built with.
+
+    Methods:
+        __init__(starts, ends, pairIds, capacityBits: int, textLength: int, textHash: str, codebookFingerprint: str):
+            Initializes the CoverIndex object.
+
+        capacity_bits -> int:
+            The number of bits the cover can hold.
+
+        capacity_bytes -> int:
+            The number of text bytes that fit into the cover in the END_OF_SECRET format.
+
+        secret_bytes(framed: bool, checksum: bool) -> int:
+            Returns the number of secret bytes that fit into the cover in the given format.
+
+        matches(text: str) -> bool:
+            Returns whether the index was built from the given text.
+
+        save(path: str) -> None / load(path: str) -> CoverIndex:
+            Writes the index to or reads it from a JSON file.
+    """
+    FORMAT_VERSION: int = 2
+
+    starts: array
+    ends: array
+    pairIds: array
+    capacityBits: int
+    textLength: int
+    textHash: str
+    codebookFingerprint: str
+
+    def __init__(self, starts: array, ends: array, pairIds: array, capacityBits: int, textLength: int,
+                 textHash: str, codebookFingerprint: str):
+        """
+        Initializes the CoverIndex object. Use `Steganograph.index_cover` to build the index of a text.
+
+        Args:
+            starts (array): The start index of every carrier word.
+            ends (array): The end index of every carrier word.
+            pairIds (array): The pair id of every carrier word.
+            capacityBits (int): The number of bits all carrier words hold together.
+            textLength (int): The length of the indexed text.
+            textHash (str): The SHA-256 hash of the indexed text.
+            codebookFingerprint (str): The fingerprint of the codebook the index was built with.
+        """
+        self.starts = starts
+        self.ends = ends
+        self.pairIds = pairIds
+        self.capacityBits = capacityBits
+        self.textLength = textLength
+        self.textHash = textHash
+        self.codebookFingerprint = codebookFingerprint
+
+    @property
+    def capacity_bits(self) -> int:
+        """
+        The number of bits the cover can hold, one per pair and k per group of 2^k words.
+        """
+        return self.capacityBits
+
+    @property
+    def capacity_bytes(self) -> int:
+        """
+        The number of text bytes that fit into the cover in the END_OF_SECRET format, which takes one byte.
+        Use `secret_bytes` for framed secrets.
+        """
+        return self.secret_bytes()
+
+    def secret_bytes(self, framed: bool = False, checksum: bool = False) -> int:
+        """
+        Returns the number of secret bytes that fit into the cover. The END_OF_SECRET takes one byte, a frame
+        takes its marker, version, flags and length and, with a checksum, four bytes more. Compression is not
+        taken into account, as its result depends on the secret. An empty secret is always written as a frame.
+
+        Args:
+            framed (bool): Whether the secret is written as a frame, which binary secrets and compressed
+                secrets always are (default is False).
+            checksum (bool): Whether the frame carries a CRC32 checksum (default is False).
+
+        Returns:
+            int: The length of the longest secret in bytes that `write` accepts.
+
+        Example:
+            >>> coverIndex.capacity_bits
+            80
+            >>> coverIndex.secret_bytes(), coverIndex.secret_bytes(framed=True, checksum=True)
+            (9, 2)
+        """
+        available = self.capacityBits // 8
+        if not framed:
+            return max(0, available - 1)
+
+        # the marker, version and flags and the checksum, the length needs one byte per 7 bits of it
+        available -= 3 + (4 if checksum else 0)
+        payloadBytes = available - 1
+        while payloadBytes > 0 and len(FrameHelper.encode_varint(payloadBytes)) + payloadBytes > available:
+            payloadBytes -= 1
+        return max(0, payloadBytes)
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """
+        Returns the hash used to identify an indexed text.
+
+        Args:
+            text (str): The text to hash.
+
+        Returns:
+            str: The hexadecimal SHA-256 hash of the UTF-8 encoded text.
+        """
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def matches(self, text: str) -> bool:
+        """
+        Returns whether the index was built from the given text. This hashes the whole text and is meant
+        for verifying an index loaded from disk, not for every call of `write`.
+
+        Args:
+            text (str): The text to compare with.
+
+        Returns:
+            bool: True if the text has the length and the hash of the indexed text.
+        """
+        return len(text) == self.textLength and CoverIndex.hash_text(text) == self.textHash
+
+    def to_dict(self) -> dict:
+        """
+        Returns the index as a JSON serializable dictionary.
+
+        Returns:
+            dict: The serialized index.
+        """
+        return {
+            "version": self.FORMAT_VERSION,
+            "capacityBits": self.capacityBits,
+            "textLength": self.textLength,
+            "textHash": self.textHash,
+            "codebook": self.codebookFingerprint,
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+            "pairIds": self.pairIds.tolist()
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "CoverIndex":
+        """
+        Creates an index from a dictionary produced by `to_dict`.
+
+        Args:
+            data (dict): The serialized index.
+
+        Returns:
+            CoverIndex: The deserialized index.
+
+        Raises:
+            ValueError: If the data is no serialized index of a supported version.
+        """
+        if not isinstance(data, dict) or data.get("version") != CoverIndex.FORMAT_VERSION:
+            raise ValueError("The cover index has a wrong format.")
+
+        return CoverIndex(array("q", data["starts"]), array("q", data["ends"]), array("l", data["pairIds"]),
+                          data["capacityBits"], data["textLength"], data["textHash"], data["codebook"])
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to a JSON file, e.g. next to the cover text it belongs to.
+
+        Args:
+            path (str): The path of the file to write.
+
+        Example:
+            >>> steganograph.index_cover(text).save("cover.txt.index.json")
+        """
+        FileHelper.write_file(path, json.dumps(self.to_dict(), separators=(",", ":")))
+
+    @staticmethod
+    def load(path: str) -> "CoverIndex":
+        """
+        Reads an index from a JSON file written by `save`.
+
+        Args:
+            path (str): The path of the file to read.
+
+        Returns:
+            CoverIndex: The loaded index.
+
+        Raises:
+            ValueError: If the file contains no serialized index of a supported version.
+        """
+        return CoverIndex.from_dict(FileHelper.read_json_file(path))
@@ -0,0 +1,215 @@
+import json
+import os
+from bisect import bisect_left
+from typing import Iterable
+
+from helpers.fileHelper import FileHelper
+
+class CoverLibrary:
+    """
+    A class recording how many bits every cover text of a library can hold, so that the smallest cover
+    fitting a secret is found without encoding it into any cover. Capacities are stored per codebook
+    fingerprint and content hash, so a cover that is renamed, copied or changed back needs no new scan,
+    and the same library serves several configurations. Use `Steganograph.update_library` to scan the
+    covers and `Steganograph.select_cover` to pick one.
+
+    Attributes:
+        FORMAT_VERSION (int): The version of the serialized format.
+        files (dict[str, tuple[int, int, str]]): The size, modification time in nanoseconds and content hash
+            of every cover, by its path.
+        capacities (dict[str, dict[str, int]]): The capacity in bits of every content hash, by the codebook
+            fingerprint.
+
+    Methods:
+        __init__(files: dict | None, capacities: dict | None):
+            Initializes the CoverLibrary object.
+
+        is_current(path: str, stat: os.stat_result, fingerprint: str) -> bool:
+            Returns whether the capacity of an unchanged cover is known.
+
+        capacity(textHash: str, fingerprint: str) -> int | None:
+            Returns the recorded capacity of a content hash.
+
+        record(path: str, stat: os.stat_result, textHash: str, fingerprint: str, capacityBits: int) -> None:
+            Records the content hash and capacity of a cover.
+
+        retain(paths: Iterable[str]) -> None:
+            Forgets all covers except the given ones.
+
+        best_cover(requiredBits: int, fingerprint: str) -> str | None:
+            Returns the cover with the smallest capacity of at least the required bits.
+
+        save(path: str) -> None / load(path: str) -> CoverLibrary:
+            Writes the library to or reads it from a JSON file.
+    """
+    FORMAT_VERSION: int = 1
+
+    files: dict[str, tuple[int, int, str]]
+    capacities: dict[str, dict[str, int]]
+
+    def __init__(self, files: dict[str, tuple[int, int, str]] | None = None,
+                 capacities: dict[str, dict[str, int]] | None = None):
+        """
+        Initializes the CoverLibrary object, empty unless the recorded covers are given.
+
+        Args:
+            files (dict[str, tuple[int, int, str]] | None): The size, modification time and content hash
+                of every cover (default is None).
+            capacities (dict[str, dict[str, int]] | None): The capacities by codebook fingerprint and content
+                hash (default is None).
+
+        Example:
+            >>> library = CoverLibrary.load("covers.json") if os.path.exists("covers.json") else CoverLibrary()
+            >>> steganograph.update_library(library, glob.glob("covers/*.txt"))
+            >>> steganograph.select_cover(library, "secret")
+            'covers/the_apology_original.txt'
+        """
+        self.files = files if files is not None else {}
+        self.capacities = capacities if capacities is not None else {}
+        # the covers of every fingerprint ordered by capacity, built on the first query after a change
+        self.__ordered: dict[str, tuple[list[int], list[str]]] = {}
+
+    def is_current(self, path: str, stat: os.stat_result, fingerprint: str) -> bool:
+        """
+        Returns whether a cover is unchanged since it was recorded and its capacity for the codebook is known.
+        A cover is considered unchanged as long as its size and modification time are the same.
+
+        Args:
+            path (str): The path of the cover.
+            stat (os.stat_result): The current status of the file.
+            fingerprint (str): The fingerprint of the codebook.
+
+        Returns:
+            bool: True if the cover does not have to be read again.
+        """
+        recorded = self.files.get(path)
+        return recorded is not None and recorded[0] == stat.st_size and recorded[1] == stat.st_mtime_ns \
+            and recorded[2] in self.capacities.get(fingerprint, {})
+
+    def capacity(self, textHash: str, fingerprint: str) -> int | None:
+        """
+        Returns the recorded capacity of a cover content.
+
+        Args:
+            textHash (str): The hash of the content, see `CoverIndex.hash_text`.
+            fingerprint (str): The fingerprint of the codebook.
+
+        Returns:
+            int | None: The capacity in bits, or None if the content was not scanned with the codebook yet.
+        """
+        return self.capacities.get(fingerprint, {}).get(textHash)
+
+    def record(self, path: str, stat: os.stat_result, textHash: str, fingerprint: str, capacityBits: int) -> None:
+        """
+        Records the content hash and capacity of a cover.
+
+        Args:
+            path (str): The path of the cover.
+            stat (os.stat_result): The status of the file when it was read.
+            textHash (str): The hash of the content.
+            fingerprint (str): The fingerprint of the codebook.
+            capacityBits (int): The number of bits the cover can hold with the codebook.
+        """
+        self.files[path] = (stat.st_size, stat.st_mtime_ns, textHash)
+        self.capacities.setdefault(fingerprint, {})[textHash] = capacityBits
+        self.__ordered.clear()
+
+    def retain(self, paths: Iterable[str]) -> None:
+        """
+        Forgets all covers except the given ones, together with the capacities no remaining cover has.
+
+        Args:
+            paths (Iterable[str]): The paths of the covers to keep.
+        """
+        kept = set(paths)
+        self.files = {path: recorded for path, recorded in self.files.items() if path in kept}
+        hashes = {recorded[2] for recorded in self.files.values()}
+        for capacities in self.capacities.values():
+            for textHash in [textHash for textHash in capacities if textHash not in hashes]:
+                del capacities[textHash]
+        self.__ordered.clear()
+
+    def best_cover(self, requiredBits: int, fingerprint: str) -> str | None:
+        """
+        Returns the cover with the smallest capacity that holds at least the required bits, using a binary
+        search over the covers ordered by capacity. Ties are broken by the path.
+
+        Args:
+            requiredBits (int): The number of bits to hide.
+            fingerprint (str): The fingerprint of the codebook.
+
+        Returns:
+            str | None: The path of the cover, or None if no cover is large enough.
+        """
+        ordered = self.__ordered.get(fingerprint)
+        if ordered is None:
+            capacities = self.capacities.get(fingerprint, {})
+            covers = sorted((capacities[recorded[2]], path) for path, recorded in self.files.items()
+                            if recorded[2] in capacities)
+            ordered = self.__ordered[fingerprint] = ([cover[0] for cover in covers], [cover[1] for cover in covers])
+
+        position = bisect_left(ordered[0], requiredBits)
+        return ordered[1][position] if position < len(ordered[1]) else None
+
+    def to_dict(self) -> dict:
+        """
+        Returns the library as a JSON serializable dictionary.
+
+        Returns:
+            dict: The serialized library.
+        """
+        return {
+            "version": self.FORMAT_VERSION,
+            "files": {path: list(recorded) for path, recorded in self.files.items()},
+            "capacities": self.capacities
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "CoverLibrary":
+        """
+        Creates a library from a dictionary produced by `to_dict`.
+
+        Args:
+            data (dict): The serialized library.
+
+        Returns:
+            CoverLibrary: The deserialized library.
+
+        Raises:
+            ValueError: If the data is no serialized library of a supported version.
+        """
+        if not isinstance(data, dict) or data.get("version") != CoverLibrary.FORMAT_VERSION:
+            raise ValueError("The cover library has a wrong format.")
+
+        return CoverLibrary({path: tuple(recorded) for path, recorded in data["files"].items()}, data["capacities"])
+
+    def save(self, path: str) -> None:
+        """
+        Writes the library to a JSON file.
+
+        Args:
+            path (str): The path of the file to write.
+        """
+        FileHelper.write_file(path, json.dumps(self.to_dict(), separators=(",", ":")))
+
+    @staticmethod
+    def load(path: str) -> "CoverLibrary":
+        """
+        Reads a library from a JSON file written by `save`.
+
+        Args:
+            path (str): The path of the file to read.
+
+        Returns:
+            CoverLibrary: The loaded library.
+
+        Raises:
+            ValueError: If the file contains no serialized library of a supported version.
+        """
+        return CoverLibrary.from_dict(FileHelper.read_json_file(path))
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __repr__(self) -> str:
+        return f"CoverLibrary({len(self.files)} covers)"
@@ -0,0 +1,357 @@
+import functools
+import os
+import sqlite3
+import tempfile
+import urllib.parse
+from typing import Iterable, Iterator, Sequence
+
+from helpers.fileHelper import FileHelper
+from models.Codebook import Codebook
+from models.PhraseMatcher import PhraseMatcher
+from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
+
+DISK_FORMAT_VERSION = 1
+# the number of lookups, forms and bit counts kept in memory per codebook
+DEFAULT_CACHE_SIZE = 1 << 16
+
+SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value) WITHOUT ROWID;
+CREATE TABLE pairs (pairId INTEGER PRIMARY KEY, bitCount INTEGER NOT NULL);
+CREATE TABLE words (key TEXT PRIMARY KEY, pairId INTEGER NOT NULL, value INTEGER NOT NULL, word TEXT NOT NULL)
+    WITHOUT ROWID;
+"""
+# created after all words are inserted, which is faster than keeping it up to date
+FORMS_INDEX = "CREATE UNIQUE INDEX forms ON words (pairId, value)"
+
+class DiskCodebook:
+    """
+    A codebook stored in an indexed SQLite file, for dictionaries too large to be loaded as a whole. Opening
+    it only reads a few rows, and words, forms and bit counts are queried when they are needed and kept in
+    bounded LRU caches. It can be used wherever a `Codebook` is used and encodes and decodes identically.
+    Phrases are supported, but as a `PhraseMatcher` needs every word, it is still built on opening.
+
+    Use `convert` to create the file, `Steganograph` opens it when it is passed instead of a JSON file.
+
+    Attributes:
+        synonyms (DiskSynonyms): A read-only sequence creating the pairs and groups on access.
+        bitCounts (CachedQuery): The number of bits every pair carries, indexed by the pair id.
+        entries (CachedQuery): Maps each word to its pair id and value with `get`, like a dictionary.
+        matcher (PhraseMatcher | None): The matcher for texts, if any synonym is a phrase.
+        ignoreCase (bool): Whether words are looked up by their casefolded form.
+        path (str): The file of the codebook.
+        cacheSize (int): The number of results kept per cache.
+
+    Methods:
+        __init__(path: str, cacheSize: int):
+            Opens a codebook file read-only.
+
+        convert(synonyms: Iterable[Synonym | SynonymGroup], path: str, ignoreCase: bool) -> None:
+            Writes the given pairs and groups to a codebook file.
+
+        is_disk_codebook(path: str) -> bool:
+            Returns whether a file is an SQLite file and therefore no JSON configuration.
+
+        lookup(word: str) -> tuple[int, int] | None:
+            Returns the pair id and value of the given word, or None if the word is no carrier.
+
+        form(pairId: int, value: int) -> str:
+            Returns the word of a pair that encodes the given value.
+
+        casedForm(pairId: int, value: int, original: str) -> str:
+            Returns the word encoding the given value with the capitalization of the word it replaces.
+
+        fingerprint() -> str:
+            Returns the hash identifying the content, equal to the one of a `Codebook` of the same pairs.
+    """
+
+    synonyms: "DiskSynonyms"
+    bitCounts: "CachedQuery"
+    entries: "CachedQuery"
+    matcher: PhraseMatcher | None
+    ignoreCase: bool
+    path: str
+    cacheSize: int
+
+    def __init__(self, path: str, cacheSize: int = DEFAULT_CACHE_SIZE):
+        """
+        Opens a codebook file read-only. Only the metadata is read, and the phrases if there are any.
+
+        Args:
+            path (str): The file written by `convert`.
+            cacheSize (int): The number of results kept per cache (default is DEFAULT_CACHE_SIZE).
+
+        Raises:
+            ValueError: If the file holds no codebook of a supported version.
+
+        Example:
+            >>> codebook = DiskCodebook("synonyms.sqlite")
+            >>> codebook.lookup("joyful")
+            (0, 1)
+        """
+        self.path = path
+        self.cacheSize = cacheSize
+        self.__connection = sqlite3.connect(f"file:{urllib.parse.quote(os.path.abspath(path))}?mode=ro", uri=True,
+                                            check_same_thread=False)
+        try:
+            meta = dict(self.__connection.execute("SELECT name, value FROM meta"))
+        except sqlite3.DatabaseError as error:
+            self.__connection.close()
+            raise ValueError("The codebook file has a wrong format.") from error
+        if meta.get("version") != DISK_FORMAT_VERSION:
+            self.__connection.close()
+            raise ValueError("The codebook file has a wrong format.")
+
+        self.ignoreCase = bool(meta["ignoreCase"])
+        self.__pairCount = meta["pairCount"]
+        self.__fingerprint = meta["fingerprint"]
+        self.entries = CachedQuery(self.__connection, "SELECT pairId, value FROM words WHERE key = ?", cacheSize)
+        self.bitCounts = CachedQuery(self.__connection, "SELECT bitCount FROM pairs WHERE pairId = ?", cacheSize,
+                                     scalar=True)
+        self.__forms = CachedQuery(self.__connection, "SELECT word FROM words WHERE pairId = ? AND value = ?",
+                                   cacheSize, scalar=True)
+        self.__caseVariants = functools.lru_cache(maxsize=cacheSize)(Codebook.caseVariants)
+        self.synonyms = DiskSynonyms(self)
+
+        self.matcher = None
+        if meta["hasPhrases"]:
+            keys: list[list[str]] = [[] for _ in range(self.__pairCount)]
+            for pairId, key in self.__connection.execute("SELECT pairId, key FROM words ORDER BY pairId, value"):
+                keys[pairId].append(key)
+            self.matcher = PhraseMatcher(keys, self.ignoreCase)
+
+    @staticmethod
+    def convert(synonyms: Iterable[Synonym | SynonymGroup], path: str, ignoreCase: bool = False) -> None:
+        """
+        Writes the given pairs and groups to a codebook file. The pairs are consumed one by one, so they
+        can come from a streaming parser without holding the whole dictionary in memory. The file is
+        written next to the path and only replaces an existing file once it is complete.
+
+        Args:
+            synonyms (Iterable[Synonym | SynonymGroup]): The validated pairs and groups in their order.
+            path (str): The path of the codebook file.
+            ignoreCase (bool): Whether words are looked up regardless of their case (default is False).
+
+        Raises:
+            ValueError: If a word occurs more than once, in any case if the case is ignored, or if a phrase
+                could not be decoded unambiguously, see `PhraseMatcher`.
+
+        Example:
+            >>> DiskCodebook.convert([Synonym("happy", "joyful")], "synonyms.sqlite")
+        """
+        descriptor, temporaryPath = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-")
+        os.close(descriptor)
+        try:
+            connection = sqlite3.connect(temporaryPath)
+            try:
+                DiskCodebook.__writeTables(connection, synonyms, ignoreCase)
+            finally:
+                connection.close()
+
+            # opening the result checks that the phrases can be decoded
+            DiskCodebook(temporaryPath).close()
+            os.replace(temporaryPath, path)
+        except BaseException:
+            os.remove(temporaryPath)
+            raise
+
+    @staticmethod
+    def __writeTables(connection: sqlite3.Connection, synonyms: Iterable[Synonym | SynonymGroup],
+                      ignoreCase: bool) -> None:
+        # a failed conversion deletes the whole file, so nothing has to be synced until it is complete
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.executescript(SCHEMA)
+        cursor = connection.cursor()
+        pairCount = 0
+        hasPhrases = False
+
+        def insertPairs() -> Iterator[list[str]]:
+            # the pairs are inserted while they are hashed, so that they are read only once
+            nonlocal pairCount, hasPhrases
+            for pairId, synonym in enumerate(synonyms):
+                words = synonym.words
+                for value, word in enumerate(words):
+                    try:
+                        cursor.execute("INSERT INTO words VALUES (?, ?, ?, ?)",
+                                       (word.casefold() if ignoreCase else word, pairId, value, word))
+                    except sqlite3.IntegrityError:
+                        raise ValueError(f'The synonym "{word}" exists at least two times.') from None
+                    hasPhrases = hasPhrases or " " in word
+                cursor.execute("INSERT INTO pairs VALUES (?, ?)", (pairId, synonym.bitCount()))
+                pairCount = pairId + 1
+                yield words
+
+        fingerprint = Codebook.hashForms(insertPairs(), ignoreCase)
+        cursor.execute(FORMS_INDEX)
+        cursor.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("version", DISK_FORMAT_VERSION), ("ignoreCase", int(ignoreCase)), ("pairCount", pairCount),
+            ("hasPhrases", int(hasPhrases)), ("fingerprint", fingerprint)
+        ])
+        connection.commit()
+
+    @staticmethod
+    def is_disk_codebook(path: str) -> bool:
+        """
+        Returns whether a file is an SQLite file, which a JSON configuration never is.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            bool: True if the file starts with the SQLite header, False if not or if it cannot be read.
+        """
+        return FileHelper.is_sqlite_file(path)
+
+    def lookup(self, word: str) -> tuple[int, int] | None:
+        """
+        Returns the pair id and value of the given word.
+
+        Args:
+            word (str): The word to look up, in any case if the case is ignored.
+
+        Returns:
+            tuple[int, int] | None: The pair id and the value, or None if the word is not part of any pair.
+        """
+        return self.entries.get(word.casefold() if self.ignoreCase else word)
+
+    def form(self, pairId: int, value: int) -> str:
+        """
+        Returns the word of a pair that encodes the given value.
+
+        Args:
+            pairId (int): The id of the pair.
+            value (int): The value to encode, smaller than 2 to the power of the bit count of the pair.
+
+        Returns:
+            str: The word encoding the value.
+        """
+        return self.__forms.get(pairId, value)
+
+    def casedForm(self, pairId: int, value: int, original: str) -> str:
+        """
+        Returns the word of a pair that encodes the given value, written like the word it replaces.
+        See `Codebook.casedForm`.
+
+        Args:
+            pairId (int): The id of the pair.
+            value (int): The value to encode.
+            original (str): The word of the text that is replaced.
+
+        Returns:
+            str: The word encoding the value.
+        """
+        lowerForm, titleForm, upperForm = self.__caseVariants(self.form(pairId, value))
+        if original[:1].isupper():
+            return upperForm if original[1:].isupper() else titleForm
+        return lowerForm
+
+    def fingerprint(self) -> str:
+        """
+        Returns a hash over all pairs in their order, computed when the file was converted.
+
+        Returns:
+            str: The hexadecimal SHA-256 hash of the pairs.
+        """
+        return self.__fingerprint
+
+    def words(self, pairId: int) -> list[str]:
+        """
+        Returns the words of a pair, ordered by the value they encode.
+
+        Args:
+            pairId (int): The id of the pair.
+
+        Returns:
+            list[str]: The words of the pair.
+        """
+        rows = self.__connection.execute("SELECT word FROM words WHERE pairId = ? ORDER BY value", (pairId,))
+        return [word for word, in rows]
+
+    def close(self) -> None:
+        """
+        Closes the connection to the file.
+        """
+        self.__connection.close()
+
+    def __reduce__(self):
+        # the receiving process opens the file again with empty caches
+        return DiskCodebook, (self.path, self.cacheSize)
+
+    def __len__(self) -> int:
+        return self.__pairCount
+
+class CachedQuery:
+    """
+    A query of a `DiskCodebook` whose results are kept in a bounded LRU cache. Words that are no carriers
+    are cached as well, as they make up most of the lookups of a text.
+
+    Methods:
+        get(*parameters) -> tuple | object | None:
+            Returns the first row of the query, or its only column if the query is scalar.
+
+        __getitem__(parameter) -> object:
+            Returns the only column of the first row, like a list or a dictionary.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, query: str, cacheSize: int, scalar: bool = False):
+        """
+        Initializes the cached query.
+
+        Args:
+            connection (sqlite3.Connection): The connection to the codebook file.
+            query (str): The query, with one placeholder per parameter.
+            cacheSize (int): The number of results kept.
+            scalar (bool): Whether the query selects a single column (default is False).
+        """
+        self.__connection = connection
+        self.__query = query
+        self.__scalar = scalar
+        self.get = functools.lru_cache(maxsize=cacheSize)(self.__execute)
+
+    def __execute(self, *parameters):
+        row = self.__connection.execute(self.__query, parameters).fetchone()
+        if row is None or not self.__scalar:
+            return row
+        return row[0]
+
+    def __getitem__(self, parameter):
+        result = self.get(parameter)
+        if result is None:
+            raise KeyError(parameter)
+        return result
+
+class DiskSynonyms(Sequence):
+    """
+    A read-only sequence of the pairs and groups of a `DiskCodebook`, creating them on access only.
+    """
+
+    def __init__(self, codebook: DiskCodebook):
+        """
+        Initializes the sequence of a codebook.
+
+        Args:
+            codebook (DiskCodebook): The codebook holding the pairs.
+        """
+        self.__codebook = codebook
+
+    def __getitem__(self, pairId):
+        if isinstance(pairId, slice):
+            return [self[index] for index in range(*pairId.indices(len(self)))]
+        if pairId < 0:
+            pairId += len(self)
+        if not 0 <= pairId < len(self):
+            raise IndexError("pair id out of range")
+
+        words = self.__codebook.words(pairId)
+        return Synonym(words[0], words[1]) if len(words) == 2 else SynonymGroup(words)
+
+    def __len__(self) -> int:
+        return len(self.__codebook)
+
+    def __iter__(self) -> Iterator[Synonym | SynonymGroup]:
+        return (self[pairId] for pairId in range(len(self)))
+
+    def __reduce__(self):
+        # restored as the sequence of the restored codebook, so that both stay the same object
+        return getattr, (self.__codebook, "synonyms")
@@ -0,0 +1,62 @@
+class EmbeddedSecret:
+    """
+    A class representing one of the secrets found by `Steganograph.read_all`, together with the part of
+    the text holding it. Bits that end like a secret but cannot be decoded, e.g. a frame with a wrong
+    checksum, produce a result with an error instead of stopping the search.
+
+    Attributes:
+        value (str | bytes | None): The hidden text, or the raw bytes of a binary frame.
+        error (Exception | None): The error raised while decoding the secret, if any.
+        start (int): The index of the first character of the first carrier of the secret.
+        end (int): The index behind the last carrier of the secret.
+        carriers (range): The numbers of the carriers holding the secret, counted from the start of the text.
+
+    Methods:
+        __init__(value: str | bytes | None, error: Exception | None, start: int, end: int, carriers: range):
+            Initializes the EmbeddedSecret object.
+
+        succeeded() -> bool:
+            Returns whether the secret was decoded without an error.
+    """
+
+    value: str | bytes | None
+    error: Exception | None
+    start: int
+    end: int
+    carriers: range
+
+    def __init__(self, value: str | bytes | None, error: Exception | None, start: int, end: int, carriers: range):
+        """
+        Initializes the EmbeddedSecret object with either a value or an error.
+
+        Args:
+            value (str | bytes | None): The decoded secret.
+            error (Exception | None): The error raised while decoding the secret.
+            start (int): The index of the first character of the first carrier.
+            end (int): The index behind the last carrier.
+            carriers (range): The numbers of the carriers holding the secret.
+
+        Example:
+            >>> secret = EmbeddedSecret("secret", None, 5, 120, range(0, 56))
+            >>> secret.succeeded()
+            True
+        """
+        self.value = value
+        self.error = error
+        self.start = start
+        self.end = end
+        self.carriers = carriers
+
+    def succeeded(self) -> bool:
+        """
+        Returns whether the secret was decoded without an error.
+
+        Returns:
+            bool: True if no error was raised while decoding.
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"EmbeddedSecret({self.start}, {self.end}, error={self.error!r})"
+        return f"EmbeddedSecret({self.start}, {self.end}, value={self.value!r})"
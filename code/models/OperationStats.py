@@ -0,0 +1,132 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+class OperationStats:
+    """
+    A class holding the statistics of a single `write`, `read`, `write_stream` or `read_stream` call of a
+    Steganograph with an observer. Streaming calls update the same object after every chunk.
+
+    Attributes:
+        operation (str): The name of the method the statistics belong to.
+        phaseSeconds (dict[str, float]): The time spent in every phase, e.g. "tokenize", "lookup" and "embed".
+        wordsScanned (int): The number of words the text was split into.
+        carriersMatched (int): The number of scanned words that are part of a pair or group.
+        capacityBits (int): The number of bits the matched carriers hold together.
+        bitsEmbedded (int): The number of bits written, including the END_OF_SECRET or the frame header.
+        bitsRead (int): The number of bits extracted.
+        charactersRead (int): The number of characters of the text that were processed.
+
+    Methods:
+        __init__(operation: str):
+            Initializes empty statistics for an operation.
+
+        remainingCapacityBits -> int:
+            The number of bits the scanned carriers could still hold.
+
+        totalSeconds -> float:
+            The time spent in all phases.
+
+        phase(name: str) -> Iterator[None]:
+            A context manager adding the time spent inside it to a phase.
+
+        addPhase(name: str, seconds: float) -> None:
+            Adds time to a phase.
+
+        to_dict() -> dict:
+            Returns the statistics as a JSON serializable dictionary.
+    """
+
+    operation: str
+    phaseSeconds: dict[str, float]
+    wordsScanned: int
+    carriersMatched: int
+    capacityBits: int
+    bitsEmbedded: int
+    bitsRead: int
+    charactersRead: int
+
+    def __init__(self, operation: str):
+        """
+        Initializes empty statistics for an operation.
+
+        Args:
+            operation (str): The name of the method the statistics belong to.
+
+        Example:
+            >>> stats = OperationStats("write")
+            >>> with stats.phase("tokenize"):
+            ...     words = text.split()
+        """
+        self.operation = operation
+        self.phaseSeconds = {}
+        self.wordsScanned = 0
+        self.carriersMatched = 0
+        self.capacityBits = 0
+        self.bitsEmbedded = 0
+        self.bitsRead = 0
+        self.charactersRead = 0
+
+    @property
+    def remainingCapacityBits(self) -> int:
+        """
+        The number of bits the scanned carriers could hold in addition to the bits that were embedded or read.
+        After a `write` the whole cover was scanned, so this is the capacity left in the cover.
+        """
+        return max(0, self.capacityBits - self.bitsEmbedded - self.bitsRead)
+
+    @property
+    def totalSeconds(self) -> float:
+        """
+        The time spent in all phases.
+        """
+        return sum(self.phaseSeconds.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Adds the time spent inside the context to a phase.
+
+        Args:
+            name (str): The name of the phase.
+
+        Returns:
+            Iterator[None]: A context manager timing its body.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addPhase(name, time.perf_counter() - started)
+
+    def addPhase(self, name: str, seconds: float) -> None:
+        """
+        Adds time to a phase.
+
+        Args:
+            name (str): The name of the phase.
+            seconds (float): The time to add.
+        """
+        self.phaseSeconds[name] = self.phaseSeconds.get(name, 0.0) + seconds
+
+    def to_dict(self) -> dict:
+        """
+        Returns the statistics as a JSON serializable dictionary.
+
+        Returns:
+            dict: The statistics including the remaining capacity.
+        """
+        return {
+            "operation": self.operation,
+            "phaseSeconds": dict(self.phaseSeconds),
+            "wordsScanned": self.wordsScanned,
+            "carriersMatched": self.carriersMatched,
+            "capacityBits": self.capacityBits,
+            "remainingCapacityBits": self.remainingCapacityBits,
+            "bitsEmbedded": self.bitsEmbedded,
+            "bitsRead": self.bitsRead,
+            "charactersRead": self.charactersRead
+        }
+
+    def __repr__(self) -> str:
+        return f"OperationStats({self.to_dict()!r})"
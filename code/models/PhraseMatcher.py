@@ -0,0 +1,196 @@
+from collections import deque
+from typing import Iterator
+
+# The key under which a trie node stores the pair id and value of the synonym ending at it. Words are never empty.
+PHRASE_END = ""
+
+class PhraseMatcher:
+    """
+    A trie over the words of all synonyms of a codebook, used as soon as one synonym is a phrase of several
+    words like "a lot". Walking the words of a text, it finds the longest synonym starting at each word in a
+    single pass, so matching stays linear in the length of the text, whatever the number of synonyms.
+
+    The words of a phrase are separated by whitespace in the text and by single spaces in the configuration.
+    To decode a text exactly like it was encoded, replacing a carrier must not change which carriers are
+    found around it. Therefore no synonym may be the beginning of another one, and no word inside a phrase
+    may be the first word of a synonym.
+
+    Attributes:
+        roots (dict[str, dict]): Maps the first word of every synonym to its trie node. A node maps the next
+            word to the next node and PHRASE_END to the pair id and value of the synonym ending at the node.
+        maxWords (int): The number of words of the longest phrase.
+        ignoreCase (bool): Whether the words of a text are casefolded before they are looked up.
+
+    Methods:
+        __init__(forms: list[list[str]], ignoreCase: bool):
+            Builds the trie from the words of every pair and checks that all phrases can be decoded.
+
+        iterMatches(text: str, words: Iterator[tuple[int, int, str]], end: int) -> Iterator[tuple[int, int, int, int]]:
+            Yields the longest synonym at each word of a text.
+
+        decidedLength(text: str, end: int) -> int:
+            Returns the length of the part of a stream buffer in which all matches can be decided.
+    """
+
+    roots: dict[str, dict]
+    maxWords: int
+    ignoreCase: bool
+
+    def __init__(self, forms: list[list[str]], ignoreCase: bool = False):
+        """
+        Builds the trie from the words of every pair and checks that all phrases can be decoded.
+
+        Args:
+            forms (list[list[str]]): The words of every pair, ordered by the value they encode. If the case
+                is ignored, the words have to be casefolded already.
+            ignoreCase (bool): Whether the words of a text are casefolded before they are looked up
+                (default is False).
+
+        Raises:
+            ValueError: If a synonym is the beginning of another one, or if a phrase contains a word
+                that is the first word of a synonym.
+
+        Example:
+            >>> matcher = PhraseMatcher([["a lot", "many"]])
+            >>> list(matcher.iterMatches("a lot of", TokenHelper.iter_words("a lot of"), 8))
+            [(0, 5, 0, 0)]
+        """
+        self.roots = {}
+        self.maxWords = 1
+        self.ignoreCase = ignoreCase
+        phrases: list[list[str]] = []
+
+        # insert in reverse order, so that the first occurrence of a duplicated synonym overwrites the others
+        for pairId in range(len(forms) - 1, -1, -1):
+            for value in range(len(forms[pairId]) - 1, -1, -1):
+                phrase = forms[pairId][value].split(" ")
+                node = self.roots.setdefault(phrase[0], {})
+                for word in phrase[1:]:
+                    node = node.setdefault(word, {})
+                node[PHRASE_END] = (pairId, value)
+
+                if len(phrase) > 1:
+                    phrases.append(phrase)
+                    self.maxWords = max(self.maxWords, len(phrase))
+
+        for phrase in phrases:
+            node = self.roots
+            for position in range(len(phrase) - 1):
+                node = node[phrase[position]]
+                if PHRASE_END in node:
+                    raise ValueError(f'The synonym "{" ".join(phrase[:position + 1])}" is the beginning '
+                                     f'of the synonym "{" ".join(phrase)}".')
+
+            for word in phrase[1:]:
+                if word in self.roots:
+                    raise ValueError(f'The synonym "{" ".join(phrase)}" contains the word "{word}", '
+                                     f'which begins another synonym.')
+
+    def iterMatches(self, text: str, words: Iterator[tuple[int, int, str]],
+                    end: int) -> Iterator[tuple[int, int, int, int]]:
+        """
+        Yields the longest synonym at each word of a text, continuing after the end of every match.
+        A word reaching `end` is not complete and ends the search.
+
+        Args:
+            text (str): The text the words belong to.
+            words (Iterator[tuple[int, int, str]]): The words of the text as yielded by `TokenHelper.iter_words`.
+            end (int): The index at which the search stops.
+
+        Returns:
+            Iterator[tuple[int, int, int, int]]: The start index, end index, pair id and value of every match.
+        """
+        roots = self.roots
+        lookahead: deque[tuple[int, int, str]] = deque()
+        if self.ignoreCase:
+            words = ((wordStart, wordEnd, word.casefold()) for wordStart, wordEnd, word in words)
+
+        while True:
+            if lookahead:
+                wordStart, wordEnd, word = lookahead.popleft()
+            else:
+                token = next(words, None)
+                if token is None:
+                    return
+                wordStart, wordEnd, word = token
+
+            if wordEnd == end:
+                return
+
+            node = roots.get(word)
+            if node is None:
+                continue
+
+            match = node.get(PHRASE_END)
+            matchEnd = wordEnd
+            matchedWords = 0
+            walkedWords = 0
+            previousEnd = wordEnd
+
+            # follow the trie as long as the next words are separated by whitespace only
+            while len(node) > (PHRASE_END in node):
+                if walkedWords == len(lookahead):
+                    token = next(words, None)
+                    if token is None:
+                        break
+                    lookahead.append(token)
+
+                nextStart, nextEnd, nextWord = lookahead[walkedWords]
+                if nextEnd == end or not text[previousEnd:nextStart].isspace():
+                    break
+                node = node.get(nextWord)
+                if node is None:
+                    break
+
+                walkedWords += 1
+                previousEnd = nextEnd
+                if PHRASE_END in node:
+                    match = node[PHRASE_END]
+                    matchEnd = nextEnd
+                    matchedWords = walkedWords
+
+            if match is not None:
+                for _ in range(matchedWords):
+                    lookahead.popleft()
+                yield wordStart, matchEnd, match[0], match[1]
+
+    def decidedLength(self, text: str, end: int) -> int:
+        """
+        Returns the length of the part of a stream buffer in which the longest match at every word is known.
+        If the last words before `end` are the beginning of a phrase that may continue in the next chunk,
+        the buffer has to be processed again from the first of these words once more text is available.
+
+        Args:
+            text (str): The buffer of the stream.
+            end (int): The length of the part of the buffer containing complete words only.
+
+        Returns:
+            int: The index up to which the buffer can be processed, at most `end`.
+        """
+        # collect the words directly before the end that are separated by whitespace only
+        words: list[tuple[int, str]] = []
+        position = end
+        while len(words) < self.maxWords - 1:
+            while position > 0 and text[position - 1].isspace():
+                position -= 1
+            if position == 0 or not text[position - 1].isalpha():
+                break
+
+            wordEnd = position
+            while position > 0 and text[position - 1].isalpha():
+                position -= 1
+            word = text[position:wordEnd]
+            words.append((position, word.casefold() if self.ignoreCase else word))
+
+        # the earliest word from which the trie can still be followed beyond the end decides
+        for first in range(len(words) - 1, -1, -1):
+            node = self.roots
+            for index in range(first, -1, -1):
+                node = node.get(words[index][1])
+                if node is None:
+                    break
+            else:
+                if len(node) > (PHRASE_END in node):
+                    return words[first][0]
+
+        return end
@@ -0,0 +1,201 @@
+import base64
+import json
+from typing import Callable, Iterator
+
+from helpers.bitHelper import BitArray
+from helpers.fileHelper import FileHelper
+from models.SecretReader import SecretReader
+
+class SecretDecoder:
+    """
+    A class extracting a secret from a text that arrives piece by piece, like a file that is appended to.
+    Every chunk passed to `feed` is scanned once: the carriers of its complete words are decoded right away,
+    and only an unfinished word at its end is kept for the next chunk, so the total cost stays linear in the
+    length of the text. The state can be saved as a checkpoint and restored after a restart.
+    Use `Steganograph.decoder` to create a decoder.
+
+    Attributes:
+        FORMAT_VERSION (int): The version of the checkpoint format.
+        position (int): The number of characters fed so far.
+        isComplete (bool): Whether the end of the secret was reached.
+
+    Methods:
+        __init__(scan: Callable, bitCounts: list[int], createReader: Callable[[], SecretReader], fingerprint: str):
+            Initializes the SecretDecoder object.
+
+        feed(chunk: str) -> bool:
+            Decodes the next part of the text and returns whether the secret is complete.
+
+        result() -> str | bytes:
+            Returns the complete secret.
+
+        checkpoint() -> dict:
+            Returns the state of the decoder as a JSON serializable dictionary.
+
+        restore(checkpoint: dict) -> None:
+            Continues from the state of a checkpoint.
+
+        save_checkpoint(path: str) -> None:
+            Atomically writes a checkpoint to a JSON file.
+    """
+    FORMAT_VERSION: int = 1
+
+    position: int
+    isComplete: bool
+
+    def __init__(self, scan: Callable[[str], tuple[int, Iterator[tuple[int, int, int, int]]]], bitCounts: list[int],
+                 createReader: Callable[[], SecretReader], fingerprint: str):
+        """
+        Initializes the SecretDecoder object at the start of a text.
+
+        Args:
+            scan (Callable[[str], tuple[int, Iterator[tuple[int, int, int, int]]]]): Returns the length of the
+                part of a buffer that can be processed and the carriers in that part.
+            bitCounts (list[int]): The number of bits of every pair.
+            createReader (Callable[[], SecretReader]): Creates a reader detecting the end of a secret.
+            fingerprint (str): The fingerprint of the codebook, which a checkpoint has to match.
+
+        Example:
+            >>> decoder = steganograph.decoder()
+            >>> decoder.feed("I am happy ")
+            False
+        """
+        self.position = 0
+        self.isComplete = False
+        self.__scan = scan
+        self.__bitCounts = bitCounts
+        self.__createReader = createReader
+        self.__fingerprint = fingerprint
+        self.__reader = createReader()
+        # the bits pushed to the reader, from which its state is rebuilt when a checkpoint is restored
+        self.__bits = BitArray()
+        self.__pendingWord = ""
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Decodes the carriers of the next part of the text. A word at the end of the chunk may continue
+        in the next one and is decoded once it is complete. Text fed after the end of the secret is ignored.
+
+        Args:
+            chunk (str): The next part of the text.
+
+        Returns:
+            bool: True once the end of the secret is reached.
+
+        Raises:
+            ValueError: If the secret is a frame of an unsupported version.
+        """
+        if self.isComplete:
+            return True
+
+        buffer = self.__pendingWord + chunk
+        completeUntil, carriers = self.__scan(buffer)
+        bitCounts = self.__bitCounts
+        push = self.__reader.push
+        append = self.__bits.append
+
+        for _, _, pairId, value in carriers:
+            # a group carries several bits, the most significant one first
+            for shift in range(bitCounts[pairId] - 1, -1, -1):
+                bit = value >> shift & 1
+                append(bit)
+                if push(bit):
+                    self.isComplete = True
+                    break
+            if self.isComplete:
+                break
+
+        self.__pendingWord = "" if self.isComplete else buffer[completeUntil:]
+        self.position += len(chunk)
+        return self.isComplete
+
+    def result(self) -> str | bytes:
+        """
+        Returns the complete secret.
+
+        Returns:
+            str | bytes: The hidden message, or the raw bytes of a binary frame.
+
+        Raises:
+            ValueError: If the end of the secret was not reached yet, or the checksum of a frame does not
+                match its payload.
+        """
+        if not self.isComplete:
+            raise ValueError("No secret was found in the text.")
+        return self.__reader.result()
+
+    def checkpoint(self) -> dict:
+        """
+        Returns the state of the decoder: the bits decoded so far, the unfinished word and the number of
+        characters fed. Its size depends on the secret and not on the length of the text.
+
+        Returns:
+            dict: The JSON serializable state.
+        """
+        return {
+            "version": self.FORMAT_VERSION,
+            "fingerprint": self.__fingerprint,
+            "position": self.position,
+            "pendingWord": self.__pendingWord,
+            "bitCount": len(self.__bits),
+            "bits": base64.b64encode(self.__bits.to_bytes()).decode("ascii")
+        }
+
+    def restore(self, checkpoint: dict) -> None:
+        """
+        Continues from the state of a checkpoint, which has to be made with the same configuration.
+        The next chunk to feed is the text following the first `position` characters.
+
+        Args:
+            checkpoint (dict): The state returned by `checkpoint`.
+
+        Raises:
+            ValueError: If the checkpoint has a wrong format or was made with another configuration.
+        """
+        try:
+            if checkpoint["version"] != self.FORMAT_VERSION:
+                raise ValueError
+            fingerprint = checkpoint["fingerprint"]
+            position = checkpoint["position"]
+            pendingWord = checkpoint["pendingWord"]
+            bitCount = checkpoint["bitCount"]
+            data = base64.b64decode(checkpoint["bits"], validate=True)
+            if not isinstance(position, int) or not isinstance(pendingWord, str) or not isinstance(bitCount, int) \
+                    or bitCount < 0 or len(data) != (bitCount + 7) >> 3:
+                raise ValueError
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("The checkpoint has a wrong format.")
+        if fingerprint != self.__fingerprint:
+            raise ValueError("The checkpoint was made with another configuration.")
+        bits = BitArray(data, bitCount)
+
+        # replaying the bits costs as much as the secret, however long the text read before was
+        reader = self.__createReader()
+        isComplete = False
+        for bit in bits:
+            isComplete = reader.push(bit)
+            if isComplete:
+                break
+
+        self.__reader = reader
+        self.__bits = bits
+        self.__pendingWord = pendingWord
+        self.position = position
+        self.isComplete = isComplete
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Writes a checkpoint to a JSON file, replacing the file atomically, so that a crash leaves either the
+        old or the new checkpoint.
+
+        Args:
+            path (str): The path of the file to write.
+
+        Example:
+            >>> decoder.save_checkpoint("feed.checkpoint")
+            >>> decoder = steganograph.decoder(FileHelper.read_json_file("feed.checkpoint"))
+        """
+        FileHelper.write_binary_file(path, json.dumps(self.checkpoint(), separators=(",", ":")).encode("utf-8"))
+
+    def __repr__(self) -> str:
+        return f"SecretDecoder({self.position} characters, {len(self.__bits)} bits, complete={self.isComplete})"
@@ -0,0 +1,92 @@
+from helpers.bitHelper import BitArray, BitHelper
+from helpers.frameHelper import FRAME_MARKER, FrameDecoder
+
+class SecretReader:
+    """
+    A class collecting the bits extracted from carrier words until the end of a secret is reached.
+    It understands both formats a secret can be written in: text followed by the END_OF_SECRET, and
+    a length-prefixed frame, recognized by its first byte being the FRAME_MARKER.
+
+    Attributes:
+        bits (list[int]): The bits collected for a secret in the END_OF_SECRET format.
+        isComplete (bool): Whether the end of the secret was reached.
+
+    Methods:
+        __init__(lengthOfByte: int, endOfSecret: list[int]):
+            Initializes the reader with the END_OF_SECRET format to detect.
+
+        push(bit: int) -> bool:
+            Consumes the next bit and returns whether the secret is complete.
+
+        result() -> str | bytes:
+            Returns the complete secret.
+    """
+
+    bits: list[int]
+    isComplete: bool
+
+    def __init__(self, lengthOfByte: int, endOfSecret: list[int]):
+        """
+        Initializes the reader with the END_OF_SECRET format to detect.
+
+        Args:
+            lengthOfByte (int): The number of bits after which the END_OF_SECRET is checked.
+            endOfSecret (list[int]): The bits marking the end of a secret in the END_OF_SECRET format.
+        """
+        self.bits = []
+        self.isComplete = False
+        self.__lengthOfByte = lengthOfByte
+        self.__endOfSecret = endOfSecret
+        self.__frame: FrameDecoder | None = None
+        self.__byte = 0
+        self.__bitCount = 0
+
+    def push(self, bit: int) -> bool:
+        """
+        Consumes the next bit of the secret.
+
+        Args:
+            bit (int): The bit to consume.
+
+        Returns:
+            bool: True once the end of the secret is reached.
+
+        Raises:
+            ValueError: If the secret is a frame of an unsupported version.
+        """
+        # inside a frame, the length is known and whole bytes are passed to the frame decoder
+        if self.__frame is not None:
+            self.__byte = self.__byte << 1 | bit
+            self.__bitCount += 1
+            if self.__bitCount == 8:
+                self.isComplete = self.__frame.push(self.__byte)
+                self.__byte = self.__bitCount = 0
+            return self.isComplete
+
+        bits = self.bits
+        bits.append(bit)
+
+        if len(bits) == 8 and BitArray.from_bits(bits).value(0, 8) == FRAME_MARKER:
+            self.__frame = FrameDecoder()
+            return False
+
+        # if the newest bits equal the END_OF_SECRET, the secret is complete
+        if len(bits) % self.__lengthOfByte == 0 and len(bits) > len(self.__endOfSecret):
+            if bits[-len(self.__endOfSecret):] == self.__endOfSecret:
+                self.isComplete = True
+
+        return self.isComplete
+
+    def result(self) -> str | bytes:
+        """
+        Returns the complete secret.
+
+        Returns:
+            str | bytes: The hidden text, or the raw bytes of a frame holding binary data.
+
+        Raises:
+            ValueError: If the checksum of a frame does not match its payload.
+        """
+        if self.__frame is not None:
+            return self.__frame.result()
+        return BitHelper.bits_to_char(self.bits[:-len(self.__endOfSecret)])
@@ -0,0 +1,97 @@
+from collections import deque
+
+class ServiceMetrics:
+    """
+    A class collecting the latencies of the requests answered by a `SteganographyServer`. Percentiles are
+    computed over the most recent requests of every operation, so the memory used stays bounded.
+
+    Attributes:
+        sampleSize (int): The number of most recent latencies kept per operation.
+        requests (dict[str, int]): The number of answered requests per operation.
+        errors (dict[str, int]): The number of failed requests per operation.
+        rejected (int): The number of requests rejected because of their size or format.
+        inFlight (int): The number of requests currently being processed.
+
+    Methods:
+        __init__(sampleSize: int):
+            Initializes empty metrics.
+
+        record(operation: str, seconds: float, succeeded: bool) -> None:
+            Records the latency of an answered request.
+
+        to_dict() -> dict:
+            Returns the metrics as a JSON serializable dictionary.
+    """
+
+    sampleSize: int
+    requests: dict[str, int]
+    errors: dict[str, int]
+    rejected: int
+    inFlight: int
+
+    def __init__(self, sampleSize: int = 1024):
+        """
+        Initializes empty metrics.
+
+        Args:
+            sampleSize (int): The number of most recent latencies kept per operation (default is 1024).
+
+        Example:
+            >>> metrics = ServiceMetrics()
+            >>> metrics.record("encode", 0.002, True)
+            >>> metrics.to_dict()["operations"]["encode"]["requests"]
+            1
+        """
+        self.sampleSize = sampleSize
+        self.requests = {}
+        self.errors = {}
+        self.rejected = 0
+        self.inFlight = 0
+        self.__latencies: dict[str, deque[float]] = {}
+        self.__totalSeconds: dict[str, float] = {}
+
+    def record(self, operation: str, seconds: float, succeeded: bool) -> None:
+        """
+        Records the latency of an answered request.
+
+        Args:
+            operation (str): The operation of the request.
+            seconds (float): The time from receiving the request to sending its response.
+            succeeded (bool): Whether the request was answered without an error.
+        """
+        self.requests[operation] = self.requests.get(operation, 0) + 1
+        if not succeeded:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+        self.__totalSeconds[operation] = self.__totalSeconds.get(operation, 0.0) + seconds
+        self.__latencies.setdefault(operation, deque(maxlen=self.sampleSize)).append(seconds)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the metrics as a JSON serializable dictionary.
+
+        Returns:
+            dict: The counters and, per operation, the mean, median, 95th and 99th percentile and maximum
+                latency in seconds.
+        """
+        operations = {}
+        for operation, latencies in self.__latencies.items():
+            ordered = sorted(latencies)
+            operations[operation] = {
+                "requests": self.requests[operation],
+                "errors": self.errors.get(operation, 0),
+                "meanSeconds": self.__totalSeconds[operation] / self.requests[operation],
+                "p50Seconds": ServiceMetrics.__percentile(ordered, 0.5),
+                "p95Seconds": ServiceMetrics.__percentile(ordered, 0.95),
+                "p99Seconds": ServiceMetrics.__percentile(ordered, 0.99),
+                "maxSeconds": ordered[-1]
+            }
+
+        return {"inFlight": self.inFlight, "rejected": self.rejected, "operations": operations}
+
+    @staticmethod
+    def __percentile(ordered: list[float], share: float) -> float:
+        # nearest-rank percentile of a sorted, non-empty list
+        return ordered[min(len(ordered) - 1, max(0, int(len(ordered) * share + 0.5) - 1))]
+
+    def __repr__(self) -> str:
+        return f"ServiceMetrics({self.to_dict()!r})"
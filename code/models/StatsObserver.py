@@ -0,0 +1,50 @@
+from models.OperationStats import OperationStats
+
+class StatsObserver:
+    """
+    The base class of observers that receive the statistics of the operations of a Steganograph. Subclasses
+    override `onProgress` for progress reporting and `onComplete` to export the statistics, e.g. as metrics.
+    Without an observer a Steganograph collects no statistics at all.
+
+    Attributes:
+        lastStats (OperationStats | None): The statistics of the last completed operation.
+
+    Methods:
+        onProgress(stats: OperationStats) -> None:
+            Called after every processed chunk of a streaming operation.
+
+        onComplete(stats: OperationStats) -> None:
+            Called once an operation finished successfully.
+    """
+
+    lastStats: OperationStats | None
+
+    def __init__(self):
+        """
+        Initializes the observer without statistics.
+
+        Example:
+            >>> observer = StatsObserver()
+            >>> steganograph = Steganograph("config.json", observer=observer)
+            >>> steganograph.read(text)
+            >>> observer.lastStats.wordsScanned
+            42
+        """
+        self.lastStats = None
+
+    def onProgress(self, stats: OperationStats) -> None:
+        """
+        Called after every processed chunk of a streaming operation.
+
+        Args:
+            stats (OperationStats): The statistics collected so far.
+        """
+
+    def onComplete(self, stats: OperationStats) -> None:
+        """
+        Called once an operation finished successfully. Failing operations are not reported.
+
+        Args:
+            stats (OperationStats): The final statistics of the operation.
+        """
+        self.lastStats = stats
@@ -0,0 +1,272 @@
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from typing import Iterator
+
+class SubstitutionPatch:
+    """
+    A class holding the carrier words of a text that have to be replaced, e.g. to hide a new secret in a text
+    that already hides another one. Applying the patch only touches the replaced words: words of the same
+    length are overwritten where they are, and only the part behind the first word changing its length has
+    to be shifted.
+
+    Attributes:
+        starts (array): The index of every replaced word in the text, in ascending order.
+        byteStarts (array): The index of every replaced word in the UTF-8 encoding of the text.
+        oldWords (list[str]): The words found in the text.
+        newWords (list[str]): The words replacing them.
+        textLength (int | None): The length of the text the patch belongs to, if known.
+
+    Methods:
+        __init__(starts: array, byteStarts: array, oldWords: list[str], newWords: list[str], textLength: int | None):
+            Initializes the SubstitutionPatch object.
+
+        byte_offsets(text: str, starts: array) -> array:
+            Converts indices of a text into indices of its UTF-8 encoding.
+
+        first_resize() -> int | None:
+            Returns the position in the patch of the first replacement changing the length of the text.
+
+        apply(text: str) -> str:
+            Returns the text with all replacements.
+
+        apply_in_place(buffer: bytearray) -> None:
+            Applies all replacements to the UTF-8 encoded text in a buffer.
+
+        apply_to_file(path: str) -> None:
+            Applies all replacements to a UTF-8 encoded file, touching as little of it as possible.
+    """
+
+    starts: array
+    byteStarts: array
+    oldWords: list[str]
+    newWords: list[str]
+    textLength: int | None
+
+    def __init__(self, starts: array, byteStarts: array, oldWords: list[str], newWords: list[str],
+                 textLength: int | None):
+        """
+        Initializes the SubstitutionPatch object. Use `Steganograph.rewrite` to create the patch of a text.
+
+        Args:
+            starts (array): The index of every replaced word in the text, in ascending order.
+            byteStarts (array): The index of every replaced word in the UTF-8 encoding of the text.
+            oldWords (list[str]): The words found in the text.
+            newWords (list[str]): The words replacing them.
+            textLength (int | None): The length of the text the patch belongs to, None if only its beginning
+                was read.
+        """
+        self.starts = starts
+        self.byteStarts = byteStarts
+        self.oldWords = oldWords
+        self.newWords = newWords
+        self.textLength = textLength
+
+    @staticmethod
+    def byte_offsets(text: str, starts: array) -> array:
+        """
+        Converts ascending indices of a text into indices of its UTF-8 encoding. Only the text up to the last
+        index is encoded, and not even that if the text is pure ASCII.
+
+        Args:
+            text (str): The text the indices belong to.
+            starts (array): The ascending indices.
+
+        Returns:
+            array: The corresponding indices of the UTF-8 encoded text.
+        """
+        if text.isascii():
+            return array("q", starts)
+
+        byteStarts = array("q")
+        previous = 0
+        byteOffset = 0
+        for start in starts:
+            byteOffset += len(text[previous:start].encode("utf-8"))
+            byteStarts.append(byteOffset)
+            previous = start
+        return byteStarts
+
+    def first_resize(self) -> int | None:
+        """
+        Returns the position in the patch of the first replacement whose new word has another length in UTF-8
+        than the word it replaces. The text in front of that word keeps its position when the patch is applied.
+
+        Returns:
+            int | None: The position of the replacement, or None if the length of the text stays the same.
+        """
+        for position in range(len(self.oldWords)):
+            if len(self.oldWords[position].encode("utf-8")) != len(self.newWords[position].encode("utf-8")):
+                return position
+        return None
+
+    def apply(self, text: str) -> str:
+        """
+        Returns the text with all replacements.
+
+        Args:
+            text (str): The text the patch was created for.
+
+        Returns:
+            str: The patched text.
+
+        Raises:
+            ValueError: If the patch does not belong to the text.
+
+        Example:
+            >>> patch = steganograph.rewrite(encodedText, "new secret")
+            >>> steganograph.read(patch.apply(encodedText))
+            'new secret'
+        """
+        if self.textLength is not None and len(text) != self.textLength:
+            raise ValueError("The patch does not belong to the provided text.")
+
+        parts: list[str] = []
+        copiedUntil = 0
+        for start, oldWord, newWord in self:
+            if text[start:start + len(oldWord)] != oldWord:
+                raise ValueError("The patch does not belong to the provided text.")
+            parts.append(text[copiedUntil:start])
+            parts.append(newWord)
+            copiedUntil = start + len(oldWord)
+
+        parts.append(text[copiedUntil:])
+        return ''.join(parts)
+
+    def apply_in_place(self, buffer: bytearray) -> None:
+        """
+        Applies all replacements to the UTF-8 encoded text in a buffer. Words are overwritten where they are
+        up to the first replacement changing the length, only the rest of the buffer is rebuilt once.
+        The buffer is not changed if the patch does not belong to it.
+
+        Args:
+            buffer (bytearray): The UTF-8 encoded text the patch was created for.
+
+        Raises:
+            ValueError: If the patch does not belong to the text in the buffer.
+
+        Example:
+            >>> buffer = bytearray(encodedText.encode("utf-8"))
+            >>> steganograph.rewrite(encodedText, "new secret").apply_in_place(buffer)
+        """
+        oldWords = [word.encode("utf-8") for word in self.oldWords]
+        newWords = [word.encode("utf-8") for word in self.newWords]
+        for byteStart, oldWord in zip(self.byteStarts, oldWords):
+            if buffer[byteStart:byteStart + len(oldWord)] != oldWord:
+                raise ValueError("The patch does not belong to the provided text.")
+
+        resize = self.first_resize()
+        for position in range(len(oldWords) if resize is None else resize):
+            byteStart = self.byteStarts[position]
+            buffer[byteStart:byteStart + len(newWords[position])] = newWords[position]
+        if resize is None:
+            return
+
+        # everything behind the first word changing its length moves, so the rest is assembled once
+        parts: list[bytes] = []
+        copiedUntil = self.byteStarts[resize]
+        for position in range(resize, len(oldWords)):
+            byteStart = self.byteStarts[position]
+            parts.append(buffer[copiedUntil:byteStart])
+            parts.append(newWords[position])
+            copiedUntil = byteStart + len(oldWords[position])
+        parts.append(buffer[copiedUntil:])
+        buffer[self.byteStarts[resize]:] = b''.join(parts)
+
+    def apply_to_file(self, path: str) -> None:
+        """
+        Applies all replacements to a UTF-8 encoded file. If no replacement changes the length of the text,
+        the words are overwritten through a writable memory map, so only the pages holding them are written.
+        Otherwise the file is replaced atomically by a temporary file next to it: the part in front of the
+        first replacement changing the length is copied as it is, with the other replacements overwritten
+        in the copy, and only the rest is assembled. The file is not changed if the patch does not belong to it.
+
+        Overwriting in place is not atomic: if writing fails midway, only some of the words may be replaced.
+
+        Args:
+            path (str): The path of the file the patch was created for.
+
+        Raises:
+            ValueError: If the patch does not belong to the text in the file.
+
+        Example:
+            >>> patch = steganograph.rewrite(FileHelper.read_file("encoded.txt"), "new secret")
+            >>> patch.apply_to_file("encoded.txt")
+        """
+        if len(self) == 0:
+            return
+
+        oldWords = [word.encode("utf-8") for word in self.oldWords]
+        newWords = [word.encode("utf-8") for word in self.newWords]
+        resize = self.first_resize()
+
+        with open(path, "rb" if resize is not None else "r+b") as file:
+            access = mmap.ACCESS_READ if resize is not None else mmap.ACCESS_WRITE
+            with mmap.mmap(file.fileno(), 0, access=access) as mapped:
+                for byteStart, oldWord in zip(self.byteStarts, oldWords):
+                    if mapped[byteStart:byteStart + len(oldWord)] != oldWord:
+                        raise ValueError("The patch does not belong to the provided text.")
+
+                if resize is None:
+                    for byteStart, newWord in zip(self.byteStarts, newWords):
+                        mapped[byteStart:byteStart + len(newWord)] = newWord
+                    mapped.flush()
+                    return
+
+                temporaryPath = self.__writePatchedCopy(path, mapped, oldWords, newWords, resize)
+
+        # the file is only replaced once it is closed
+        try:
+            shutil.copymode(path, temporaryPath)
+            os.replace(temporaryPath, path)
+        except BaseException:
+            os.remove(temporaryPath)
+            raise
+
+    def __writePatchedCopy(self, path: str, mapped: mmap.mmap, oldWords: list[bytes], newWords: list[bytes],
+                           resize: int) -> str:
+        """
+        Writes the patched content of a mapped file to a temporary file next to it.
+
+        Args:
+            path (str): The path of the file.
+            mapped (mmap.mmap): The mapped content of the file.
+            oldWords (list[bytes]): The encoded words found in the file.
+            newWords (list[bytes]): The encoded words replacing them.
+            resize (int): The position of the first replacement changing the length.
+
+        Returns:
+            str: The path of the temporary file.
+        """
+        descriptor, temporaryPath = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-")
+        try:
+            with os.fdopen(descriptor, "wb") as temporary, memoryview(mapped) as view:
+                temporary.write(view[:self.byteStarts[resize]])
+                for position in range(resize):
+                    temporary.seek(self.byteStarts[position])
+                    temporary.write(newWords[position])
+                temporary.seek(self.byteStarts[resize])
+
+                copiedUntil = self.byteStarts[resize]
+                for position in range(resize, len(oldWords)):
+                    byteStart = self.byteStarts[position]
+                    temporary.write(view[copiedUntil:byteStart])
+                    temporary.write(newWords[position])
+                    copiedUntil = byteStart + len(oldWords[position])
+                temporary.write(view[copiedUntil:])
+        except BaseException:
+            os.remove(temporaryPath)
+            raise
+
+        return temporaryPath
+
+    def __len__(self) -> int:
+        return len(self.oldWords)
+
+    def __iter__(self) -> Iterator[tuple[int, str, str]]:
+        return zip(self.starts, self.oldWords, self.newWords)
+
+    def __repr__(self) -> str:
+        return f"SubstitutionPatch({list(self)!r})"
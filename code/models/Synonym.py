@@ -9,7 +9,15 @@ class Synonym:
     Methods:
         __init__(word: str, synonym: str):
             Initializes the Synonym object with a word and its synonym.
+
+        words -> list[str]:
+            The word and its synonym, ordered by the bit they translate to.
+
+        bitCount() -> int:
+            Returns the number of bits an occurrence of the pair carries.
     """
+    # a configuration may hold millions of pairs, so they are stored without an instance dictionary
+    __slots__ = ('word', 'synonym')
 
     word: str
     synonym: str
@@ -31,3 +39,20 @@ class Synonym:
         """
         self.word = word
         self.synonym = synonym
+
+    @property
+    def words(self) -> list[str]:
+        """
+        The word and its synonym, ordered by the bit they translate to. This allows a pair to be
+        treated like a `SynonymGroup` of two words.
+        """
+        return [self.word, self.synonym]
+
+    def bitCount(self) -> int:
+        """
+        Returns the number of bits an occurrence of the pair carries, which is always one.
+
+        Returns:
+            int: The number of bits.
+        """
+        return 1
@@ -0,0 +1,42 @@
+class SynonymGroup:
+    """
+    A class representing a group of interchangeable words, used in steganographic encoding.
+    A group of 2^k words carries k bits per occurrence: the word at position i of the group
+    translates to the k bits of the number i.
+
+    Attributes:
+        words (list[str]): The words of the group, their number being a power of two.
+
+    Methods:
+        __init__(words: list[str]):
+            Initializes the SynonymGroup object with its words.
+
+        bitCount() -> int:
+            Returns the number of bits an occurrence of the group carries.
+    """
+    __slots__ = ('words',)
+
+    words: list[str]
+
+    def __init__(self, words: list[str]):
+        """
+        Initializes the SynonymGroup object with its words.
+
+        Args:
+            words (list[str]): The words of the group.
+
+        Example:
+            >>> group = SynonymGroup(["big", "large", "huge", "vast"])
+            >>> group.bitCount()
+            2
+        """
+        self.words = words
+
+    def bitCount(self) -> int:
+        """
+        Returns the number of bits an occurrence of the group carries.
+
+        Returns:
+            int: The binary logarithm of the number of words.
+        """
+        return len(self.words).bit_length() - 1
@@ -0,0 +1,499 @@
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+from concurrent.futures import BrokenExecutor
+
+from helpers.codecHelper import CodecHelper
+from models.ServiceMetrics import ServiceMetrics
+from steganography import Steganograph, _processPool
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_REQUEST_SIZE = 16 << 20
+INLINE_LIMIT = 64 << 10
+OPERATIONS = ("encode", "decode", "capacity", "metrics")
+
+# The Steganograph of a worker process of the server, set once when the process starts.
+_serviceSteganograph: Steganograph | None = None
+
+class SteganographyServer:
+    """
+    An asyncio server answering encode, decode and capacity requests with a single Steganograph, so the
+    configuration is loaded once instead of once per request.
+
+    The protocol is line-delimited JSON over TCP: every request is one JSON object on one line, answered by
+    one JSON object on one line. A request holds an "operation", an optional "id" that is copied into the
+    response, and the texts of the operation:
+
+    - encode: "cover" and either "secret" or "secretBase64", answered with "text".
+    - decode: "text", answered with "secret" or, for a binary secret, "secretBase64".
+    - capacity: "cover", answered with "bits" and "bytes", the length of the longest text secret in the format
+      the server writes.
+    - metrics: answered with "metrics", the latencies of the answered requests.
+
+    Every response holds "ok", and "error" if the request failed. The Steganograph is never changed after the
+    server was created, so its compiled codebook can be shared by all connections without locking. Texts
+    longer than `inlineLimit` are processed by a pool of worker processes that receive the Steganograph once
+    when they start, shorter ones directly on the event loop, where they cost less than sending them to a worker.
+    At most `maxPending` requests are processed at the same time. Further requests are not read from their
+    connections until a slot is free, so clients sending faster than the server can answer are slowed down by TCP.
+
+    Attributes:
+        steganograph (Steganograph): The Steganograph used for all requests.
+        host (str): The address to listen on.
+        port (int): The port to listen on, 0 for any free port.
+        workers (int): The number of worker processes, 0 to process all requests on the event loop.
+        maxRequestSize (int): The maximum length of a request line in bytes.
+        maxPending (int): The maximum number of requests processed at the same time.
+        inlineLimit (int): The length of the longest text processed on the event loop.
+        metrics (ServiceMetrics): The latencies of the answered requests.
+
+    Methods:
+        __init__(steganograph: Steganograph, host: str, port: int, workers: int | None, maxRequestSize: int,
+                 maxPending: int | None, inlineLimit: int):
+            Initializes the server without starting it.
+
+        start() -> None:
+            Starts listening and the worker processes.
+
+        address -> tuple[str, int]:
+            The address and port the server listens on.
+
+        serve_forever() -> None:
+            Serves until the server is closed.
+
+        close() -> None:
+            Stops listening, closes the open connections and stops the worker processes.
+
+        handle_request(request: dict) -> dict:
+            Answers a single request.
+    """
+
+    steganograph: Steganograph
+    host: str
+    port: int
+    workers: int
+    maxRequestSize: int
+    maxPending: int
+    inlineLimit: int
+    metrics: ServiceMetrics
+
+    def __init__(self, steganograph: Steganograph, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 workers: int | None = None, maxRequestSize: int = MAX_REQUEST_SIZE, maxPending: int | None = None,
+                 inlineLimit: int = INLINE_LIMIT):
+        """
+        Initializes the server without starting it.
+
+        Args:
+            steganograph (Steganograph): The initialized Steganograph used for all requests.
+            host (str): The address to listen on (default is the loopback address).
+            port (int): The port to listen on, 0 for any free port (default is DEFAULT_PORT).
+            workers (int | None): The number of worker processes (default is the number of CPUs),
+                0 to process all requests on the event loop.
+            maxRequestSize (int): The maximum length of a request line in bytes (default is 16 MB).
+                A connection sending a longer request is answered with an error and closed.
+            maxPending (int | None): The maximum number of requests processed at the same time
+                (default is twice the number of workers, at least 4).
+            inlineLimit (int): The length of the longest text processed on the event loop (default is 64 KB).
+
+        Example:
+            >>> server = SteganographyServer(Steganograph("password.json"), port=0)
+            >>> await server.start()
+            >>> await server.serve_forever()
+        """
+        self.steganograph = steganograph
+        self.host = host
+        self.port = port
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.maxRequestSize = maxRequestSize
+        self.maxPending = max(4, 2 * self.workers) if maxPending is None else maxPending
+        self.inlineLimit = inlineLimit
+        self.metrics = ServiceMetrics()
+        self.__server: asyncio.AbstractServer | None = None
+        self.__executor = None
+        self.__pending: asyncio.Semaphore | None = None
+        self.__connections: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """
+        Starts listening and the worker processes.
+        """
+        if self.workers > 0:
+            self.__startExecutor()
+
+        self.__pending = asyncio.Semaphore(self.maxPending)
+        self.__server = await asyncio.start_server(self.__serveConnection, self.host, self.port,
+                                                   limit=self.maxRequestSize)
+
+    def __startExecutor(self) -> None:
+        """
+        Starts the pool of worker processes, which receive the Steganograph once when they start.
+        """
+        self.__executor = _processPool(self.workers, _initializeWorker, self.steganograph)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        The address and port the server listens on, which tells the port chosen for port 0.
+        """
+        return self.__server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        """
+        Serves until the server is closed or the task is cancelled.
+        """
+        try:
+            await self.__server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+
+    async def close(self) -> None:
+        """
+        Stops listening, closes the open connections and stops the worker processes. Requests in progress
+        are cancelled without an answer.
+        """
+        if self.__server is not None:
+            self.__server.close()
+            # before Python 3.12 wait_closed does not wait for the connections, so their handlers are cancelled
+            # and awaited here
+            connections = list(self.__connections)
+            for connection in connections:
+                connection.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
+            await self.__server.wait_closed()
+        if self.__executor is not None:
+            self.__executor.shutdown(cancel_futures=True)
+            self.__executor = None
+
+    async def handle_request(self, request: dict) -> dict:
+        """
+        Answers a single request and records its latency. The request is processed on the event loop or,
+        if its text is longer than `inlineLimit`, in a worker process.
+
+        Args:
+            request (dict): The decoded request.
+
+        Returns:
+            dict: The response, holding "ok" and either the result of the operation or an "error".
+
+        Example:
+            >>> await server.handle_request({"operation": "decode", "text": "I am joyful."})
+            {'ok': True, 'secret': '...'}
+        """
+        started = time.perf_counter()
+        operation = request.get("operation")
+        if operation not in OPERATIONS:
+            self.metrics.rejected += 1
+            return SteganographyServer.__response(request, error=f'The operation "{operation}" is unknown.')
+
+        self.metrics.inFlight += 1
+        try:
+            if operation == "metrics":
+                response = SteganographyServer.__response(request, {"metrics": self.metrics.to_dict()})
+            else:
+                text = request.get("text" if operation == "decode" else "cover")
+                executor = self.__executor
+                try:
+                    if executor is not None and isinstance(text, str) and len(text) > self.inlineLimit:
+                        result = await asyncio.get_running_loop().run_in_executor(executor, _processInWorker, request)
+                    else:
+                        result = _processRequest(self.steganograph, request)
+                except BrokenExecutor:
+                    # a worker process died, e.g. killed for lack of memory, and took the whole pool with it; the
+                    # first request noticing it replaces the pool
+                    if self.__executor is executor:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        self.__startExecutor()
+                    result = None, "A worker process failed while processing the request."
+                except Exception as error:
+                    # any other failure only fails this request, the connection goes on with the next one
+                    result = None, f"The request could not be processed: {type(error).__name__}."
+                response = SteganographyServer.__response(request, *result)
+        finally:
+            self.metrics.inFlight -= 1
+
+        self.metrics.record(operation, time.perf_counter() - started, response["ok"])
+        return response
+
+    async def __serveConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Answers the requests of a connection one after another until the client closes it.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of requests.
+            writer (asyncio.StreamWriter): The stream of responses.
+        """
+        connection = asyncio.current_task()
+        self.__connections.add(connection)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # the request is longer than the limit, the rest of it cannot be told from the next one
+                    self.metrics.rejected += 1
+                    await SteganographyServer.__send(writer, SteganographyServer.__response(
+                        {}, error=f"The request exceeds {self.maxRequestSize} bytes."))
+                    return
+                if not line:
+                    return
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                except (UnicodeDecodeError, json.JSONDecodeError, RecursionError):
+                    # a RecursionError is raised for JSON that is nested too deeply
+                    request = None
+                if not isinstance(request, dict):
+                    self.metrics.rejected += 1
+                    response = SteganographyServer.__response({}, error="The request is not a JSON object.")
+                else:
+                    # the next request of the connection is only read once this one got a slot and was answered,
+                    # which applies backpressure to the client
+                    async with self.__pending:
+                        response = await self.handle_request(request)
+
+                await SteganographyServer.__send(writer, response)
+        except (ConnectionError, asyncio.CancelledError):
+            # the handler is cancelled when the server is closed, asyncio reports a cancelled handler as an error
+            pass
+        finally:
+            self.__connections.discard(connection)
+            writer.close()
+
+    @staticmethod
+    async def __send(writer: asyncio.StreamWriter, response: dict) -> None:
+        writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+        await writer.drain()
+
+    @staticmethod
+    def __response(request: dict, result: dict | None = None, error: str | None = None) -> dict:
+        response = {"id": request["id"]} if "id" in request else {}
+        if error is not None:
+            response.update(ok=False, error=error)
+        else:
+            response.update(ok=True, **result)
+        return response
+
+class ServiceClient:
+    """
+    A client sending requests to a `SteganographyServer` over a single connection.
+
+    Methods:
+        connect(host: str, port: int) -> ServiceClient:
+            Opens a connection to a server.
+
+        request(operation: str, **fields) -> dict:
+            Sends a request and returns its response.
+
+        close() -> None:
+            Closes the connection.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Initializes the client with an open connection, use `connect` to open one.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of responses.
+            writer (asyncio.StreamWriter): The stream of requests.
+        """
+        self.__reader = reader
+        self.__writer = writer
+
+    @staticmethod
+    async def connect(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> "ServiceClient":
+        """
+        Opens a connection to a server.
+
+        Args:
+            host (str): The address of the server (default is the loopback address).
+            port (int): The port of the server (default is DEFAULT_PORT).
+
+        Returns:
+            ServiceClient: The connected client.
+
+        Example:
+            >>> client = await ServiceClient.connect(port=8765)
+            >>> await client.request("encode", cover="I am happy.", secret="")
+            {'ok': True, 'text': '...'}
+        """
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_REQUEST_SIZE)
+        return ServiceClient(reader, writer)
+
+    async def request(self, operation: str, **fields) -> dict:
+        """
+        Sends a request and returns its response.
+
+        Args:
+            operation (str): The operation to request.
+            **fields: The further fields of the request, like "cover" and "secret".
+
+        Returns:
+            dict: The decoded response.
+
+        Raises:
+            ConnectionError: If the server closed the connection without answering.
+        """
+        self.__writer.write(json.dumps({"operation": operation, **fields}).encode('utf-8') + b"\n")
+        await self.__writer.drain()
+        line = await self.__reader.readline()
+        if not line:
+            raise ConnectionError("The server closed the connection.")
+        return json.loads(line)
+
+    async def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        self.__writer.close()
+        try:
+            await self.__writer.wait_closed()
+        except ConnectionError:
+            pass
+
+def _processRequest(steganograph: Steganograph, request: dict) -> tuple[dict | None, str | None]:
+    """
+    Processes an encode, decode or capacity request.
+
+    Args:
+        steganograph (Steganograph): The Steganograph to use.
+        request (dict): The decoded request.
+
+    Returns:
+        tuple[dict | None, str | None]: The result of the operation, or None and the error message.
+    """
+    operation = request["operation"]
+    try:
+        if operation == "decode":
+            secret = steganograph.read(_requireText(request, "text"))
+            if isinstance(secret, str):
+                return {"secret": secret}, None
+            return {"secretBase64": base64.b64encode(secret).decode('ascii')}, None
+
+        cover = _requireText(request, "cover")
+        if operation == "capacity":
+            coverIndex = steganograph.index_cover(cover)
+            return {"bits": coverIndex.capacity_bits, "bytes": steganograph.secret_capacity(coverIndex)}, None
+
+        if "secretBase64" in request:
+            secret = base64.b64decode(_requireText(request, "secretBase64"), validate=True)
+        else:
+            secret = _requireText(request, "secret")
+        return {"text": steganograph.write(cover, secret)}, None
+    except ValueError as error:
+        return None, str(error)
+
+def _requireText(request: dict, field: str) -> str:
+    """
+    Returns a text field of a request.
+
+    Args:
+        request (dict): The decoded request.
+        field (str): The name of the field.
+
+    Returns:
+        str: The value of the field.
+
+    Raises:
+        ValueError: If the field is missing or not a string.
+    """
+    value = request.get(field)
+    if not isinstance(value, str):
+        raise ValueError(f'The request needs the text "{field}".')
+    return value
+
+def _initializeWorker(steganograph: Steganograph) -> None:
+    """
+    Stores the Steganograph sent to a worker process of the server when the process starts.
+
+    Args:
+        steganograph (Steganograph): The Steganograph used for all requests of the worker.
+    """
+    global _serviceSteganograph
+    _serviceSteganograph = steganograph
+
+def _processInWorker(request: dict) -> tuple[dict | None, str | None]:
+    """
+    Processes a request in a worker process with the Steganograph of the worker.
+
+    Args:
+        request (dict): The decoded request.
+
+    Returns:
+        tuple[dict | None, str | None]: The result of the operation, or None and the error message.
+    """
+    return _processRequest(_serviceSteganograph, request)
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Loads the configuration once and serves requests until the process is interrupted.
+
+    Args:
+        arguments (list[str] | None): The command-line arguments without the program name
+            (default is None, which uses sys.argv).
+
+    Returns:
+        int: The exit code, 0 after an interruption and 1 if the server could not be started.
+
+    Example:
+        $ python ./code/server.py --config password.json --port 8765
+        listening on 127.0.0.1:8765
+    """
+    parser = argparse.ArgumentParser(prog="server.py", description="Serves encode and decode requests "
+                                                                   "as line-delimited JSON over TCP.")
+    parser.add_argument("--config", required=True, help="the JSON file with the synonyms")
+    parser.add_argument("--cache-dir", help="a directory to cache the compiled configuration in")
+    parser.add_argument("--ignore-case", action="store_true", help="find carriers regardless of their case")
+    parser.add_argument("--compact", action="store_true", help="keep the synonyms in a compact, shareable table")
+    parser.add_argument("--framed", action="store_true", help="write secrets as length-prefixed frames")
+    parser.add_argument("--checksum", action="store_true", help="add a CRC32 checksum to framed secrets")
+    parser.add_argument("--compression", choices=CodecHelper.names() + ["auto"], help="compress secrets")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="the address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="the port to listen on")
+    parser.add_argument("--workers", type=int, help="the number of worker processes for long texts")
+    parser.add_argument("--max-request-size", type=int, default=MAX_REQUEST_SIZE,
+                        help="the maximum length of a request in bytes")
+    parser.add_argument("--max-pending", type=int, help="the maximum number of requests processed at once")
+    parser.add_argument("--inline-limit", type=int, default=INLINE_LIMIT,
+                        help="the length of the longest text processed without a worker")
+    parsedArguments = parser.parse_args(arguments)
+
+    try:
+        steganograph = Steganograph(parsedArguments.config, framed=parsedArguments.framed,
+                                    checksum=parsedArguments.checksum, cacheDirectory=parsedArguments.cache_dir,
+                                    ignoreCase=parsedArguments.ignore_case, compression=parsedArguments.compression,
+                                    compact=parsedArguments.compact)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    server = SteganographyServer(steganograph, parsedArguments.host, parsedArguments.port, parsedArguments.workers,
+                                 parsedArguments.max_request_size, parsedArguments.max_pending,
+                                 parsedArguments.inline_limit)
+
+    async def serve() -> None:
+        await server.start()
+        host, port = server.address
+        print(f"listening on {host}:{port}", file=sys.stderr)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except OSError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,38 @@
-from helpers.bitHelper import BitHelper
+import gc
+import hashlib
+import json
+import os
+import time
+from array import array
+from collections import deque
+from contextlib import closing, contextmanager
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Sequence, TextIO
+
+from helpers.bitHelper import BitArray, BitHelper
 from helpers.fileHelper import FileHelper
+from helpers.frameHelper import FrameHelper
+from helpers.tokenHelper import TokenHelper
+from models.BatchResult import BatchResult
+from models.Codebook import Codebook
+from models.CoverIndex import CoverIndex
+from models.CoverLibrary import CoverLibrary
+from models.EmbeddedSecret import EmbeddedSecret
+from models.OperationStats import OperationStats
+from models.SecretDecoder import SecretDecoder
+from models.SecretReader import SecretReader
+from models.StatsObserver import StatsObserver
+from models.SubstitutionPatch import SubstitutionPatch
 from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    # the backends are imported where they are selected, as every instance uses only one of them and
+    # importing all would slow down the start of the command-line interface
+    from models.CompactCodebook import CompactCodebook
+    from models.DiskCodebook import DiskCodebook
 
 class Steganograph:
     """
@@ -9,51 +41,219 @@ class Steganograph:
 
     Attributes:
         LENGTH-OF-BYTE: A constand defining the number of bits that result in a byte
+        CHUNK_SIZE (int): The default number of characters read at once by the streaming methods.
+        SEGMENT_SIZE (int): The default number of characters a text is split into by the parallel methods.
+        STATS_WINDOW_SIZE (int): The number of characters tokenized at once while statistics are collected.
+        CODEBOOK_CACHE_VERSION (bytes): Part of the key of cached codebooks, changed whenever their format changes.
         END_OF_SECRET (list[int]): A constant marking the end of the hidden message in a bit array.
-        synonyms (list[Synonym]): A list of `Synonym` objects used for encoding and decoding.
+        synonyms (Sequence[Synonym | SynonymGroup]): The pairs and groups used for encoding and decoding.
+        codebook (Codebook | CompactCodebook | DiskCodebook | None): The compiled lookup table of `synonyms`,
+            built once from the configuration.
+        framed (bool): Whether secrets are written as length-prefixed frames instead of using the END_OF_SECRET.
+        checksum (bool): Whether framed secrets carry a CRC32 checksum.
+        compression (str | None): The codec compressing secrets before they are embedded, if set.
+        ignoreCase (bool): Whether carriers are found regardless of their case, keeping the case when replaced.
+        compact (bool): Whether the configuration is compiled into a `CompactCodebook`.
         isInitialized (bool): A flag indicating if the configuration has been successfully loaded.
+        observer (StatsObserver | None): Receives the statistics of every write and read, if set.
 
     Methods:
-        __init__(pathToConfig: str) -> None:
+        __init__(pathToConfig: str, framed: bool, checksum: bool, cacheDirectory: str | None,
+                 observer: StatsObserver | None, ignoreCase: bool, compression: str | None, compact: bool) -> None:
             Initializes the Steganograph object and loads configuration from the provided JSON file.
+
+        convert_config(pathToConfig: str, pathToCodebook: str, ignoreCase: bool) -> None:
+            Converts a JSON configuration into a disk-backed codebook file without loading it as a whole.
         
-        write(textToWriteTo: str, hiddenText: str) -> str:
+        write(textToWriteTo: str, hiddenText: str | bytes, coverIndex: CoverIndex | None) -> str:
             Hides the `hiddenText` inside the `textToWriteTo` using synonyms and bit-level encoding.
+
+        index_cover(textToWriteTo: str) -> CoverIndex:
+            Records the carrier words of a cover text for capacity checks and repeated writes.
+
+        rewrite(encodedText: str, hiddenText: str | bytes, coverIndex: CoverIndex | None) -> SubstitutionPatch:
+            Returns the carrier words to replace to hide a new secret in an encoded text.
+
+        write_in_place(pathToFile: str, hiddenText: str | bytes, coverIndex: CoverIndex | None) -> SubstitutionPatch:
+            Hides the `hiddenText` inside a file by replacing only the carrier words that change.
         
-        read(textToReadFrom: str) -> str:
+        read(textToReadFrom: str) -> str | bytes:
             Extracts the hidden message from the `textToReadFrom` text using synonym substitution.
+
+        write_stream(source: TextIO | Iterable[str], destination: TextIO, hiddenText: str | bytes) -> None:
+            Hides the `hiddenText` inside a text read chunk by chunk and writes the result to `destination`.
+
+        read_stream(source: TextIO | Iterable[str]) -> str | bytes:
+            Extracts the hidden message from a text read chunk by chunk.
+
+        read_mapped_file(pathToFile: str) -> str | bytes:
+            Extracts the hidden message from a memory-mapped file, stopping at the end of the secret.
+
+        read_all(source: str | TextIO | Iterable[str], chunkSize: int) -> Iterator[EmbeddedSecret]:
+            Extracts every secret of a text that holds several secrets one after another.
+
+        decoder(checkpoint: dict | None) -> SecretDecoder:
+            Creates a decoder that extracts the hidden message from a text fed to it piece by piece.
+
+        read_many(paths: Iterable[str]) -> Iterator[BatchResult]:
+            Extracts the hidden messages of many files in parallel worker processes.
+
+        write_many(jobs: Iterable[tuple[str, str, str]]) -> Iterator[BatchResult]:
+            Hides messages inside many files in parallel worker processes.
+
+        write_parallel(textToWriteTo: str, hiddenText: str | bytes, workers: int | None, segmentSize: int) -> str:
+            Hides the `hiddenText` inside a large text whose segments are scanned in parallel worker processes.
+
+        read_parallel(textToReadFrom: str, workers: int | None, segmentSize: int) -> str | bytes:
+            Extracts the hidden message from a large text whose segments are decoded in parallel worker processes.
+
+        read_bits(textToReadFrom: str) -> BitArray:
+            Extracts the bits of all carrier words of a text.
+
+        secret_bits(hiddenText: str | bytes) -> int:
+            Returns the number of bits needed to hide a secret with the current settings.
+
+        secret_capacity(coverIndex: CoverIndex) -> int:
+            Returns the number of text bytes an indexed cover can hold with the current settings.
+
+        update_library(library: CoverLibrary, paths: Iterable[str]) -> int:
+            Records the capacity of new and changed covers of a cover library.
+
+        select_cover(library: CoverLibrary, hiddenText: str | bytes) -> str:
+            Returns the cover of a library with the smallest capacity that fits a secret.
         
+        __getCodebook() -> Codebook:
+            Returns the compiled codebook of the current synonyms.
+
         __validateAndApplyConfig(jsonData: Any) -> None:
             Validates and applies the configuration for the synonyms from a JSON object.
+
+        __parseConfigItem(item: Any, index: int) -> Synonym | SynonymGroup:
+            Validates a single item of the configuration.
+
+        __applyCachedConfig(pathToConfig: str, cacheDirectory: str) -> None:
+            Applies the configuration from the codebook cache, compiling and caching it if necessary.
     """
     LENGTH_OF_BYTE: int = 8
+    CODEBOOK_CACHE_VERSION: bytes = b"codebook-cache-2\0"
+    CHUNK_SIZE: int = 1 << 20
+    SEGMENT_SIZE: int = 1 << 22
+    STATS_WINDOW_SIZE: int = 1 << 16
     END_OF_SECRET = [1, 1, 1, 1, 1, 1, 1, 1]  # extremely rare unicode character
-    synonyms: list[Synonym]
+    synonyms: Sequence[Synonym | SynonymGroup]
+    codebook: "Codebook | CompactCodebook | DiskCodebook | None" = None
+    framed: bool = False
+    checksum: bool = False
+    compression: str | None = None
+    observer: StatsObserver | None = None
+    ignoreCase: bool = False
+    compact: bool = False
     isInitialized: bool
 
-    def __init__(self, pathToConfig: str) -> None:
+    def __init__(self, pathToConfig: str, framed: bool = False, checksum: bool = False,
+                 cacheDirectory: str | None = None, observer: StatsObserver | None = None,
+                 ignoreCase: bool = False, compression: str | None = None, compact: bool = False) -> None:
         """
         Initializes the Steganograph object by loading and applying a configuration file.
 
         Args:
-            pathToConfig (str): The file path to the JSON configuration file containing synonyms.
+            pathToConfig (str): The file path to the JSON configuration file containing synonyms, or to a
+                codebook file created by `convert_config`. Such a file is opened instantly and looked up lazily,
+                `cacheDirectory` and `compact` do not apply to it.
+            framed (bool): Whether secrets are written as length-prefixed frames instead of being
+                followed by the END_OF_SECRET (default is False). Reading detects the format automatically.
+            checksum (bool): Whether framed secrets carry a CRC32 checksum (default is False).
+            cacheDirectory (str | None): A directory in which the compiled codebook is cached (default is None).
+                Later constructions with an unchanged configuration memory-map the codebook from there instead
+                of parsing and validating the JSON again.
+            observer (StatsObserver | None): Receives the statistics of every write and read (default is None).
+                Collecting statistics splits the processing of a text into separately timed phases, without
+                an observer no statistics are collected.
+            ignoreCase (bool): Whether carriers are found regardless of their case (default is False), so that
+                e.g. "Happy" at the start of a sentence is a carrier, too. The word replacing a carrier is written
+                in upper case or with an upper case first letter like the carrier. Texts have to be read with the
+                same setting they were written with.
+            compression (str | None): The codec compressing secrets before they are embedded: "zlib", "lzma",
+                "huffman" for short English texts, or "auto" for the one needing the fewest carriers
+                (default is None). Compressed secrets are always framed, reading decompresses them automatically.
+            compact (bool): Whether the configuration is compiled into a `CompactCodebook` (default is False), which
+                needs a fraction of the memory for large configurations. `synonyms` is then a read-only view of
+                the codebook. With a `cacheDirectory` the cached codebook is memory-mapped, so all processes
+                using the same configuration, including the workers of the batch and parallel methods, share it.
 
         Raises:
-            ValueError: If the configuration file format is invalid.
+            ValueError: If the configuration file format is invalid, the compression is unknown, or a codebook
+                file was converted with another `ignoreCase`.
         """
         self.synonyms = list()
+        self.framed = framed
+        self.checksum = checksum
+        self.observer = observer
+        self.ignoreCase = ignoreCase
+        self.compression = compression
+        self.compact = compact
         self.isInitialized = False
-        self.__validateAndApplyConfig(FileHelper.read_json_file(pathToConfig))
+
+        if compression is not None and compression != "auto":
+            # imported here, as only compressed secrets need the codecs
+            from helpers.codecHelper import CodecHelper
+            if compression not in CodecHelper.names():
+                raise ValueError(f'The compression "{compression}" is unknown.')
+
+        # the codebook consists of many small objects without cycles, so garbage collection runs during
+        # its construction would only cost time
+        with _pausedGarbageCollection():
+            if FileHelper.is_sqlite_file(pathToConfig):
+                # imported here, as only disk-backed codebooks need sqlite3
+                from models.DiskCodebook import DiskCodebook
+                self.codebook = DiskCodebook(pathToConfig)
+                if self.codebook.ignoreCase != ignoreCase:
+                    raise ValueError("The codebook file was converted with another case setting.")
+                self.synonyms = self.codebook.synonyms
+            elif cacheDirectory is None:
+                self.__validateAndApplyConfig(FileHelper.read_json_file(pathToConfig))
+            else:
+                self.__applyCachedConfig(pathToConfig, cacheDirectory)
+
         self.isInitialized = True
 
-    def write(self, textToWriteTo: str, hiddenText: str) -> str:
+    @staticmethod
+    def convert_config(pathToConfig: str, pathToCodebook: str, ignoreCase: bool = False) -> None:
+        """
+        Converts a JSON configuration into a codebook file that a Steganograph opens instantly and looks up
+        lazily, see `DiskCodebook`. The configuration is parsed item by item, so even dictionaries larger
+        than the memory can be converted. The items are validated like those of a JSON configuration.
+
+        Args:
+            pathToConfig (str): The file path to the JSON configuration file containing synonyms.
+            pathToCodebook (str): The path of the codebook file to write.
+            ignoreCase (bool): Whether carriers are found regardless of their case (default is False).
+                The codebook can only be used with the same setting.
+
+        Raises:
+            ValueError: If the configuration file format or synonym structure is invalid.
+
+        Example:
+            >>> Steganograph.convert_config("password.json", "password.sqlite")
+            >>> steganograph = Steganograph("password.sqlite")
+        """
+        from models.DiskCodebook import DiskCodebook
+
+        items = FileHelper.iter_json_array(pathToConfig)
+        DiskCodebook.convert((Steganograph.__parseConfigItem(item, index) for index, item in enumerate(items)),
+                             pathToCodebook, ignoreCase)
+
+    def write(self, textToWriteTo: str, hiddenText: str | bytes, coverIndex: CoverIndex | None = None) -> str:
         """
         Hides the provided `hiddenText` inside `textToWriteTo` using synonyms for encoding
         and bit-level manipulation.
 
         Args:
             textToWriteTo (str): The text in which the hidden message will be embedded.
-            hiddenText (str): The message to hide inside the main text.
+            hiddenText (str | bytes): The message to hide inside the main text. Bytes are always written
+                as a frame.
+            coverIndex (CoverIndex | None): The index of `textToWriteTo` built by `index_cover`. If given,
+                the capacity is checked before any work is done and only the indexed carriers are touched.
 
         Returns:
             str: The text with the hidden message encoded.
@@ -65,55 +265,32 @@ class Steganograph:
             >>> steganograph.write("This is a sample text.", "secret")
             'This is a synonym-based encoded text.'
         """
-        textToWriteToIndex = 0
-        currentWord = ""
-        generatedText = ""
-        bits = BitHelper.string_to_bit_array(hiddenText).__add__(self.END_OF_SECRET)
-        currentBitIndex = 0
+        parts: list[str] = []
+        stats = self.__startStats("write")
+        bits = self.__secretBits(hiddenText, stats)
 
-        while textToWriteToIndex < len(textToWriteTo):
-            char = textToWriteTo[textToWriteToIndex]
-            textToWriteToIndex += 1
+        if coverIndex is not None:
+            encodedText = self.__embedIndexed(textToWriteTo, bits, coverIndex, stats)
+            if stats is not None:
+                self.__completeStats(stats)
+            return encodedText
 
-            # read until non-alphabetic character, which means word is complete
-            if char.isalpha():
-                currentWord += char
-                continue
+        currentBitIndex, copiedUntil = self.__embed(textToWriteTo, len(textToWriteTo), bits, 0, parts.append, stats)
 
-            # if no word exists, continue
-            if len(currentWord) == 0:
-                generatedText += char
-                continue
+        # if the secret text is completed, return the whole text
+        if currentBitIndex >= len(bits):
+            parts.append(textToWriteTo[copiedUntil:])
+            if stats is None:
+                return ''.join(parts)
 
-            # find match for current word
-            match: Synonym | None = None
-            for synonym in self.synonyms:
-                if currentWord == synonym.word or currentWord == synonym.synonym:
-                    match = synonym
-                    break  
+            with stats.phase("join"):
+                encodedText = ''.join(parts)
+            self.__completeStats(stats)
+            return encodedText
 
-            if match is None:
-                generatedText += currentWord
-            else:
-                # if match is found, replace it with synonym depending on currentBit
-                currentBit = bits[currentBitIndex]
-                currentBitIndex += 1
-                
-                if currentBit == 0:
-                    generatedText += match.word
-                else:
-                    generatedText += match.synonym
-            
-            currentWord = ""
-            generatedText += char
-
-            # if the secret text is completed, return the whole text
-            if currentBitIndex == len(bits):
-                return generatedText + textToWriteTo[textToWriteToIndex:]
-            
         raise ValueError("The provided text file is too small to hide your text.")
 
-    def read(self, textToReadFrom: str) -> str:
+    def read(self, textToReadFrom: str) -> str | bytes:
         """
         Extracts the hidden message from the provided text by decoding the synonyms back into bits.
 
@@ -121,7 +298,7 @@ class Steganograph:
             textToReadFrom (str): The text from which to extract the hidden message.
 
         Returns:
-            str: The hidden message extracted from the text.
+            str | bytes: The hidden message extracted from the text, or the raw bytes of a binary frame.
 
         Raises:
             ValueError: If no secret message is found in the text.
@@ -130,71 +307,1463 @@ class Steganograph:
             >>> steganograph.read("This is a synonym-based encoded text.")
             'secret'
         """
-        textToReadFromIndex = 0
-        currentWord = ""
-        secretTextBits: list[int] = []
+        stats = self.__startStats("read")
+        secret = self.__extract(textToReadFrom, len(textToReadFrom), self.__createReader(), stats)
 
-        while textToReadFromIndex < len(textToReadFrom):
-            char = textToReadFrom[textToReadFromIndex]
-            textToReadFromIndex += 1
+        if secret is None:
+            raise ValueError("No secret was found in the text.")
 
-            # read until non-alphabetic character, which means word is complete
-            if char.isalpha():
-                currentWord += char
-                continue
+        if stats is not None:
+            self.__completeStats(stats)
+        return secret
 
-            # if no word exists, continue
-            if len(currentWord) == 0:
-                continue
+    def index_cover(self, textToWriteTo: str) -> CoverIndex:
+        """
+        Scans a cover text once and records the position and pair of every carrier word. The index can be
+        passed to `write` for any number of secrets and saved next to frequently reused cover texts.
+
+        Args:
+            textToWriteTo (str): The cover text to index.
+
+        Returns:
+            CoverIndex: The index of the carrier words of the text.
+
+        Example:
+            >>> coverIndex = steganograph.index_cover(text)
+            >>> coverIndex.capacity_bytes
+            17
+            >>> steganograph.write(text, "secret", coverIndex)
+            'This is a synonym-based encoded text.'
+        """
+        codebook = self.__getCodebook()
+        starts, ends, pairIds = array("q"), array("q"), array("l")
+        capacityBits = 0
+
+        for start, end, pairId, _ in self.__iterCarriers(textToWriteTo, 0, len(textToWriteTo)):
+            starts.append(start)
+            ends.append(end)
+            pairIds.append(pairId)
+            capacityBits += codebook.bitCounts[pairId]
+
+        return CoverIndex(starts, ends, pairIds, capacityBits, len(textToWriteTo), CoverIndex.hash_text(textToWriteTo),
+                          codebook.fingerprint())
+
+    def rewrite(self, encodedText: str, hiddenText: str | bytes, coverIndex: CoverIndex | None = None) -> SubstitutionPatch:
+        """
+        Returns the carrier words to replace to hide a new secret in a text that already hides another one.
+        The bits of the new secret are compared with the bits of the carriers holding it, and only carriers
+        whose bits differ are replaced. Carriers behind the new secret keep their bits, as reading stops at
+        its end. With an index of the encoded text no tokenization is needed, so rotating a secret costs
+        time in proportion to the carriers of the new secret, not to the length of the text.
+
+        Args:
+            encodedText (str): The text hiding the old secret.
+            hiddenText (str | bytes): The new secret.
+            coverIndex (CoverIndex | None): The index of `encodedText` built by `index_cover` (default is None).
+
+        Returns:
+            SubstitutionPatch: The replacements, applied with `apply` or `apply_in_place`.
+
+        Raises:
+            ValueError: If the index does not belong to the text or the codebook, or if the text is too small.
+
+        Example:
+            >>> patch = steganograph.rewrite(encodedText, "new secret")
+            >>> len(patch)
+            23
+            >>> steganograph.read(patch.apply(encodedText))
+            'new secret'
+        """
+        codebook = self.__getCodebook()
+        bits = self.__secretBits(hiddenText)
+
+        if coverIndex is None:
+            carriers = self.__iterCarriers(encodedText, 0, len(encodedText))
+        elif coverIndex.textLength != len(encodedText) or coverIndex.codebookFingerprint != codebook.fingerprint():
+            raise ValueError("The cover index does not belong to the provided text.")
+        else:
+            carriers = self.__iterIndexedCarriers(encodedText, coverIndex)
+
+        return self.__createPatch(encodedText, carriers, bits, len(encodedText))
+
+    def write_in_place(self, pathToFile: str, hiddenText: str | bytes,
+                       coverIndex: CoverIndex | None = None) -> SubstitutionPatch:
+        """
+        Hides the `hiddenText` inside a UTF-8 encoded file, replacing only the carrier words whose bits
+        have to change, see `rewrite`. The file is memory-mapped and decoded only up to the last carrier of the
+        new secret, which the index tells in advance and which is otherwise found while decoding. The words are
+        written with `SubstitutionPatch.apply_to_file`, so unless a word changes the length of the text, the
+        data read and written depends on the size of the secret and not on the size of the file. The file then
+        reads like a file written by `write`, but words that keep their bits are left exactly as they were.
+
+        The whole file is still read if it is too small for the secret and no index is given, and the rest of
+        the file is copied if a replaced word changes the length of the text.
+
+        Args:
+            pathToFile (str): The path to the file in which to hide the message.
+            hiddenText (str | bytes): The message to hide.
+            coverIndex (CoverIndex | None): The index of the text of the file built by `index_cover`
+                (default is None).
+
+        Returns:
+            SubstitutionPatch: The replacements made in the file. Without an index, the length of the text is
+                unknown, as the file is not read to its end.
+
+        Raises:
+            ValueError: If the file is too small to hide the entire secret message, or if the index does not
+                belong to it.
+
+        Example:
+            >>> len(steganograph.write_in_place("cover.txt", "secret"))
+            21
+            >>> steganograph.read_mapped_file("cover.txt")
+            'secret'
+        """
+        bits = self.__secretBits(hiddenText)
+
+        # the chunks are decoded without translating newlines, so that the offsets of the words are those
+        # in the file, and only up to the last carrier of the new secret
+        with closing(FileHelper.iter_mapped_chunks(pathToFile, self.CHUNK_SIZE)) as chunks:
+            if coverIndex is None:
+                text, carriers = self.__readSecretCarriers(chunks, len(bits))
+                textLength = None
+            else:
+                text = self.__readPrefix(chunks, self.__indexedSecretEnd(coverIndex, len(bits)))
+                carriers = self.__iterIndexedCarriers(text, coverIndex)
+                textLength = coverIndex.textLength
+
+        patch = self.__createPatch(text, carriers, bits, textLength)
+        patch.apply_to_file(pathToFile)
+        return patch
+
+    def write_stream(self, source: TextIO | Iterable[str], destination: TextIO, hiddenText: str | bytes,
+                     chunkSize: int = CHUNK_SIZE) -> None:
+        """
+        Hides the provided `hiddenText` inside a text that is read chunk by chunk from `source` and
+        writes the result to `destination`. Only one chunk and the word cut off at its end are held
+        in memory. Once the secret is embedded, the rest of the source is copied through unchanged.
+
+        Args:
+            source (TextIO | Iterable[str]): A text file object or an iterable of text chunks.
+            destination (TextIO): A text file object the encoded text is written to.
+            hiddenText (str | bytes): The message to hide inside the text.
+            chunkSize (int): The number of characters read from a file object at once.
+
+        Raises:
+            ValueError: If the provided text is too small to hide the entire secret message. The text
+                written to `destination` up to that point is incomplete in this case.
+
+        Example:
+            >>> with open("cover.txt") as source, open("encoded.txt", "w") as destination:
+            ...     steganograph.write_stream(source, destination, "secret")
+        """
+        stats = self.__startStats("write_stream")
+        bits = self.__secretBits(hiddenText, stats)
+        currentBitIndex = 0
+        pendingWord = ""
+        chunks = FileHelper.iter_chunks(source, chunkSize)
+
+        for chunk in chunks:
+            # only the part up to the last non-alphabetic character contains complete words
+            buffer = pendingWord + chunk
+            completeUntil = self.__completePrefixLength(buffer)
+
+            currentBitIndex, copiedUntil = self.__embed(buffer, completeUntil, bits, currentBitIndex,
+                                                        destination.write, stats)
+
+            # if the secret text is completed, copy the rest of the source
+            if currentBitIndex >= len(bits):
+                destination.write(buffer[copiedUntil:])
+                if stats is None:
+                    for chunk in chunks:
+                        destination.write(chunk)
+                    return
+
+                self.__copyAndScan(buffer[completeUntil:], chunks, destination, stats)
+                self.__completeStats(stats)
+                return
+
+            destination.write(buffer[copiedUntil:completeUntil])
+            pendingWord = buffer[completeUntil:]
+            if stats is not None:
+                self.observer.onProgress(stats)
+
+        raise ValueError("The provided text file is too small to hide your text.")
+
+    def read_stream(self, source: TextIO | Iterable[str], chunkSize: int = CHUNK_SIZE) -> str | bytes:
+        """
+        Extracts the hidden message from a text that is read chunk by chunk from `source`.
+        Reading stops as soon as the end of the secret is found.
+
+        Args:
+            source (TextIO | Iterable[str]): A text file object or an iterable of text chunks.
+            chunkSize (int): The number of characters read from a file object at once.
+
+        Returns:
+            str | bytes: The hidden message extracted from the text, or the raw bytes of a binary frame.
+
+        Raises:
+            ValueError: If no secret message is found in the text.
+
+        Example:
+            >>> with open("encoded.txt") as source:
+            ...     steganograph.read_stream(source)
+            'secret'
+        """
+        reader = self.__createReader()
+        stats = self.__startStats("read_stream")
+        pendingWord = ""
+
+        for chunk in FileHelper.iter_chunks(source, chunkSize):
+            buffer = pendingWord + chunk
+            completeUntil = self.__completePrefixLength(buffer)
+
+            secret = self.__extract(buffer, completeUntil, reader, stats)
+            if secret is not None:
+                if stats is not None:
+                    self.__completeStats(stats)
+                return secret
+
+            pendingWord = buffer[completeUntil:]
+            if stats is not None:
+                self.observer.onProgress(stats)
 
-            # find match for current word
-            match: Synonym | None = None
-            for synonym in self.synonyms:
-                if currentWord == synonym.word or currentWord == synonym.synonym:
-                    match = synonym
-                    break
-            
-            if match is not None:
-                # if match is found, translate match to secret coding and append to secretTextBits
-                if currentWord == synonym.word:
-                    secretTextBits.append(0)
-                else:
-                    secretTextBits.append(1)
-                
-                # if the newest bits equal the END_OF_SECRET, convert and return the secret
-                if len(secretTextBits) % self.LENGTH_OF_BYTE == 0 and len(secretTextBits) > len(self.END_OF_SECRET):
-                    if secretTextBits[-len(self.END_OF_SECRET):] == self.END_OF_SECRET:
-                        return BitHelper.bits_to_char(secretTextBits[:-len(self.END_OF_SECRET)])
-            currentWord = ""
-            
         raise ValueError("No secret was found in the text.")
 
-    def __validateAndApplyConfig(self, jsonData: dict | list) -> None:
+    def read_mapped_file(self, pathToFile: str, chunkSize: int = CHUNK_SIZE) -> str | bytes:
         """
-        Validates and applies the configuration for synonyms from a given JSON data.
+        Extracts the hidden message from a UTF-8 encoded file without reading the whole file. The file is
+        memory-mapped and decoded chunk by chunk until the end of the secret is found, so the cost depends
+        on the position of the secret and not on the size of the file.
 
         Args:
-            jsonData (dict | list): The JSON data containing the configuration for the synonyms.
+            pathToFile (str): The path to the file from which to extract the hidden message.
+            chunkSize (int): The number of bytes decoded at once.
+
+        Returns:
+            str | bytes: The hidden message extracted from the file, or the raw bytes of a binary frame.
 
         Raises:
-            ValueError: If the configuration file format or synonym structure is invalid.
+            ValueError: If no secret message is found in the file.
+
+        Example:
+            >>> steganograph.read_mapped_file("encoded.txt")
+            'secret'
         """
-        if not isinstance(jsonData, list):
-            raise ValueError("The configuration file has a wrong format.")
+        with closing(FileHelper.iter_mapped_chunks(pathToFile, chunkSize)) as chunks:
+            return self.read_stream(chunks, chunkSize)
 
-        for index in range(len(jsonData)):
-            item = jsonData[index]
-            
-            if isinstance(item, dict):
-                item = Synonym(word=item['word'], synonym=item['synonym'])
+    def read_all(self, source: str | TextIO | Iterable[str], chunkSize: int = CHUNK_SIZE) -> Iterator[EmbeddedSecret]:
+        """
+        Extracts every secret of a text holding several secrets one after another, like concatenated
+        documents or a text into whose remaining carriers further secrets were written. After the end of
+        a secret, reading starts over with the next carrier. The text is read in a single pass, chunk by
+        chunk if it is a stream, and every secret is yielded as soon as its end is found.
 
-            if not isinstance(item, Synonym): 
-                raise ValueError(f"The value with the index {index} is invalid.")
-            
-            for existingSynonym in self.synonyms:
-                if existingSynonym.synonym == item.synonym or existingSynonym.word == item.synonym:
-                    raise ValueError(f'The synonym "{item.synonym}" exists at least two times.')
-                if existingSynonym.synonym == item.word or existingSynonym.word == item.word:
-                    raise ValueError(f'The synonym "{item.word}" exists at least two times.')
+        Carriers that follow a secret without holding another one are read like a secret, too. Their bits
+        rarely end like a secret, and if they do, framed secrets with a checksum let such a result be told
+        apart by its error. Bits that cannot be decoded produce a result with an error, and reading goes on
+        behind them. A secret that is not complete at the end of the text is not yielded.
 
-            self.synonyms.append(item)
+        Args:
+            source (str | TextIO | Iterable[str]): The text, a text file object or an iterable of text chunks.
+            chunkSize (int): The number of characters read from a file object at once.
+
+        Returns:
+            Iterator[EmbeddedSecret]: The secrets in the order of the text, with the position of their carriers.
+
+        Example:
+            >>> first = steganograph.write(cover, "first")
+            >>> end = next(steganograph.read_all(first)).end
+            >>> both = first[:end] + steganograph.write(first[end:], "second")
+            >>> [secret.value for secret in steganograph.read_all(both)]
+            ['first', 'second']
+        """
+        bitCounts = self.__getCodebook().bitCounts
+        reader = self.__createReader()
+        # the index of the first character of the buffer in the whole text
+        offset = 0
+        carrierNumber = 0
+        firstCarrier = firstStart = None
+        pendingWord = ""
+
+        for chunk in FileHelper.iter_chunks(source, chunkSize):
+            buffer = pendingWord + chunk
+            completeUntil = self.__completePrefixLength(buffer)
+
+            for start, end, pairId, value in self.__iterCarriers(buffer, 0, completeUntil):
+                if firstStart is None:
+                    firstStart, firstCarrier = offset + start, carrierNumber
+                carrierNumber += 1
+
+                secret, error, isComplete = None, None, False
+                try:
+                    # a group carries several bits, the most significant one first
+                    for shift in range(bitCounts[pairId] - 1, -1, -1):
+                        isComplete = reader.push(value >> shift & 1)
+                        if isComplete:
+                            break
+                    if isComplete:
+                        secret = reader.result()
+                except ValueError as exception:
+                    error, isComplete = exception, True
+                if not isComplete:
+                    continue
+
+                # the remaining bits of the last carrier are padding, the next secret starts with the next carrier
+                yield EmbeddedSecret(secret, error, firstStart, offset + end, range(firstCarrier, carrierNumber))
+                reader = self.__createReader()
+                firstStart = None
+
+            pendingWord = buffer[completeUntil:]
+            offset += completeUntil
+
+    def decoder(self, checkpoint: dict | None = None) -> SecretDecoder:
+        """
+        Creates a decoder for a text that grows over time, like a log or a feed that is followed. Unlike
+        `read`, which has to be run over the whole text again whenever it grew, the decoder keeps its state
+        between the chunks it is fed, so every character is scanned once. Its state can be saved with
+        `SecretDecoder.checkpoint` and passed as `checkpoint` to continue after a restart.
+
+        Args:
+            checkpoint (dict | None): The state of a previous decoder of the same configuration
+                (default is None, which starts at the beginning of the text).
+
+        Returns:
+            SecretDecoder: The decoder.
+
+        Raises:
+            ValueError: If the checkpoint has a wrong format or was made with another configuration.
+
+        Example:
+            >>> decoder = steganograph.decoder()
+            >>> with open("feed.txt", encoding="utf-8", newline="") as feed:
+            ...     while not decoder.feed(feed.read(65536)):
+            ...         time.sleep(1)
+            >>> decoder.result()
+            'secret'
+        """
+        codebook = self.__getCodebook()
+
+        def scan(buffer: str) -> tuple[int, Iterator[tuple[int, int, int, int]]]:
+            completeUntil = self.__completePrefixLength(buffer)
+            return completeUntil, self.__iterCarriers(buffer, 0, completeUntil)
+
+        decoder = SecretDecoder(scan, codebook.bitCounts, self.__createReader, codebook.fingerprint())
+        if checkpoint is not None:
+            decoder.restore(checkpoint)
+        return decoder
+
+    def read_many(self, paths: Iterable[str], workers: int | None = None, chunkSize: int = 1) -> Iterator[BatchResult]:
+        """
+        Extracts the hidden messages of many files with a pool of worker processes. The compiled codebook
+        is sent to every worker once, instead of parsing the configuration again for every file.
+        The results are yielded in the order of `paths`, and a file that cannot be read produces a result
+        with an error instead of aborting the batch.
+
+        Args:
+            paths (Iterable[str]): The paths of the files from which to extract the hidden messages.
+            workers (int | None): The number of worker processes (default is the number of CPUs).
+                With a single worker the files are processed in the current process.
+            chunkSize (int): The number of files sent to a worker at once.
+
+        Returns:
+            Iterator[BatchResult]: One result per path, holding the hidden message or the error.
+
+        Example:
+            >>> for result in steganograph.read_many(["first.txt", "second.txt"], workers=4):
+            ...     print(result.item, result.value if result.succeeded() else result.error)
+        """
+        return self.__runBatch(_readBatchItem, paths, workers, chunkSize)
+
+    def write_many(self, jobs: Iterable[tuple[str, str, str]], workers: int | None = None,
+                   chunkSize: int = 1) -> Iterator[BatchResult]:
+        """
+        Hides messages inside many files with a pool of worker processes. Every job consists of the path
+        of the cover text, the message to hide and the path the encoded text is written to. Both files are
+        UTF-8 encoded, and the newlines of the cover are kept. The results are yielded in the order of `jobs`, and a failing job produces a result with an error
+        instead of aborting the batch.
+
+        Args:
+            jobs (Iterable[tuple[str, str, str]]): The cover path, hidden text and output path of every job.
+            workers (int | None): The number of worker processes (default is the number of CPUs).
+                With a single worker the jobs are processed in the current process.
+            chunkSize (int): The number of jobs sent to a worker at once.
+
+        Returns:
+            Iterator[BatchResult]: One result per job, holding the output path or the error.
+
+        Example:
+            >>> jobs = [("cover.txt", "secret", "encoded.txt")]
+            >>> [result.value for result in steganograph.write_many(jobs)]
+            ['encoded.txt']
+        """
+        return self.__runBatch(_writeBatchItem, jobs, workers, chunkSize)
+
+    def write_parallel(self, textToWriteTo: str, hiddenText: str | bytes, workers: int | None = None,
+                       segmentSize: int = SEGMENT_SIZE) -> str:
+        """
+        Hides the provided `hiddenText` inside a large text like `write`, using several CPU cores. The text is
+        split into segments behind complete words, which worker processes index at the same time. The sum of
+        the capacities of the segments before a segment tells which bits its carriers hold, so each segment is
+        encoded independently from its index. Segments after the end of the secret are copied unchanged, and
+        the pool stops once the secret is embedded. The result is identical to the one of `write`.
+
+        Args:
+            textToWriteTo (str): The text in which the hidden message will be embedded.
+            hiddenText (str | bytes): The message to hide inside the main text.
+            workers (int | None): The number of worker processes (default is the number of CPUs).
+                With a single worker the segments are processed in the current process.
+            segmentSize (int): The number of characters of a segment (default is SEGMENT_SIZE). A segment is
+                shortened to end behind a complete word.
+
+        Returns:
+            str: The text with the hidden message encoded.
+
+        Raises:
+            ValueError: If the provided text is too small to hide the entire secret message.
+
+        Example:
+            >>> steganograph.write_parallel(FileHelper.read_file("huge.txt"), "secret", workers=8)
+            'This is a synonym-based encoded text.'
+        """
+        bits = self.__secretBits(hiddenText)
+        parts: list[str] = []
+        currentBitIndex = 0
+        copiedUntil = 0
+
+        with closing(self.__mapSegments(_indexSegment, textToWriteTo, workers, segmentSize)) as segments:
+            for segmentStart, segment, coverIndex in segments:
+                segmentBits = bits[currentBitIndex:currentBitIndex + coverIndex.capacity_bits]
+                parts.append(self.__embedIndexed(segment, segmentBits, coverIndex))
+                currentBitIndex += coverIndex.capacity_bits
+                copiedUntil = segmentStart + len(segment)
+
+                if currentBitIndex >= len(bits):
+                    parts.append(textToWriteTo[copiedUntil:])
+                    return ''.join(parts)
+
+        raise ValueError("The provided text file is too small to hide your text.")
+
+    def read_parallel(self, textToReadFrom: str, workers: int | None = None, segmentSize: int = SEGMENT_SIZE) -> str | bytes:
+        """
+        Extracts the hidden message from a large text like `read`, using several CPU cores. The text is split
+        into segments behind complete words, whose bits worker processes extract at the same time. The bits
+        are passed on in the order of the segments until the end of the secret is found, then the pool stops.
+
+        Args:
+            textToReadFrom (str): The text from which to extract the hidden message.
+            workers (int | None): The number of worker processes (default is the number of CPUs).
+                With a single worker the segments are processed in the current process.
+            segmentSize (int): The number of characters of a segment (default is SEGMENT_SIZE).
+
+        Returns:
+            str | bytes: The hidden message extracted from the text, or the raw bytes of a binary frame.
+
+        Raises:
+            ValueError: If no secret message is found in the text.
+
+        Example:
+            >>> steganograph.read_parallel(FileHelper.read_file("huge.txt"), workers=8)
+            'secret'
+        """
+        reader = self.__createReader()
+
+        with closing(self.__mapSegments(_readSegmentBits, textToReadFrom, workers, segmentSize)) as segments:
+            for _, _, bits in segments:
+                for bit in bits:
+                    if reader.push(bit):
+                        return reader.result()
+
+        raise ValueError("No secret was found in the text.")
+
+    def read_bits(self, textToReadFrom: str) -> BitArray:
+        """
+        Extracts the bits of all carrier words of a text, without looking for the end of a secret.
+
+        Args:
+            textToReadFrom (str): The text from which to extract the bits.
+
+        Returns:
+            BitArray: The bits of the carriers in the order of the text, those of a group most significant first.
+
+        Example:
+            >>> steganograph.read_bits("I am joyful.")
+            BitArray([1])
+        """
+        bitCounts = self.__getCodebook().bitCounts
+        bits = BitArray()
+        for _, _, pairId, value in self.__iterCarriers(textToReadFrom, 0, len(textToReadFrom)):
+            for shift in range(bitCounts[pairId] - 1, -1, -1):
+                bits.append(value >> shift & 1)
+        return bits
+
+    def secret_bits(self, hiddenText: str | bytes) -> int:
+        """
+        Returns the number of bits needed to hide a secret with the current settings, including the
+        END_OF_SECRET or the frame. A cover fits the secret if its capacity is at least as large.
+
+        Args:
+            hiddenText (str | bytes): The message to hide.
+
+        Returns:
+            int: The number of bits to embed.
+
+        Example:
+            >>> steganograph.secret_bits("secret")
+            56
+        """
+        return len(self.__secretBits(hiddenText))
+
+    def secret_capacity(self, coverIndex: CoverIndex) -> int:
+        """
+        Returns the number of bytes of a text secret that an indexed cover can hold with the current settings,
+        without the END_OF_SECRET or the frame. A compressed secret may be longer, as long as it compresses.
+
+        Args:
+            coverIndex (CoverIndex): The index of the cover.
+
+        Returns:
+            int: The length of the longest UTF-8 encoded text that `write` accepts.
+
+        Example:
+            >>> steganograph.secret_capacity(steganograph.index_cover(text))
+            17
+        """
+        return coverIndex.secret_bytes(self.framed or self.compression is not None, self.checksum)
+
+    def update_library(self, library: CoverLibrary, paths: Iterable[str]) -> int:
+        """
+        Brings a cover library up to date with the given cover files for the current codebook. Only covers
+        that are new or whose size or modification time changed are read, and only contents that were never
+        scanned with the codebook before are tokenized. Covers of the library that are not among the paths
+        are removed from it. The covers are read as UTF-8.
+
+        Args:
+            library (CoverLibrary): The library to update.
+            paths (Iterable[str]): The paths of all covers of the library.
+
+        Returns:
+            int: The number of covers that had to be scanned.
+
+        Raises:
+            OSError: If a cover cannot be read.
+
+        Example:
+            >>> library = CoverLibrary()
+            >>> steganograph.update_library(library, glob.glob("examples/*.txt"))
+            2
+            >>> steganograph.update_library(library, glob.glob("examples/*.txt"))
+            0
+        """
+        codebook = self.__getCodebook()
+        fingerprint = codebook.fingerprint()
+        paths = list(paths)
+        scanned = 0
+
+        for path in paths:
+            # the status is taken before reading, so a cover changed meanwhile is read again next time
+            stat = os.stat(path)
+            if library.is_current(path, stat, fingerprint):
+                continue
+
+            # newlines are kept, so that the capacity is that of the file written in place
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                text = file.read()
+            textHash = CoverIndex.hash_text(text)
+            capacityBits = library.capacity(textHash, fingerprint)
+            if capacityBits is None:
+                carriers = self.__iterCarriers(text, 0, len(text))
+                capacityBits = sum(codebook.bitCounts[pairId] for _, _, pairId, _ in carriers)
+                scanned += 1
+            library.record(path, stat, textHash, fingerprint, capacityBits)
+
+        library.retain(paths)
+        return scanned
+
+    def select_cover(self, library: CoverLibrary, hiddenText: str | bytes) -> str:
+        """
+        Returns the cover of a library with the smallest capacity that fits a secret with the current
+        settings, without encoding the secret into any cover.
+
+        Args:
+            library (CoverLibrary): The library brought up to date with `update_library`.
+            hiddenText (str | bytes): The message to hide.
+
+        Returns:
+            str: The path of the cover.
+
+        Raises:
+            ValueError: If no cover of the library is large enough.
+
+        Example:
+            >>> path = steganograph.select_cover(library, "secret")
+            >>> steganograph.write(FileHelper.read_file(path), "secret")
+            'This is a synonym-based encoded text.'
+        """
+        path = library.best_cover(self.secret_bits(hiddenText), self.__getCodebook().fingerprint())
+        if path is None:
+            raise ValueError("No cover of the library is large enough to hide your text.")
+        return path
+
+    def __mapSegments(self, function: Callable[..., object], text: str, workers: int | None,
+                      segmentSize: int) -> Iterator[tuple[int, str, object]]:
+        """
+        Applies a segment function to the segments of a text, either in the current process or in a pool of
+        worker processes that receive this Steganograph once when they start. Only a few segments more than
+        there are workers are submitted ahead of the one yielded next, so closing the iterator early leaves
+        the rest of the text unprocessed.
+
+        Args:
+            function (Callable[..., object]): The module level function processing a single segment.
+            text (str): The text to split into segments.
+            workers (int | None): The number of worker processes.
+            segmentSize (int): The number of characters of a segment.
+
+        Returns:
+            Iterator[tuple[int, str, object]]: The start index, text and result of every segment in order.
+        """
+        if workers == 1:
+            for segmentStart, segment in self.__iterSegments(text, segmentSize):
+                yield segmentStart, segment, function(segment, self)
+            return
+
+        workers = workers or os.cpu_count() or 1
+        executor = _processPool(workers, _initializeBatchWorker, self)
+        pending: deque[tuple[int, str, object]] = deque()
+        try:
+            for segmentStart, segment in self.__iterSegments(text, segmentSize):
+                pending.append((segmentStart, segment, executor.submit(function, segment)))
+                if len(pending) > 2 * workers:
+                    segmentStart, segment, future = pending.popleft()
+                    yield segmentStart, segment, future.result()
+
+            while pending:
+                segmentStart, segment, future = pending.popleft()
+                yield segmentStart, segment, future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def __iterSegments(self, text: str, segmentSize: int) -> Iterator[tuple[int, str]]:
+        """
+        Splits a text into segments that can be processed independently, the same way a stream is split into
+        the parts processed after every chunk: every segment but the last one ends behind a complete word
+        and never inside a phrase that may continue.
+
+        Args:
+            text (str): The text to split.
+            segmentSize (int): The number of characters of a segment before it is shortened.
+
+        Returns:
+            Iterator[tuple[int, str]]: The start index and text of every segment.
+        """
+        segmentStart = 0
+        while segmentStart < len(text):
+            segmentEnd = len(text)
+            target = segmentStart + segmentSize
+            while target < len(text):
+                completeUntil = self.__completePrefixLength(text[segmentStart:target])
+                if completeUntil > 0:
+                    segmentEnd = segmentStart + completeUntil
+                    break
+                # a single word or phrase longer than a segment
+                target += segmentSize
+
+            yield segmentStart, text[segmentStart:segmentEnd]
+            segmentStart = segmentEnd
+
+    def __runBatch(self, function: Callable[..., BatchResult], items: Iterable, workers: int | None,
+                   chunkSize: int) -> Iterator[BatchResult]:
+        """
+        Applies a batch function to every item, either in the current process or in a pool of worker
+        processes that receive this Steganograph once when they start. Items are read from `items` only
+        as far as two chunks per worker are in flight, so a long or endless iterable is processed with
+        bounded memory.
+
+        Args:
+            function (Callable[..., BatchResult]): The module level function processing a single item.
+            items (Iterable): The items to process.
+            workers (int | None): The number of worker processes.
+            chunkSize (int): The number of items sent to a worker at once.
+
+        Returns:
+            Iterator[BatchResult]: The results in the order of the items.
+        """
+        if workers == 1:
+            for item in items:
+                yield function(item, self)
+            return
+
+        maxInFlight = 2 * (workers or os.cpu_count() or 1)
+        executor = _processPool(workers, _initializeBatchWorker, self)
+        pending = deque()
+        try:
+            items = iter(items)
+            while chunk := list(islice(items, chunkSize)):
+                pending.append(executor.submit(_runBatchChunk, function, chunk))
+                if len(pending) >= maxInFlight:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def __embed(self, text: str, end: int, bits: BitArray, currentBitIndex: int,
+                output: Callable[[str], object], stats: OperationStats | None = None) -> tuple[int, int]:
+        """
+        Replaces the carrier words of `text[:end]` depending on the bits, starting at `currentBitIndex`,
+        and passes the text up to the last replaced word to `output`. A word reaching `end` is not complete
+        and is left untouched.
+
+        Args:
+            text (str): The text in which the bits are embedded.
+            end (int): The index up to which the text is processed.
+            bits (BitArray): All bits of the secret including the END_OF_SECRET.
+            currentBitIndex (int): The index of the next bit to embed.
+            output (Callable[[str], object]): Receives the generated text piece by piece.
+            stats (OperationStats | None): The statistics to update. If given, the rest of `text[:end]` is
+                scanned for the remaining capacity after the last bit was embedded.
+
+        Returns:
+            tuple[int, int]: The index of the next bit to embed and the index up to which `text`
+            was passed to `output`.
+        """
+        codebook = self.__getCodebook()
+        copiedUntil = 0
+
+        if currentBitIndex >= len(bits):
+            return currentBitIndex, copiedUntil
+
+        if stats is None:
+            carriers = self.__iterCarriers(text, 0, end)
+        else:
+            carriers = self.__scanCarriers(text, end, stats)
+            firstBitIndex = currentBitIndex
+            scanSeconds = stats.totalSeconds
+            started = time.perf_counter()
+
+        for start, wordEnd, pairId, _ in carriers:
+            # replace the carrier with the word of its pair depending on the next bits
+            output(text[copiedUntil:start])
+            value = bits.value(currentBitIndex, codebook.bitCounts[pairId])
+            if codebook.ignoreCase:
+                output(codebook.casedForm(pairId, value, text[start:wordEnd]))
+            else:
+                output(codebook.form(pairId, value))
+            copiedUntil = wordEnd
+            currentBitIndex += codebook.bitCounts[pairId]
+
+            if currentBitIndex >= len(bits):
+                break
+
+        if stats is not None:
+            # the time of the scan is measured by its own phases
+            stats.addPhase("embed", time.perf_counter() - started - (stats.totalSeconds - scanSeconds))
+            stats.bitsEmbedded += min(currentBitIndex, len(bits)) - firstBitIndex
+            for _ in carriers:
+                pass
+
+        return currentBitIndex, copiedUntil
+
+    def __embedIndexed(self, textToWriteTo: str, bits: BitArray, coverIndex: CoverIndex,
+                       stats: OperationStats | None = None) -> str:
+        """
+        Replaces the carrier words recorded in a cover index depending on the bits, without tokenizing the text.
+        Every replaced word is looked up to make sure it is a carrier of the recorded pair.
+
+        Args:
+            textToWriteTo (str): The indexed text in which the bits are embedded.
+            bits (BitArray): All bits of the secret including the END_OF_SECRET.
+            coverIndex (CoverIndex): The index of `textToWriteTo`.
+            stats (OperationStats | None): The statistics to update.
+
+        Returns:
+            str: The text with the hidden message encoded.
+
+        Raises:
+            ValueError: If the index does not belong to the text or the codebook, or if the text is too small.
+        """
+        codebook = self.__getCodebook()
+
+        if coverIndex.textLength != len(textToWriteTo) or coverIndex.codebookFingerprint != codebook.fingerprint():
+            raise ValueError("The cover index does not belong to the provided text.")
+        if len(bits) > coverIndex.capacity_bits:
+            raise ValueError("The provided text file is too small to hide your text.")
+
+        parts: list[str] = []
+        copiedUntil = 0
+        currentBitIndex = 0
+        starts, ends, pairIds = coverIndex.starts, coverIndex.ends, coverIndex.pairIds
+        started = time.perf_counter() if stats is not None else 0.0
+
+        for index in range(len(pairIds)):
+            if currentBitIndex >= len(bits):
+                break
+
+            pairId = pairIds[index]
+            word = textToWriteTo[starts[index]:ends[index]]
+            # a text of the same length is only accepted if every replaced word is a carrier of the indexed pair
+            entry = codebook.lookup(" ".join(word.split()) if codebook.matcher is not None else word)
+            if entry is None or entry[0] != pairId:
+                raise ValueError("The cover index does not belong to the provided text.")
+
+            parts.append(textToWriteTo[copiedUntil:starts[index]])
+            value = bits.value(currentBitIndex, codebook.bitCounts[pairId])
+            if codebook.ignoreCase:
+                parts.append(codebook.casedForm(pairId, value, word))
+            else:
+                parts.append(codebook.form(pairId, value))
+            copiedUntil = ends[index]
+            currentBitIndex += codebook.bitCounts[pairId]
+
+        parts.append(textToWriteTo[copiedUntil:])
+        if stats is None:
+            return ''.join(parts)
+
+        stats.addPhase("embed", time.perf_counter() - started)
+        with stats.phase("join"):
+            encodedText = ''.join(parts)
+        stats.carriersMatched = len(pairIds)
+        stats.capacityBits = coverIndex.capacityBits
+        stats.bitsEmbedded = len(bits)
+        stats.charactersRead = len(textToWriteTo)
+        return encodedText
+
+    def __extract(self, text: str, end: int, reader: SecretReader,
+                  stats: OperationStats | None = None) -> str | bytes | None:
+        """
+        Passes the bits of the carrier words of `text[:end]` to `reader` until the end of the secret is reached.
+        A word reaching `end` is not complete and is ignored.
+
+        Args:
+            text (str): The text from which the bits are extracted.
+            end (int): The index up to which the text is processed.
+            reader (SecretReader): The reader collecting the bits, keeping its state between calls.
+            stats (OperationStats | None): The statistics to update.
+
+        Returns:
+            str | bytes | None: The hidden message if its end was found, otherwise None.
+        """
+        bitCounts = self.__getCodebook().bitCounts
+
+        if stats is None:
+            return self.__extractBits(self.__iterCarriers(text, 0, end), bitCounts, reader.push, reader)
+
+        def countingPush(bit: int) -> bool:
+            stats.bitsRead += 1
+            return reader.push(bit)
+
+        scanSeconds = stats.totalSeconds
+        started = time.perf_counter()
+        try:
+            return self.__extractBits(self.__scanCarriers(text, end, stats), bitCounts, countingPush, reader)
+        finally:
+            # the time of the scan is measured by its own phases
+            stats.addPhase("decode", time.perf_counter() - started - (stats.totalSeconds - scanSeconds))
+
+    @staticmethod
+    def __extractBits(carriers: Iterable[tuple[int, int, int, int]], bitCounts: list[int],
+                      push: Callable[[int], bool], reader: SecretReader) -> str | bytes | None:
+        """
+        Passes the bits of the given carriers to `push` until the end of the secret is reached.
+
+        Args:
+            carriers (Iterable[tuple[int, int, int, int]]): The carriers as yielded by `__iterCarriers`.
+            bitCounts (list[int]): The number of bits of every pair.
+            push (Callable[[int], bool]): Consumes a bit and returns whether the secret is complete.
+            reader (SecretReader): The reader returning the complete secret.
+
+        Returns:
+            str | bytes | None: The hidden message if its end was found, otherwise None.
+        """
+        for _, _, pairId, value in carriers:
+            # a group carries several bits, the most significant one first
+            for shift in range(bitCounts[pairId] - 1, -1, -1):
+                if push(value >> shift & 1):
+                    return reader.result()
+
+        return None
+
+    def __createReader(self) -> SecretReader:
+        """
+        Creates a reader detecting the end of a secret in either format.
+
+        Returns:
+            SecretReader: A reader using the END_OF_SECRET of this Steganograph.
+        """
+        return SecretReader(self.LENGTH_OF_BYTE, self.END_OF_SECRET)
+
+    def __secretBits(self, hiddenText: str | bytes, stats: OperationStats | None = None) -> BitArray:
+        """
+        Converts a secret into the bits to embed: text followed by the END_OF_SECRET, or a length-prefixed
+        frame if framing or compression is enabled or the secret consists of bytes or is empty.
+
+        Args:
+            hiddenText (str | bytes): The message to hide.
+            stats (OperationStats | None): The statistics to add the time of the conversion to.
+
+        Returns:
+            BitArray: The bits to embed.
+        """
+        if stats is not None:
+            with stats.phase("secret"):
+                return self.__secretBits(hiddenText)
+
+        # an empty text followed by the END_OF_SECRET would start with the FRAME_MARKER and be read as a frame
+        if self.framed or self.compression is not None or isinstance(hiddenText, (bytes, bytearray)) \
+                or hiddenText == "":
+            isText = isinstance(hiddenText, str)
+            payload = hiddenText.encode('utf-8') if isText else bytes(hiddenText)
+            return BitArray(FrameHelper.encode(payload, isText, self.checksum, self.compression))
+
+        return BitHelper.as_bit_array(BitHelper.string_to_bit_array(hiddenText).__add__(self.END_OF_SECRET))
+
+    def __createPatch(self, text: str, carriers: Iterable[tuple[int, int, int, int]], bits: BitArray,
+                      textLength: int | None) -> SubstitutionPatch:
+        """
+        Returns the replacements of the carriers whose bits differ from the bits of a secret. The carriers are
+        consumed only up to the one completing the secret.
+
+        Args:
+            text (str): The text hiding the old secret, or a beginning of it holding all carriers of the secret.
+            carriers (Iterable[tuple[int, int, int, int]]): The start index, end index, pair id and value of
+                every carrier of the text.
+            bits (BitArray): All bits of the new secret including the END_OF_SECRET.
+            textLength (int | None): The length of the whole text, if known.
+
+        Returns:
+            SubstitutionPatch: The replacements.
+
+        Raises:
+            ValueError: If the carriers hold fewer bits than the secret.
+        """
+        codebook = self.__getCodebook()
+        starts = array("q")
+        oldWords: list[str] = []
+        newWords: list[str] = []
+        currentBitIndex = 0
+
+        for start, end, pairId, value in carriers:
+            # the bits to flip are the difference of the old and the new value
+            newValue = bits.value(currentBitIndex, codebook.bitCounts[pairId])
+            if value ^ newValue:
+                oldWord = text[start:end]
+                starts.append(start)
+                oldWords.append(oldWord)
+                if codebook.ignoreCase:
+                    newWords.append(codebook.casedForm(pairId, newValue, oldWord))
+                else:
+                    newWords.append(codebook.form(pairId, newValue))
+            currentBitIndex += codebook.bitCounts[pairId]
+            if currentBitIndex >= len(bits):
+                break
+
+        if currentBitIndex < len(bits):
+            raise ValueError("The provided text file is too small to hide your text.")
+
+        return SubstitutionPatch(starts, SubstitutionPatch.byte_offsets(text, starts), oldWords, newWords,
+                                 textLength)
+
+    def __readSecretCarriers(self, chunks: Iterator[str],
+                             bitCount: int) -> tuple[str, list[tuple[int, int, int, int]]]:
+        """
+        Decodes the chunks of a text until its carriers hold the given number of bits.
+
+        Args:
+            chunks (Iterator[str]): The chunks of the text.
+            bitCount (int): The number of bits the carriers have to hold.
+
+        Returns:
+            tuple[str, list[tuple[int, int, int, int]]]: The text read and the start index, end index, pair id
+            and value of its carriers, fewer than needed if the text ended before.
+        """
+        bitCounts = self.__getCodebook().bitCounts
+        parts: list[str] = []
+        carriers: list[tuple[int, int, int, int]] = []
+        pendingWord = ""
+        offset = 0
+
+        for chunk in chunks:
+            parts.append(chunk)
+            # only the part up to the last non-alphabetic character contains complete words
+            buffer = pendingWord + chunk
+            completeUntil = self.__completePrefixLength(buffer)
+
+            for start, end, pairId, value in self.__iterCarriers(buffer, 0, completeUntil):
+                carriers.append((offset + start, offset + end, pairId, value))
+                bitCount -= bitCounts[pairId]
+                if bitCount <= 0:
+                    return ''.join(parts), carriers
+
+            offset += completeUntil
+            pendingWord = buffer[completeUntil:]
+
+        return ''.join(parts), carriers
+
+    def __indexedSecretEnd(self, coverIndex: CoverIndex, bitCount: int) -> int:
+        """
+        Returns the end index of the carrier of an indexed text that completes the given number of bits.
+
+        Args:
+            coverIndex (CoverIndex): The index of the text.
+            bitCount (int): The number of bits the carriers have to hold.
+
+        Returns:
+            int: The end index of the last carrier needed.
+
+        Raises:
+            ValueError: If the index does not belong to the codebook, or if the text is too small.
+        """
+        codebook = self.__getCodebook()
+        if coverIndex.codebookFingerprint != codebook.fingerprint():
+            raise ValueError("The cover index does not belong to the provided text.")
+        if bitCount > coverIndex.capacity_bits:
+            raise ValueError("The provided text file is too small to hide your text.")
+
+        index = 0
+        while bitCount > 0:
+            bitCount -= codebook.bitCounts[coverIndex.pairIds[index]]
+            index += 1
+        return coverIndex.ends[index - 1]
+
+    @staticmethod
+    def __readPrefix(chunks: Iterator[str], length: int) -> str:
+        """
+        Decodes the chunks of a text until at least the given number of characters is read.
+
+        Args:
+            chunks (Iterator[str]): The chunks of the text.
+            length (int): The number of characters needed.
+
+        Returns:
+            str: The text read, shorter than `length` if the text is.
+        """
+        parts: list[str] = []
+        readLength = 0
+        for chunk in chunks:
+            parts.append(chunk)
+            readLength += len(chunk)
+            if readLength >= length:
+                break
+        return ''.join(parts)
+
+    def __iterIndexedCarriers(self, text: str, coverIndex: CoverIndex) -> Iterator[tuple[int, int, int, int]]:
+        """
+        Yields the carriers recorded in an index of a text, looking up their values in the text.
+
+        Args:
+            text (str): The indexed text.
+            coverIndex (CoverIndex): The index of `text`.
+
+        Returns:
+            Iterator[tuple[int, int, int, int]]: The start index, end index, pair id and value of every carrier.
+        """
+        codebook = self.__getCodebook()
+        for start, end in zip(coverIndex.starts, coverIndex.ends):
+            word = text[start:end]
+            if codebook.matcher is not None:
+                # the words of a phrase may be separated by any whitespace in the text
+                word = " ".join(word.split())
+            entry = codebook.lookup(word)
+            if entry is None:
+                raise ValueError("The cover index does not belong to the provided text.")
+            yield start, end, entry[0], entry[1]
+
+    def __iterCarriers(self, text: str, start: int, end: int) -> Iterator[tuple[int, int, int, int]]:
+        """
+        Yields every carrier word of `text[start:end]`, meaning every complete word that is part of a pair.
+        A word reaching `end` is not complete, because a non-alphabetic character has to follow a word.
+
+        Args:
+            text (str): The text to search.
+            start (int): The index at which the search starts.
+            end (int): The index at which the search stops.
+
+        Returns:
+            Iterator[tuple[int, int, int, int]]: The start index, end index, pair id and value of every carrier.
+        """
+        codebook = self.__getCodebook()
+        if codebook.matcher is not None:
+            yield from codebook.matcher.iterMatches(text, TokenHelper.iter_words(text, start, end), end)
+            return
+
+        lookup = codebook.entries.get
+        words = TokenHelper.iter_words(text, start, end)
+        if codebook.ignoreCase:
+            words = ((wordStart, wordEnd, word.casefold()) for wordStart, wordEnd, word in words)
+
+        for wordStart, wordEnd, word in words:
+            if wordEnd == end:
+                break
+
+            match = lookup(word)
+            if match is not None:
+                yield wordStart, wordEnd, match[0], match[1]
+
+    def __scanCarriers(self, text: str, end: int, stats: OperationStats) -> Iterator[tuple[int, int, int, int]]:
+        """
+        Yields the same carriers as `__iterCarriers(text, 0, end)`, but tokenizes and looks up the words
+        window by window in separately timed phases and counts them in `stats`.
+
+        Args:
+            text (str): The text to search.
+            end (int): The index at which the search stops.
+            stats (OperationStats): The statistics to update.
+
+        Returns:
+            Iterator[tuple[int, int, int, int]]: The start index, end index, pair id and value of every carrier.
+        """
+        codebook = self.__getCodebook()
+        lookup = codebook.entries.get
+        position = 0
+
+        while position < end:
+            # let the window end behind a non-alphabetic character, so that no word is cut
+            windowEnd = min(end, position + self.STATS_WINDOW_SIZE)
+            while windowEnd < end and text[windowEnd - 1].isalpha():
+                windowEnd += 1
+            if codebook.matcher is not None and windowEnd < end:
+                # nor a phrase that may continue behind the window
+                decidedUntil = codebook.matcher.decidedLength(text, windowEnd)
+                windowEnd = decidedUntil if decidedUntil > position else end
+
+            with stats.phase("tokenize"):
+                words = list(TokenHelper.iter_words(text, position, windowEnd))
+                if words and words[-1][1] == end:
+                    words.pop()
+
+            with stats.phase("lookup"):
+                if codebook.matcher is not None:
+                    carriers = list(codebook.matcher.iterMatches(text, iter(words), windowEnd))
+                elif codebook.ignoreCase:
+                    carriers = [(start, wordEnd, *match) for start, wordEnd, word in words
+                                if (match := lookup(word.casefold())) is not None]
+                else:
+                    carriers = [(start, wordEnd, *match) for start, wordEnd, word in words
+                                if (match := lookup(word)) is not None]
+
+            stats.wordsScanned += len(words)
+            stats.carriersMatched += len(carriers)
+            stats.capacityBits += sum(codebook.bitCounts[carrier[2]] for carrier in carriers)
+            stats.charactersRead += windowEnd - position
+            position = windowEnd
+
+            yield from carriers
+
+    def __copyAndScan(self, pendingWord: str, chunks: Iterator[str], destination: TextIO,
+                      stats: OperationStats) -> None:
+        """
+        Copies the rest of a stream after the secret was embedded, scanning it for the remaining capacity.
+
+        Args:
+            pendingWord (str): The incomplete word at the end of the last processed chunk.
+            chunks (Iterator[str]): The remaining chunks of the source.
+            destination (TextIO): The text file object the chunks are copied to.
+            stats (OperationStats): The statistics to update.
+        """
+        for chunk in chunks:
+            destination.write(chunk)
+            buffer = pendingWord + chunk
+            completeUntil = self.__completePrefixLength(buffer)
+            for _ in self.__scanCarriers(buffer, completeUntil, stats):
+                pass
+            pendingWord = buffer[completeUntil:]
+            self.observer.onProgress(stats)
+
+        stats.charactersRead += len(pendingWord)
+
+    def __completePrefixLength(self, buffer: str) -> int:
+        """
+        Returns the length of the part of a stream buffer that can be processed before the next chunk is read:
+        it has to end behind a complete word and must not end inside a phrase that may continue.
+
+        Args:
+            buffer (str): The unprocessed text of the stream.
+
+        Returns:
+            int: The index up to which the buffer can be processed.
+        """
+        completeUntil = TokenHelper.complete_prefix_length(buffer)
+        matcher = self.__getCodebook().matcher
+        if matcher is None:
+            return completeUntil
+        return matcher.decidedLength(buffer, completeUntil)
+
+    def __startStats(self, operation: str) -> OperationStats | None:
+        """
+        Creates the statistics of an operation if an observer is set.
+
+        Args:
+            operation (str): The name of the operation.
+
+        Returns:
+            OperationStats | None: Empty statistics, or None without an observer.
+        """
+        if self.observer is None:
+            return None
+        return OperationStats(operation)
+
+    def __completeStats(self, stats: OperationStats) -> None:
+        """
+        Passes the final statistics of an operation to the observer.
+
+        Args:
+            stats (OperationStats): The final statistics.
+        """
+        self.observer.onComplete(stats)
+
+    def __getCodebook(self) -> "Codebook | CompactCodebook":
+        """
+        Returns the compiled codebook of the current synonyms and compiles it if it does not exist yet
+        or if the synonyms or the case setting were changed after the configuration was applied.
+
+        Returns:
+            Codebook | CompactCodebook: The codebook matching `synonyms` and `ignoreCase`.
+        """
+        if self.codebook is None or self.codebook.synonyms is not self.synonyms \
+                or self.codebook.ignoreCase != self.ignoreCase:
+            if self.compact:
+                from models.CompactCodebook import CompactCodebook
+                self.codebook = CompactCodebook.build(self.synonyms, self.ignoreCase)
+                self.synonyms = self.codebook.synonyms
+            else:
+                self.codebook = Codebook(self.synonyms, self.ignoreCase)
+        return self.codebook
+
+    def __validateAndApplyConfig(self, jsonData: dict | list) -> None:
+        """
+        Validates and applies the configuration for synonyms from a given JSON data.
+
+        Args:
+            jsonData (dict | list): The JSON data containing the configuration for the synonyms.
+
+        Raises:
+            ValueError: If the configuration file format or synonym structure is invalid.
+        """
+        if not isinstance(jsonData, list):
+            raise ValueError("The configuration file has a wrong format.")
+
+        # every word may only be used once across all pairs and groups, in any case if the case is ignored
+        knownWords: set[str] = set()
+
+        for index in range(len(jsonData)):
+            item = Steganograph.__parseConfigItem(jsonData[index], index)
+
+            for word in item.words:
+                key = word.casefold() if self.ignoreCase else word
+                if key in knownWords:
+                    raise ValueError(f'The synonym "{word}" exists at least two times.')
+                knownWords.add(key)
+
+            self.synonyms.append(item)
+
+        if self.compact:
+            from models.CompactCodebook import CompactCodebook
+            # the pairs are only kept inside the buffer of the compact codebook
+            self.codebook = CompactCodebook.build(self.synonyms, self.ignoreCase)
+            self.synonyms = self.codebook.synonyms
+        else:
+            self.codebook = Codebook(self.synonyms, self.ignoreCase)
+
+    @staticmethod
+    def __parseConfigItem(item: dict | Synonym | SynonymGroup, index: int) -> Synonym | SynonymGroup:
+        """
+        Validates a single item of the configuration and creates its pair or group.
+
+        Args:
+            item (dict | Synonym | SynonymGroup): The item of the JSON data.
+            index (int): The index of the item, used in the error message.
+
+        Returns:
+            Synonym | SynonymGroup: The pair or group of the item.
+
+        Raises:
+            ValueError: If the item is no valid pair or group.
+        """
+        if isinstance(item, dict):
+            if 'group' in item:
+                item = SynonymGroup(words=item['group'])
+            else:
+                item = Synonym(word=item['word'], synonym=item['synonym'])
+
+        # a group needs 2^k words to carry k bits
+        if isinstance(item, SynonymGroup):
+            words = item.words
+            if not isinstance(words, list) or len(words) < 2 or len(words) & (len(words) - 1) != 0 \
+                    or not all(isinstance(word, str) for word in words):
+                raise ValueError(f"The value with the index {index} is invalid.")
+        elif not isinstance(item, Synonym):
+            raise ValueError(f"The value with the index {index} is invalid.")
+
+        return item
+
+    def __applyCachedConfig(self, pathToConfig: str, cacheDirectory: str) -> None:
+        """
+        Applies the configuration from the compiled codebook cache. The cache entry is keyed by a hash of the
+        configuration file, so an entry is used only as long as the file is unchanged. Entries are stored in the
+        flat format of `CompactCodebook` and memory-mapped on a hit, which neither parses JSON nor creates an
+        object per word, and a file written by someone else cannot run code. On a miss the JSON is parsed and
+        validated as usual, and the compiled codebook replaces older entries of the same file.
+
+        Args:
+            pathToConfig (str): The file path to the JSON configuration file containing synonyms.
+            cacheDirectory (str): The directory holding the cache entries.
+
+        Raises:
+            ValueError: If the configuration file format or synonym structure is invalid.
+        """
+        from models.CompactCodebook import CompactCodebook
+
+        configData = FileHelper.read_binary_file(pathToConfig)
+        cacheName = os.path.abspath(pathToConfig) + ("\0ignoreCase" if self.ignoreCase else "")
+        filePrefix = hashlib.sha256(cacheName.encode('utf-8')).hexdigest()[:16]
+        contentHash = hashlib.sha256(self.CODEBOOK_CACHE_VERSION + configData).hexdigest()
+        cachePath = os.path.join(cacheDirectory, f"{filePrefix}-{contentHash}.codebook")
+
+        try:
+            codebook = CompactCodebook.load(cachePath)
+            if codebook.ignoreCase == self.ignoreCase:
+                self.codebook = codebook
+                self.synonyms = codebook.synonyms
+                return
+        except (OSError, ValueError):
+            pass
+
+        self.__validateAndApplyConfig(json.loads(configData))
+
+        # a cache that cannot be written only costs the next construction some time
+        try:
+            os.makedirs(cacheDirectory, exist_ok=True)
+            if self.compact:
+                self.codebook.save(cachePath)
+                # continue with the mapped file, which is shared with other processes
+                self.codebook = CompactCodebook.load(cachePath)
+                self.synonyms = self.codebook.synonyms
+            else:
+                CompactCodebook.build(self.synonyms, self.ignoreCase).save(cachePath)
+            for fileName in os.listdir(cacheDirectory):
+                if fileName.startswith(filePrefix + "-") and fileName != os.path.basename(cachePath):
+                    os.remove(os.path.join(cacheDirectory, fileName))
+        except OSError:
+            pass
+
+
+@contextmanager
+def _pausedGarbageCollection() -> Iterator[None]:
+    """
+    Disables the cyclic garbage collector for the duration of the context and restores its previous state.
+    """
+    wasEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if wasEnabled:
+            gc.enable()
+
+def _processPool(workers: int | None, initializer: Callable[[Steganograph], None],
+                 steganograph: Steganograph) -> "ProcessPoolExecutor":
+    """
+    Creates a pool of worker processes, each of which receives the Steganograph once when it starts.
+
+    Args:
+        workers (int | None): The number of worker processes (default is the number of CPUs).
+        initializer (Callable[[Steganograph], None]): Stores the Steganograph in a worker process.
+        steganograph (Steganograph): The Steganograph sent to the worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The pool, which the caller has to shut down.
+    """
+    # imported here, as multiprocessing makes up a large part of the start-up time of the module
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(workers, initializer=initializer, initargs=(steganograph,))
+
+# the Steganograph of a batch worker process, set once by the pool initializer
+_batchSteganograph: Steganograph | None = None
+
+def _initializeBatchWorker(steganograph: Steganograph) -> None:
+    """
+    Stores the Steganograph sent to a batch worker process when the process starts.
+
+    Args:
+        steganograph (Steganograph): The Steganograph used for all items of the worker.
+    """
+    global _batchSteganograph
+    _batchSteganograph = steganograph
+
+def _runBatchChunk(function: Callable[..., BatchResult], chunk: list) -> list[BatchResult]:
+    """
+    Applies a batch function to the items of a chunk in a worker process of a batch.
+
+    Args:
+        function (Callable[..., BatchResult]): The module level function processing a single item.
+        chunk (list): The items sent to the worker at once.
+
+    Returns:
+        list[BatchResult]: The results in the order of the items.
+    """
+    return [function(item) for item in chunk]
+
+def _readBatchItem(path: str, steganograph: Steganograph | None = None) -> BatchResult:
+    """
+    Extracts the hidden message of a single file of a batch.
+
+    Args:
+        path (str): The path of the file.
+        steganograph (Steganograph | None): The Steganograph to use (default is the one of the worker).
+
+    Returns:
+        BatchResult: The hidden message or the error raised while reading it.
+    """
+    try:
+        return BatchResult(path, value=(steganograph or _batchSteganograph).read_mapped_file(path))
+    except Exception as error:
+        return BatchResult(path, error=error)
+
+def _writeBatchItem(job: tuple[str, str, str], steganograph: Steganograph | None = None) -> BatchResult:
+    """
+    Hides a message inside a single file of a batch and writes the encoded text.
+
+    Args:
+        job (tuple[str, str, str]): The cover path, hidden text and output path.
+        steganograph (Steganograph | None): The Steganograph to use (default is the one of the worker).
+
+    Returns:
+        BatchResult: The output path or the error raised while writing it.
+    """
+    try:
+        pathToCover, hiddenText, pathToOutput = job
+        # covers are UTF-8 like those read by read_many, and their newlines are kept as they are
+        with open(pathToCover, "r", encoding="utf-8", newline="") as file:
+            encodedText = (steganograph or _batchSteganograph).write(file.read(), hiddenText)
+        with open(pathToOutput, "w", encoding="utf-8", newline="") as file:
+            file.write(encodedText)
+        return BatchResult(job, value=pathToOutput)
+    except Exception as error:
+        return BatchResult(job, error=error)
+
+def _indexSegment(segment: str, steganograph: Steganograph | None = None) -> CoverIndex:
+    """
+    Indexes a single segment of a text written in parallel.
+
+    Args:
+        segment (str): The text of the segment.
+        steganograph (Steganograph | None): The Steganograph to use (default is the one of the worker).
+
+    Returns:
+        CoverIndex: The index of the carrier words of the segment.
+    """
+    return (steganograph or _batchSteganograph).index_cover(segment)
+
+def _readSegmentBits(segment: str, steganograph: Steganograph | None = None) -> BitArray:
+    """
+    Extracts the bits of a single segment of a text read in parallel.
+
+    Args:
+        segment (str): The text of the segment.
+        steganograph (Steganograph | None): The Steganograph to use (default is the one of the worker).
+
+    Returns:
+        BitArray: The bits of all carrier words of the segment.
+    """
+    return (steganograph or _batchSteganograph).read_bits(segment)
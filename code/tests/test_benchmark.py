@@ -0,0 +1,64 @@
+import json
+import os
+import random
+import tempfile
+import subprocess
+import unittest
+from unittest.mock import patch
+from code.benchmark import (compareReports, fittingSecretLength, generateCover, generateWords, parseSize,
+                            runCaseInSubprocess)
+from code.steganography import Steganograph
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_parse_size(self):
+        self.assertEqual(parseSize("1KB"), 1024)
+        self.assertEqual(parseSize("16mb"), 16 << 20)
+        self.assertEqual(parseSize("1GB"), 1 << 30)
+        self.assertEqual(parseSize("100"), 100)
+
+    def test_generated_cover_is_reproducible(self):
+        # Arrange
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        words = generateWords(random.Random(1), 30)
+        carriers, fillers = words[:20], words[20:]
+        paths = [os.path.join(directory.name, name) for name in ("first.txt", "second.txt")]
+        configPath = os.path.join(directory.name, "config.json")
+        with open(configPath, "w") as file:
+            json.dump([{"word": carriers[i], "synonym": carriers[i + 1]} for i in range(0, 20, 2)], file)
+
+        # Act
+        counts = [generateCover(random.Random(2), path, 4096, carriers, fillers) for path in paths]
+
+        # Assert
+        with open(paths[0]) as first, open(paths[1]) as second:
+            cover = first.read()
+            self.assertEqual(cover, second.read())
+        self.assertEqual(counts[0], counts[1])
+        self.assertLessEqual(len(cover), 4096)
+        self.assertEqual(Steganograph(configPath).index_cover(cover).capacity_bits, counts[0][1])
+
+    def test_fitting_secret_length(self):
+        # The frame of the secret takes at most 90 percent of the capacity
+        self.assertEqual(fittingSecretLength(800), 90 - 4)
+        self.assertIsNone(fittingSecretLength(20))
+
+    def test_compare_reports(self):
+        previous = {"results": [{"name": "case", "peakMemoryBytes": 100,
+                                 "operations": {"encode": {"wordsPerSecond": 100.0}}}]}
+        current = {"results": [{"name": "case", "peakMemoryBytes": 50,
+                                "operations": {"encode": {"wordsPerSecond": 150.0}}}]}
+        self.assertEqual(compareReports(previous, current), ["case encode: +50.0% words/s", "case peak memory: -50.0%"])
+
+    def test_case_killed_without_output(self):
+        # A case killed by a signal is recorded with its exit code instead of aborting the suite
+        killed = subprocess.CompletedProcess([], -9, stdout="", stderr="")
+        with tempfile.TemporaryDirectory() as directory, patch("subprocess.run", return_value=killed):
+            result = runCaseInSubprocess(directory, {"name": "case", "secretBytes": 10})
+
+        self.assertEqual(result, {"name": "case", "secretBytes": 10, "error": "exit code -9"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from helpers.bitHelper import BitHelper
+from helpers.bitHelper import BitArray, BitHelper
 
 
 class TestBitHelper(unittest.TestCase):
@@ -43,6 +43,40 @@ class TestBitHelper(unittest.TestCase):
         self.assertIn("Bit list length must be a multiple of 8",
                       str(context.exception))
 
+    def test_bits_to_char_bit_array(self):
+        # A BitArray is decoded directly from its bytes
+        result = BitHelper.bits_to_char(BitHelper.string_to_bit_array("Hello, 🌍!"))
+        self.assertEqual(result, "Hello, 🌍!")
+
+    def test_bit_array_access(self):
+        # Single bits, slices and iteration read the bits with shifts
+        bits = BitArray(b"\xa5")
+        self.assertEqual(list(bits), [1, 0, 1, 0, 0, 1, 0, 1])
+        self.assertEqual(bits[2], 1)
+        self.assertEqual(bits[-1], 1)
+        self.assertEqual(bits[1:4], [0, 1, 0])
+        self.assertEqual(bits[::3], [1, 0, 0])
+        self.assertEqual(bits[6:20], [0, 1])
+        with self.assertRaises(IndexError):
+            bits[8]
+
+    def test_bit_array_value(self):
+        # Groups of bits are combined most significant bit first, bits behind the end count as zero
+        bits = BitArray(b"\xa5")
+        self.assertEqual(bits.value(0, 4), 0b1010)
+        self.assertEqual(bits.value(6, 2), 0b01)
+        self.assertEqual(bits.value(7, 3), 0b100)
+        self.assertEqual(bits.value(9, 2), 0)
+
+    def test_bit_array_append_and_add(self):
+        # Appending and concatenating keep the bits in order
+        bits = BitArray.from_bits([1, 0, 1])
+        bits.append(1)
+        self.assertEqual(bits + [1, 1], [1, 0, 1, 1, 1, 1])
+        self.assertEqual(BitArray(b"A") + BitArray(b"B"), BitHelper.string_to_bit_array("AB"))
+        self.assertEqual(len(BitArray(b"\xff", 3)), 3)
+        self.assertEqual(BitArray(b"\xff", 3).to_bytes(), b"\xe0")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,115 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+from code.cli import main
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.config = self.path("config.json")
+        with open(self.config, "w") as file:
+            json.dump([{"word": "happy", "synonym": "joyful"}, {"word": "big", "synonym": "large"}], file)
+        self.cover = self.path("cover.txt")
+        with open(self.cover, "w", newline="") as file:
+            file.write("I am happy, it is big. " * 40)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def run_cli(self, *arguments, stdin=""):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with patch("sys.stdin", io.StringIO(stdin)), redirect_stdout(stdout), redirect_stderr(stderr):
+            exitCode = main(list(arguments))
+        return exitCode, stdout.getvalue(), stderr.getvalue()
+
+    def test_encode_and_decode_files(self):
+        # Arrange
+        output = self.path("hidden.txt")
+
+        # Act
+        encodeResult = self.run_cli("encode", "--config", self.config, "--secret", "Hi", "--output", output, self.cover)
+        decodeResult = self.run_cli("decode", "--config", self.config, output)
+
+        # Assert
+        self.assertEqual(encodeResult, (0, "", ""))
+        self.assertEqual(decodeResult, (0, "Hi\n", ""))
+
+    def test_encode_and_decode_standard_streams(self):
+        # The cover is read from stdin and the result written to stdout
+        with open(self.cover) as file:
+            cover = file.read()
+
+        exitCode, hidden, _ = self.run_cli("encode", "--config", self.config, "--secret", "Hi", stdin=cover)
+        self.assertEqual(exitCode, 0)
+        self.assertEqual(self.run_cli("decode", "--config", self.config, stdin=hidden), (0, "Hi\n", ""))
+
+    def test_secret_file(self):
+        # The bytes of a secret file are hidden and written back unchanged
+        secret = self.path("secret.bin")
+        with open(secret, "wb") as file:
+            file.write(b"\x00\x01")
+        hidden = self.path("hidden.txt")
+        restored = self.path("restored.bin")
+
+        self.run_cli("encode", "--config", self.config, "--secret-file", secret, "--output", hidden, self.cover)
+        exitCode, _, _ = self.run_cli("decode", "--config", self.config, "--output", restored, hidden)
+
+        self.assertEqual(exitCode, 0)
+        with open(restored, "rb") as file:
+            self.assertEqual(file.read(), b"\x00\x01")
+
+    def test_encode_compressed(self):
+        # A secret too long for the cover fits once it is compressed
+        output = self.path("hidden.txt")
+
+        exitCode, _, _ = self.run_cli("encode", "--config", self.config, "--secret", "the tea", "--compression",
+                                      "huffman", "--output", output, self.cover)
+
+        self.assertEqual(exitCode, 0)
+        self.assertEqual(self.run_cli("decode", "--config", self.config, output), (0, "the tea\n", ""))
+
+    def test_capacity(self):
+        # Every sentence of the cover holds two bits
+        self.assertEqual(self.run_cli("capacity", "--config", self.config, self.cover), (0, "80 bits, 9 bytes\n", ""))
+        self.assertEqual(self.run_cli("capacity", "--config", self.config, "--framed", "--checksum", self.cover),
+                         (0, "80 bits, 2 bytes\n", ""))
+
+    def test_encode_in_place(self):
+        # The secret is hidden in the cover file itself
+        self.assertEqual(self.run_cli("encode", "--config", self.config, "--secret", "Hi", "--in-place", self.cover),
+                         (0, "", ""))
+        self.assertEqual(self.run_cli("decode", "--config", self.config, self.cover), (0, "Hi\n", ""))
+        self.assertEqual(self.run_cli("encode", "--config", self.config, "--secret", "Hi", "--in-place")[0], 1)
+
+    def test_convert(self):
+        # The converted codebook is used like the configuration
+        codebook = self.path("config.sqlite")
+        hidden = self.path("hidden.txt")
+
+        self.assertEqual(self.run_cli("convert", "--config", self.config, codebook), (0, "", ""))
+        self.run_cli("encode", "--config", codebook, "--secret", "Hi", "--output", hidden, self.cover)
+
+        self.assertEqual(self.run_cli("decode", "--config", self.config, hidden), (0, "Hi\n", ""))
+
+    def test_cover_too_small(self):
+        # A failing command reports the error and leaves no output file behind
+        output = self.path("hidden.txt")
+
+        exitCode, _, stderr = self.run_cli("encode", "--config", self.config, "--secret", "A long secret text",
+                                           "--output", output, self.cover)
+
+        self.assertEqual(exitCode, 1)
+        self.assertEqual(stderr, "error: The provided text file is too small to hide your text.\n")
+        self.assertFalse(os.path.exists(output))
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["config.json", "cover.txt"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from models.Codebook import Codebook
+from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
+
+
+class TestCodebook(unittest.TestCase):
+    def test_lookup_word_and_synonym(self):
+        # The main word encodes the bit 0, its synonym the bit 1
+        pair = Synonym(word="happy", synonym="joyful")
+        codebook = Codebook([pair, Synonym(word="sad", synonym="unhappy")])
+        self.assertEqual(codebook.lookup("happy"), (0, 0))
+        self.assertEqual(codebook.lookup("joyful"), (0, 1))
+        self.assertEqual(codebook.lookup("unhappy"), (1, 1))
+        self.assertEqual(codebook.form(0, 1), "joyful")
+
+    def test_lookup_unknown_word(self):
+        # Words that are not part of any pair are no carriers
+        codebook = Codebook([Synonym(word="happy", synonym="joyful")])
+        self.assertIsNone(codebook.lookup("today"))
+        self.assertIsNone(codebook.lookup("Happy"))
+
+    def test_first_occurrence_wins(self):
+        # A duplicated word resolves to the first pair, like a linear scan would
+        first = Synonym(word="happy", synonym="joyful")
+        second = Synonym(word="glad", synonym="happy")
+        codebook = Codebook([first, second])
+        self.assertEqual(codebook.lookup("happy"), (0, 0))
+
+    def test_lookup_group(self):
+        # The words of a group encode their position in the group
+        codebook = Codebook([Synonym(word="happy", synonym="joyful"), SynonymGroup(["big", "large", "huge", "vast"])])
+        self.assertEqual(codebook.lookup("vast"), (1, 3))
+        self.assertEqual(codebook.form(1, 2), "huge")
+        self.assertEqual(codebook.bitCounts, [1, 2])
+
+    def test_matcher_only_for_phrases(self):
+        # Single words are resolved with the entries, phrases need a matcher
+        self.assertIsNone(Codebook([Synonym(word="happy", synonym="joyful")]).matcher)
+        codebook = Codebook([Synonym(word="a lot", synonym="many")])
+        self.assertEqual(codebook.lookup("a lot"), (0, 0))
+        self.assertEqual(codebook.matcher.maxWords, 2)
+
+    def test_ignore_case(self):
+        # Words are found in any case and written in the case of the word they replace
+        codebook = Codebook([Synonym(word="happy", synonym="joyful"), Synonym(word="ı", synonym="i")], ignoreCase=True)
+        self.assertEqual(codebook.lookup("HAPPY"), (0, 0))
+        self.assertEqual(codebook.casedForm(0, 1, "happy"), "joyful")
+        self.assertEqual(codebook.casedForm(0, 1, "Happy"), "Joyful")
+        self.assertEqual(codebook.casedForm(0, 1, "HAPPY"), "JOYFUL")
+        # The upper case of the dotless i would be read as another word
+        self.assertEqual(codebook.casedForm(1, 0, "I"), "ı")
+        self.assertNotEqual(codebook.fingerprint(), Codebook(codebook.synonyms).fingerprint())
+
+    def test_fingerprint(self):
+        # The fingerprint changes with the content and the order of the pairs
+        happy = Synonym(word="happy", synonym="joyful")
+        sad = Synonym(word="sad", synonym="unhappy")
+        self.assertEqual(Codebook([happy, sad]).fingerprint(), Codebook([happy, sad]).fingerprint())
+        self.assertNotEqual(Codebook([happy, sad]).fingerprint(), Codebook([sad, happy]).fingerprint())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from helpers.codecHelper import CODEC_HUFFMAN, CODEC_NONE, CODEC_ZLIB, CodecHelper, PayloadCodec
+
+
+class TestCodecHelper(unittest.TestCase):
+    def test_round_trip_of_every_codec(self):
+        # Every codec restores texts, binary data and empty payloads
+        payloads = [b"", b"Meet me at the old bridge at nine.", "Grüße".encode('utf-8'), bytes(range(256))]
+        for name in CodecHelper.names():
+            for payload in payloads:
+                codecId, data = CodecHelper.compress(payload, name)
+                self.assertEqual(CodecHelper.decompress(codecId, data), payload, name)
+
+    def test_huffman_shrinks_short_english_text(self):
+        # The static model needs no table, so it pays off where zlib does not
+        payload = b"Meet me at the old bridge at nine."
+
+        _, huffman = CodecHelper.compress(payload, "huffman")
+        _, deflated = CodecHelper.compress(payload, "zlib")
+
+        self.assertLess(len(huffman), len(payload) * 3 // 4)
+        self.assertGreaterEqual(len(deflated), len(payload) - 2)
+
+    def test_huffman_round_trip_of_large_payload(self):
+        # Encoding is linear, so payloads of several hundred KB round trip quickly
+        payload = bytes(range(256)) * 1200 + b"Meet me at the old bridge at nine. " * 4000
+
+        codecId, data = CodecHelper.compress(payload, "huffman")
+
+        self.assertEqual(codecId, CODEC_HUFFMAN)
+        self.assertEqual(CodecHelper.decompress(codecId, data), payload)
+
+    def test_auto_picks_smallest(self):
+        # Short texts use the static model, repetitive ones deflate and incompressible ones stay as they are
+        self.assertEqual(CodecHelper.compress(b"hello there", "auto")[0], CODEC_HUFFMAN)
+        self.assertEqual(CodecHelper.compress(b"the " * 200, "auto")[0], CODEC_ZLIB)
+        self.assertEqual(CodecHelper.compress("Grüße".encode('utf-8'), "auto"), (CODEC_NONE, "Grüße".encode('utf-8')))
+
+    def test_unknown_and_corrupted(self):
+        # Unknown names and ids as well as broken data are rejected
+        with self.assertRaises(ValueError):
+            CodecHelper.compress(b"", "brotli")
+        with self.assertRaises(ValueError):
+            CodecHelper.decompress(7, b"")
+        with self.assertRaises(ValueError):
+            CodecHelper.decompress(CODEC_ZLIB, b"\xff\xff")
+        with self.assertRaises(ValueError):
+            CodecHelper.decompress(CODEC_HUFFMAN, b"")
+
+    def test_register_conflicting_id(self):
+        # An id cannot be taken over by another codec
+        with self.assertRaises(ValueError):
+            CodecHelper.register(PayloadCodec(CODEC_ZLIB, "other", bytes, bytes))
+        with self.assertRaises(ValueError):
+            CodecHelper.register(PayloadCodec(8, "other", bytes, bytes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import pickle
+import tempfile
+import unittest
+from models.Codebook import Codebook
+from models.CompactCodebook import CompactCodebook
+from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
+
+
+class TestCompactCodebook(unittest.TestCase):
+    def setUp(self):
+        self.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            SynonymGroup(["big", "large", "huge", "vast"]),
+            Synonym(word="glad", synonym="happy"),
+            Synonym(word="a lot", synonym="many")
+        ]
+
+    def test_same_as_codebook(self):
+        # Every lookup, form and the fingerprint equal those of the dictionary based codebook
+        for ignoreCase in (False, True):
+            codebook = Codebook(self.synonyms, ignoreCase)
+            compact = CompactCodebook.build(self.synonyms, ignoreCase)
+            for word in ["happy", "joyful", "vast", "glad", "a lot", "many", "Happy", "HUGE", "today"]:
+                self.assertEqual(compact.lookup(word), codebook.lookup(word))
+            self.assertEqual(compact.form(1, 2), "huge")
+            if ignoreCase:
+                self.assertEqual(compact.casedForm(0, 1, "Happy"), codebook.casedForm(0, 1, "Happy"))
+            self.assertEqual(list(compact.bitCounts), codebook.bitCounts)
+            self.assertEqual(compact.matcher.maxWords, 2)
+            self.assertEqual(compact.fingerprint(), codebook.fingerprint())
+
+    def test_synonyms_view(self):
+        # The pairs are recreated from the buffer when they are accessed
+        compact = CompactCodebook.build(self.synonyms)
+        self.assertEqual(len(compact.synonyms), 4)
+        self.assertEqual(compact.synonyms[0].synonym, "joyful")
+        self.assertEqual(compact.synonyms[1].words, ["big", "large", "huge", "vast"])
+        self.assertEqual(compact.synonyms[-1].word, "a lot")
+        self.assertIsNone(CompactCodebook.build(self.synonyms[:2]).matcher)
+
+    def test_save_and_load(self):
+        # A saved codebook is mapped from the file and pickled as its path only
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "synonyms.codebook")
+        CompactCodebook.build(self.synonyms, ignoreCase=True).save(path)
+
+        loaded = CompactCodebook.load(path)
+        self.assertTrue(loaded.ignoreCase)
+        self.assertEqual(loaded.lookup("VAST"), (1, 3))
+        self.assertLess(len(pickle.dumps(loaded)), os.path.getsize(path))
+
+        copy = pickle.loads(pickle.dumps((loaded.synonyms, loaded)))
+        self.assertIs(copy[0], copy[1].synonyms)
+        self.assertEqual(copy[1].fingerprint(), loaded.fingerprint())
+
+    def test_load_invalid_file(self):
+        # A file that is no compact codebook is rejected
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "synonyms.codebook")
+        with open(path, "wb") as file:
+            file.write(b"no codebook" * 20)
+        with self.assertRaises(ValueError):
+            CompactCodebook.load(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
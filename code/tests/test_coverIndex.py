@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from code.steganography import Steganograph
+from models.CoverIndex import CoverIndex
+from models.Synonym import Synonym
+
+
+class TestCoverIndex(unittest.TestCase):
+    def setUp(self):
+        # Arrange: Manually initialize a Steganograph instance with predefined synonyms.
+        self.steganograph = Steganograph.__new__(Steganograph)
+        self.steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            Synonym(word="sad", synonym="unhappy")
+        ]
+        self.steganograph.isInitialized = True
+        self.text = "I am happy today but also sad and joyful. " * 12 + "Still happy"
+
+    def test_index_cover_records_carriers(self):
+        # Every complete carrier word is recorded, the unterminated last word is not
+        coverIndex = self.steganograph.index_cover(self.text)
+        self.assertEqual(coverIndex.capacity_bits, 36)
+        self.assertEqual(coverIndex.capacity_bytes, 3)
+        self.assertEqual((coverIndex.starts[0], coverIndex.ends[0], coverIndex.pairIds[0]), (5, 10, 0))
+        self.assertEqual(coverIndex.pairIds[1], 1)
+        self.assertTrue(coverIndex.matches(self.text))
+
+    def test_secret_bytes_of_frames(self):
+        # The reported number of bytes is the longest secret write accepts in the given format
+        coverIndex = self.steganograph.index_cover(self.text * 10)
+        for framed, checksum in ((False, False), (True, False), (True, True)):
+            self.steganograph.framed, self.steganograph.checksum = framed, checksum
+            secretBytes = coverIndex.secret_bytes(framed, checksum)
+
+            self.steganograph.write(self.text * 10, "a" * secretBytes, coverIndex)
+            with self.assertRaises(ValueError):
+                self.steganograph.write(self.text * 10, "a" * (secretBytes + 1), coverIndex)
+        self.assertEqual(coverIndex.secret_bytes(), coverIndex.capacity_bytes)
+
+    def test_write_with_index_matches_write(self):
+        # Writing through the index produces exactly the same text as a full scan
+        coverIndex = self.steganograph.index_cover(self.text)
+        for secret in ("", "a", "abc"):
+            self.assertEqual(self.steganograph.write(self.text, secret, coverIndex),
+                             self.steganograph.write(self.text, secret))
+
+    def test_write_with_index_text_too_small(self):
+        # The capacity is checked before the text is touched
+        coverIndex = self.steganograph.index_cover(self.text)
+        with self.assertRaises(ValueError) as context:
+            self.steganograph.write(self.text, "abcd", coverIndex)
+        self.assertEqual(str(context.exception), "The provided text file is too small to hide your text.")
+
+    def test_write_with_index_of_other_text(self):
+        # An index of another text is rejected
+        coverIndex = self.steganograph.index_cover(self.text)
+        with self.assertRaises(ValueError) as context:
+            self.steganograph.write(self.text + " ", "a", coverIndex)
+        self.assertEqual(str(context.exception), "The cover index does not belong to the provided text.")
+
+    def test_write_with_index_of_other_text_of_same_length(self):
+        # An index of another text of the same length is rejected at the first carrier that differs
+        coverIndex = self.steganograph.index_cover(self.text)
+        otherText = self.text.replace("happy", "hippo")
+        with self.assertRaises(ValueError) as context:
+            self.steganograph.write(otherText, "a", coverIndex)
+        self.assertEqual(str(context.exception), "The cover index does not belong to the provided text.")
+
+    def test_save_and_load(self):
+        # A saved index can be loaded and used again
+        coverIndex = self.steganograph.index_cover(self.text)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "cover.index.json")
+
+        coverIndex.save(path)
+        loaded = CoverIndex.load(path)
+
+        self.assertEqual(loaded.to_dict(), coverIndex.to_dict())
+        self.assertEqual(self.steganograph.write(self.text, "ab", loaded), self.steganograph.write(self.text, "ab"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from code.steganography import Steganograph
+from models.CoverLibrary import CoverLibrary
+from models.Synonym import Synonym
+
+
+class TestCoverLibrary(unittest.TestCase):
+    def setUp(self):
+        # Arrange: Write three covers holding 8, 24 and 40 bits into a temporary directory.
+        self.steganograph = Steganograph.__new__(Steganograph)
+        self.steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        self.steganograph.isInitialized = True
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.paths = [self.writeCover(name, carriers) for name, carriers in (("small", 8), ("medium", 24), ("large", 40))]
+
+    def writeCover(self, name, carriers):
+        path = os.path.join(self.directory, name + ".txt")
+        with open(path, "w") as file:
+            file.write("I am happy. " * carriers)
+        return path
+
+    def test_select_smallest_sufficient_cover(self):
+        # The smallest cover holding the secret and the END_OF_SECRET is picked
+        library = CoverLibrary()
+        self.assertEqual(self.steganograph.update_library(library, self.paths), 3)
+
+        self.assertEqual(self.steganograph.select_cover(library, "a"), self.paths[1])
+        # an empty secret is written as a frame of 32 bits
+        self.assertEqual(self.steganograph.select_cover(library, ""), self.paths[2])
+        self.assertEqual(self.steganograph.select_cover(library, "abcd"), self.paths[2])
+        with self.assertRaises(ValueError):
+            self.steganograph.select_cover(library, "abcde")
+
+    def test_update_incrementally(self):
+        # Unchanged covers are not read again, changed and removed ones are updated
+        library = CoverLibrary()
+        self.steganograph.update_library(library, self.paths)
+        with patch("builtins.open", side_effect=AssertionError("A cover was read.")):
+            self.assertEqual(self.steganograph.update_library(library, self.paths), 0)
+
+        self.writeCover("small", 48)
+        os.utime(self.paths[0], ns=(0, 0))
+        copy = self.writeCover("copy", 24)
+        self.assertEqual(self.steganograph.update_library(library, self.paths[:2] + [copy]), 1)
+
+        self.assertEqual(len(library), 3)
+        self.assertEqual(self.steganograph.select_cover(library, "abcde"), self.paths[0])
+        self.assertEqual(library.best_cover(24, next(iter(library.capacities))), copy)
+
+    def test_save_and_load(self):
+        # A saved library answers the same queries
+        library = CoverLibrary()
+        self.steganograph.update_library(library, self.paths)
+        path = os.path.join(self.directory, "library.json")
+        library.save(path)
+
+        loaded = CoverLibrary.load(path)
+
+        self.assertEqual(self.steganograph.select_cover(loaded, "a"), self.paths[1])
+        self.assertEqual(self.steganograph.update_library(loaded, self.paths), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import pickle
+import tempfile
+import unittest
+from models.Codebook import Codebook
+from models.DiskCodebook import DiskCodebook
+from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
+
+
+class TestDiskCodebook(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "synonyms.sqlite")
+        self.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            SynonymGroup(["big", "large", "huge", "vast"]),
+            Synonym(word="A lot", synonym="many")
+        ]
+
+    def open(self, ignoreCase=False):
+        DiskCodebook.convert(iter(self.synonyms), self.path, ignoreCase)
+        codebook = DiskCodebook(self.path)
+        self.addCleanup(codebook.close)
+        return codebook
+
+    def test_same_as_codebook(self):
+        # Every lookup, form and the fingerprint equal those of the dictionary based codebook
+        for ignoreCase in (False, True):
+            codebook = Codebook(self.synonyms, ignoreCase)
+            disk = self.open(ignoreCase)
+            for word in ["happy", "joyful", "vast", "A lot", "a lot", "many", "Happy", "HUGE", "today"]:
+                self.assertEqual(disk.lookup(word), codebook.lookup(word))
+                self.assertEqual(disk.entries.get(word), codebook.entries.get(word))
+            self.assertEqual([disk.bitCounts[pairId] for pairId in range(3)], codebook.bitCounts)
+            self.assertEqual(disk.form(1, 2), "huge")
+            if ignoreCase:
+                self.assertEqual(disk.casedForm(0, 1, "HAPPY"), codebook.casedForm(0, 1, "HAPPY"))
+            self.assertEqual(disk.matcher.maxWords, 2)
+            self.assertEqual(disk.fingerprint(), codebook.fingerprint())
+
+    def test_synonyms_and_pickle(self):
+        # The pairs are read on access, a pickled codebook opens the file again
+        disk = self.open()
+        self.assertEqual(len(disk.synonyms), 3)
+        self.assertEqual(disk.synonyms[1].words, ["big", "large", "huge", "vast"])
+        self.assertEqual(disk.synonyms[-1].synonym, "many")
+
+        synonyms, copy = pickle.loads(pickle.dumps((disk.synonyms, disk)))
+        self.addCleanup(copy.close)
+        self.assertIs(synonyms, copy.synonyms)
+        self.assertEqual(copy.lookup("vast"), (1, 3))
+
+    def test_duplicate_word(self):
+        # A word used twice is rejected and no file is left behind
+        self.synonyms.append(Synonym(word="glad", synonym="Happy"))
+        DiskCodebook.convert(self.synonyms, self.path)
+        with self.assertRaises(ValueError):
+            DiskCodebook.convert(self.synonyms, self.path, ignoreCase=True)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["synonyms.sqlite"])
+
+    def test_invalid_file(self):
+        # A JSON configuration is no codebook file
+        with open(self.path, "w") as file:
+            file.write("[]")
+        self.assertFalse(DiskCodebook.is_disk_codebook(self.path))
+        self.open()
+        self.assertTrue(DiskCodebook.is_disk_codebook(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -43,5 +43,46 @@ class Test_FileHelper(unittest.TestCase):
         mock_file.assert_called_once_with("output.txt", "w")
         mock_file().write.assert_called_once_with("This is the content to write.")
 
+    def test_iter_chunks(self):
+        """
+        Test the iter_chunks method with a file object, a string and an iterable of strings.
+        """
+        import io
+        self.assertEqual(list(FileHelper.iter_chunks(io.StringIO("abcdefg"), 3)), ["abc", "def", "g"])
+        self.assertEqual(list(FileHelper.iter_chunks("abcdefg", 3)), ["abcdefg"])
+        self.assertEqual(list(FileHelper.iter_chunks(iter(["ab", "cd"]), 3)), ["ab", "cd"])
+
+    def test_iter_json_array(self):
+        """
+        Test the iter_json_array method with elements split across chunks and with invalid arrays.
+        """
+        import os
+        import tempfile
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "config.json")
+        data = [{"word": "happy", "synonym": "joyful"}, {"group": ["a", "b"]}, -12.5e3, [], "x , ]", None]
+        with open(path, "w") as file:
+            json.dump(data, file, indent=2)
+        for chunkSize in (1, 5, 65536):
+            self.assertEqual(list(FileHelper.iter_json_array(path, chunkSize)), data)
+
+        for content in ("", "{}", "[1,]", "[1 2]", "[1", "[1] 2"):
+            with open(path, "w") as file:
+                file.write(content)
+            with self.assertRaises(ValueError):
+                list(FileHelper.iter_json_array(path, 2))
+
+    def test_import_without_tkinter(self):
+        """
+        Test that importing the module does not import tkinter, which is only needed by select_file.
+        """
+        import subprocess
+        import sys
+        script = "import sys, helpers.fileHelper; print('tkinter' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                cwd=__file__.rsplit("tests", 1)[0])
+        self.assertEqual(result.stdout.strip(), "False")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from helpers.frameHelper import FrameDecoder, FrameHelper
+
+
+def decode(frame):
+    # Feeds a frame without its marker byte into a decoder
+    decoder = FrameDecoder()
+    completedAt = [index for index, byte in enumerate(frame[1:]) if decoder.push(byte)]
+    return decoder, completedAt
+
+
+class TestFrameHelper(unittest.TestCase):
+    def test_encode_text(self):
+        # A text frame consists of marker, version, flags, length and payload
+        self.assertEqual(FrameHelper.encode(b"hi", isText=True), b"\xff\x01\x02\x02hi")
+
+    def test_encode_varint(self):
+        # Lengths are encoded with 7 bits per byte
+        self.assertEqual(FrameHelper.encode_varint(0), b"\x00")
+        self.assertEqual(FrameHelper.encode_varint(127), b"\x7f")
+        self.assertEqual(FrameHelper.encode_varint(300), b"\xac\x02")
+
+    def test_decode_binary_with_checksum(self):
+        # The decoder completes exactly with the last byte of the frame
+        payload = bytes(range(256)) * 2
+        frame = FrameHelper.encode(payload, checksum=True)
+        decoder, completedAt = decode(frame)
+        self.assertEqual(completedAt, [len(frame) - 2])
+        self.assertEqual(decoder.result(), payload)
+
+    def test_decode_empty_text(self):
+        # An empty payload is complete right after its length
+        decoder, completedAt = decode(FrameHelper.encode(b"", isText=True))
+        self.assertEqual(completedAt, [2])
+        self.assertEqual(decoder.result(), "")
+
+    def test_decode_corrupted_checksum(self):
+        # A payload not matching its checksum is rejected
+        frame = bytearray(FrameHelper.encode(b"secret", checksum=True))
+        frame[5] ^= 1
+        decoder, _ = decode(frame)
+        with self.assertRaises(ValueError) as context:
+            decoder.result()
+        self.assertEqual(str(context.exception), "The hidden text is corrupted.")
+
+    def test_compressed_frame(self):
+        # A compressed frame has the new version and is decompressed by the decoder
+        payload = b"the " * 50
+        frame = FrameHelper.encode(payload, isText=True, checksum=True, compression="zlib")
+        decoder, completedAt = decode(frame)
+        self.assertEqual(frame[:3], b"\xff\x02\x07")
+        self.assertLess(len(frame), len(payload))
+        self.assertEqual(completedAt, [len(frame) - 2])
+        self.assertEqual(decoder.result(), payload.decode('utf-8'))
+
+    def test_decode_unsupported_version(self):
+        # Frames of unknown versions are rejected
+        with self.assertRaises(ValueError):
+            decode(b"\xff\x07\x00\x00")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from helpers.tokenHelper import TokenHelper
+from models.PhraseMatcher import PhraseMatcher
+
+
+class TestPhraseMatcher(unittest.TestCase):
+    def matches(self, matcher, text):
+        return list(matcher.iterMatches(text, TokenHelper.iter_words(text), len(text)))
+
+    def test_longest_phrase_wins(self):
+        # A phrase is matched across any whitespace, but not across punctuation
+        matcher = PhraseMatcher([["a lot", "many"], ["in order", "so as"]])
+        self.assertEqual(self.matches(matcher, "a lot, many a\nlot a. lot "),
+                         [(0, 5, 0, 0), (7, 11, 0, 1), (12, 17, 0, 0)])
+        self.assertEqual(self.matches(matcher, "so as in order."), [(0, 5, 1, 1), (6, 14, 1, 0)])
+
+    def test_phrase_reaching_end(self):
+        # The last word of a text is incomplete, so a phrase ending with it is no match
+        matcher = PhraseMatcher([["a lot", "many"]])
+        self.assertEqual(self.matches(matcher, "many a lot"), [(0, 4, 0, 1)])
+
+    def test_ambiguous_phrases(self):
+        # Phrases that could be read differently after a replacement are rejected
+        with self.assertRaises(ValueError) as context:
+            PhraseMatcher([["in order to", "to"]])
+        self.assertEqual(str(context.exception),
+                         'The synonym "in order to" contains the word "to", which begins another synonym.')
+        with self.assertRaises(ValueError) as context:
+            PhraseMatcher([["a", "one"], ["a lot", "many"]])
+        self.assertEqual(str(context.exception), 'The synonym "a" is the beginning of the synonym "a lot".')
+
+    def test_decided_length(self):
+        # A stream buffer ending with the beginning of a phrase is processed up to that phrase only
+        matcher = PhraseMatcher([["right now", "at once"], ["big", "large"]])
+        self.assertEqual(matcher.decidedLength("it is big right ", 16), 10)
+        self.assertEqual(matcher.decidedLength("it is big right. ", 17), 17)
+        self.assertEqual(matcher.decidedLength("it is big large ", 16), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from code.server import ServiceClient, SteganographyServer
+from steganography import Steganograph
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        config = os.path.join(directory.name, "config.json")
+        with open(config, "w") as file:
+            json.dump([{"word": "happy", "synonym": "joyful"}, {"word": "big", "synonym": "large"}], file)
+        self.steganograph = Steganograph(config)
+        self.cover = "I am happy, it is big. " * 40
+
+    async def start_server(self, **options):
+        server = SteganographyServer(self.steganograph, port=0, **options)
+        await server.start()
+        self.addAsyncCleanup(server.close)
+        client = await ServiceClient.connect(*server.address)
+        self.addAsyncCleanup(client.close)
+        return server, client
+
+    async def test_encode_and_decode(self):
+        # Arrange
+        server, client = await self.start_server(workers=0)
+
+        # Act
+        encoded = await client.request("encode", id=1, cover=self.cover, secret="Hi")
+        decoded = await client.request("decode", id=2, text=encoded["text"])
+        binary = await client.request("encode", cover=self.cover, secretBase64="AAE=")
+        capacity = await client.request("capacity", cover=self.cover)
+
+        # Assert
+        self.assertEqual(encoded["id"], 1)
+        self.assertEqual(decoded, {"id": 2, "ok": True, "secret": "Hi"})
+        self.assertEqual((await client.request("decode", text=binary["text"]))["secretBase64"], "AAE=")
+        self.assertEqual(capacity, {"ok": True, "bits": 80, "bytes": 9})
+
+    async def test_concurrent_requests_with_workers(self):
+        # Long covers are processed by the worker processes, short ones on the event loop
+        server, _ = await self.start_server(workers=2, inlineLimit=100)
+        clients = [await ServiceClient.connect(*server.address) for _ in range(4)]
+        for client in clients:
+            self.addAsyncCleanup(client.close)
+
+        responses = await asyncio.gather(*(client.request("encode", cover=self.cover, secret=str(number))
+                                           for number, client in enumerate(clients)))
+        decoded = await asyncio.gather(*(client.request("decode", text=response["text"])
+                                         for client, response in zip(clients, responses)))
+
+        self.assertEqual([response["secret"] for response in decoded], ["0", "1", "2", "3"])
+
+    async def test_errors(self):
+        # Failing and invalid requests are answered with an error and the connection stays usable
+        server, client = await self.start_server(workers=0)
+
+        tooSmall = await client.request("encode", cover="happy", secret="A long secret")
+        missing = await client.request("decode")
+        unknown = await client.request("delete")
+
+        self.assertEqual(tooSmall, {"ok": False, "error": "The provided text file is too small to hide your text."})
+        self.assertEqual(missing["error"], 'The request needs the text "text".')
+        self.assertFalse(unknown["ok"])
+        self.assertTrue((await client.request("capacity", cover=self.cover))["ok"])
+
+    async def test_deeply_nested_request(self):
+        # JSON nested too deeply for the parser is rejected like any other invalid request
+        server, client = await self.start_server(workers=0)
+        reader, writer = await asyncio.open_connection(*server.address)
+        self.addAsyncCleanup(writer.wait_closed)
+        self.addCleanup(writer.close)
+
+        writer.write(b"[" * 100000 + b"\n" + json.dumps({"operation": "capacity", "cover": self.cover}).encode() + b"\n")
+        await writer.drain()
+
+        self.assertEqual(json.loads(await reader.readline()), {"ok": False, "error": "The request is not a JSON object."})
+        self.assertTrue(json.loads(await reader.readline())["ok"])
+
+    async def test_close_with_open_connections(self):
+        # Closing the server ends the connections that are still open instead of leaving their handlers behind
+        server, client = await self.start_server(workers=0)
+        reader, writer = await asyncio.open_connection(*server.address)
+        self.addAsyncCleanup(writer.wait_closed)
+        self.addCleanup(writer.close)
+        await client.request("metrics")
+
+        await asyncio.wait_for(server.close(), 5)
+
+        self.assertEqual(await asyncio.wait_for(reader.read(), 5), b"")
+
+    async def test_failed_worker_process(self):
+        # A request whose worker process dies is answered with an error and the pool is replaced
+        server, client = await self.start_server(workers=1, inlineLimit=100)
+        await client.request("capacity", cover=self.cover)
+        for process in list(server._SteganographyServer__executor._processes.values()):
+            process.kill()
+            process.join()
+
+        failed = await client.request("capacity", cover=self.cover)
+
+        self.assertEqual(failed, {"ok": False, "error": "A worker process failed while processing the request."})
+        self.assertTrue((await client.request("capacity", cover=self.cover))["ok"])
+
+    async def test_request_size_limit(self):
+        # A request longer than the limit is rejected and its connection closed
+        server, client = await self.start_server(workers=0, maxRequestSize=1024)
+
+        response = await client.request("decode", text="happy " * 1000)
+
+        self.assertEqual(response, {"ok": False, "error": "The request exceeds 1024 bytes."})
+        with self.assertRaises(ConnectionError):
+            await client.request("decode", text="happy")
+
+    async def test_metrics(self):
+        # The latencies of the answered requests are reported per operation
+        server, client = await self.start_server(workers=0)
+        encoded = await client.request("encode", cover=self.cover, secret="Hi")
+        for _ in range(3):
+            await client.request("decode", text=encoded["text"])
+        await client.request("decode")
+
+        metrics = (await client.request("metrics"))["metrics"]
+
+        self.assertEqual(metrics["operations"]["decode"]["requests"], 4)
+        self.assertEqual(metrics["operations"]["decode"]["errors"], 1)
+        self.assertEqual(metrics["operations"]["encode"]["requests"], 1)
+        self.assertLessEqual(metrics["operations"]["decode"]["p50Seconds"], metrics["operations"]["decode"]["maxSeconds"])
+        self.assertEqual(metrics["inFlight"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,14 @@
+import io
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import call, patch
 from code.steganography import Steganograph
+from helpers.fileHelper import FileHelper
+from models.StatsObserver import StatsObserver
 from models.Synonym import Synonym
+from models.SynonymGroup import SynonymGroup
 
 class TestSteganograph(unittest.TestCase):
     
@@ -119,6 +126,652 @@ class TestSteganograph(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             steganograph.read(text_with_no_hidden_message)
         self.assertEqual(str(context.exception), "No secret was found in the text.")
+
+    def test_write_stream_word_split_across_chunks(self):
+        # Test that a carrier word split between two chunks is still replaced.
+        # Arrange: Manually initialize a Steganograph instance with predefined synonyms.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            Synonym(word="sad", synonym="unhappy")
+        ]
+        steganograph.END_OF_SECRET = [1, 1]
+        steganograph.isInitialized = True
+        chunks = ["I am ha", "ppy today but also s", "ad and joy", "ful. I would be happy if ", "the test runs."]
+        destination = io.StringIO()
+
+        with patch('helpers.bitHelper.BitHelper.string_to_bit_array') as mock_bit_array:
+            mock_bit_array.return_value = [0, 1]
+
+            # Act: Write the hidden text into the chunked text.
+            steganograph.write_stream(chunks, destination, "ok")
+
+        # Assert: The words are replaced and the rest of the text is copied unchanged.
+        self.assertEqual(destination.getvalue(), "I am happy today but also unhappy and joyful. I would be joyful if the test runs.")
+
+    def test_write_stream_matches_write(self):
+        # Test that streaming a file object produces exactly the same text as write.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            Synonym(word="sad", synonym="unhappy")
+        ]
+        steganograph.isInitialized = True
+        text = "happy sad joyful unhappy, " * 40
+        expected = steganograph.write(text, "A")
+
+        for chunkSize in (1, 2, 7, 1000):
+            destination = io.StringIO()
+            steganograph.write_stream(io.StringIO(text), destination, "A", chunkSize)
+            self.assertEqual(destination.getvalue(), expected)
+
+    def test_write_stream_text_too_small(self):
+        # Test that streaming a too small text raises the same error as write.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful")
+        ]
+        steganograph.isInitialized = True
+
+        with self.assertRaises(ValueError) as context:
+            steganograph.write_stream(["I am ", "happy."], io.StringIO(), "secret")
+        self.assertEqual(str(context.exception), "The provided text file is too small to hide your text.")
+
+    def test_read_stream_word_split_across_chunks(self):
+        # Test that read_stream extracts the secret from chunks that split carrier words.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            Synonym(word="sad", synonym="unhappy")
+        ]
+        steganograph.isInitialized = True
+        text = steganograph.write("happy sad joyful unhappy, " * 40, "Hi")
+        chunks = [text[index:index + 3] for index in range(0, len(text), 3)]
+
+        self.assertEqual(steganograph.read_stream(chunks), "Hi")
+        self.assertEqual(steganograph.read_stream(io.StringIO(text), 5), "Hi")
+
+    def test_read_stream_no_hidden_message(self):
+        # Test that read_stream raises if the stream ends before the secret.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful")
+        ]
+        steganograph.isInitialized = True
+
+        with self.assertRaises(ValueError) as context:
+            steganograph.read_stream(["I am ha", "ppy"])
+        self.assertEqual(str(context.exception), "No secret was found in the text.")
+
+    def test_read_mapped_file_stops_at_end_of_secret(self):
+        # Test that read_mapped_file decodes the file only up to the end of the secret.
+        # Arrange: Write an encoded text followed by bytes that are no valid UTF-8 into a file.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="fröhlich", synonym="glücklich"),
+            Synonym(word="sad", synonym="unhappy")
+        ]
+        steganograph.isInitialized = True
+        text = steganograph.write("fröhlich sad glücklich unhappy, " * 40, "ö")
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(text.encode("utf-8") + b"\xff\xfe" * 1000)
+        self.addCleanup(os.remove, file.name)
+
+        # Act & Assert: Small chunks split the multi-byte characters, the invalid tail is never decoded.
+        self.assertEqual(steganograph.read_mapped_file(file.name, 3), "ö")
+        self.assertEqual(steganograph.read_mapped_file(file.name, 64), "ö")
+
+    def test_read_mapped_file_empty_file(self):
+        # Test that an empty file contains no secret.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            pass
+        self.addCleanup(os.remove, file.name)
+
+        with self.assertRaises(ValueError) as context:
+            steganograph.read_mapped_file(file.name)
+        self.assertEqual(str(context.exception), "No secret was found in the text.")
+
+    def test_read_many_and_write_many(self):
+        # Test the batch API in worker processes and in the current process.
+        # Arrange: Create two cover files in a temporary directory.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            Synonym(word="sad", synonym="unhappy")
+        ]
+        steganograph.isInitialized = True
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        covers = [os.path.join(directory.name, f"cover{index}.txt") for index in range(2)]
+        # the covers are UTF-8 with Windows newlines, whatever the locale of the workers is
+        for cover in covers:
+            with open(cover, "w", encoding="utf-8", newline="") as file:
+                file.write("happy sad joyful unhappy, über\r\n" * 40)
+        jobs = [(cover, f"secret {index}", cover + ".out") for index, cover in enumerate(covers)]
+        jobs.append(("missing.txt", "secret", "missing.out"))
+
+        for workers in (1, 2):
+            # Act: Encode all covers and decode the results, including a missing file.
+            written = list(steganograph.write_many(jobs, workers=workers))
+            read = list(steganograph.read_many([job[2] for job in jobs], workers=workers))
+
+            # Assert: Every item has a result in order, failing items only report their error.
+            self.assertEqual([result.value for result in written[:2]], [jobs[0][2], jobs[1][2]])
+            self.assertIsInstance(written[2].error, FileNotFoundError)
+            self.assertEqual([result.value for result in read[:2]], ["secret 0", "secret 1"])
+            self.assertFalse(read[2].succeeded())
+            with open(jobs[0][2], "r", encoding="utf-8", newline="") as file:
+                self.assertEqual(file.read().count("über\r\n"), 40)
+
+    def test_read_many_reads_paths_lazily(self):
+        # Test that only a bounded number of paths is taken from an endless iterable.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        consumed = 0
+
+        def paths():
+            nonlocal consumed
+            while True:
+                consumed += 1
+                yield f"missing{consumed}.txt"
+
+        results = steganograph.read_many(paths(), workers=2)
+        first = [next(results) for _ in range(3)]
+        results.close()
+
+        self.assertEqual([result.item for result in first], ["missing1.txt", "missing2.txt", "missing3.txt"])
+        self.assertLessEqual(consumed, 3 + 2 * 2)
+
+    def test_write_parallel_and_read_parallel(self):
+        # Test that splitting a text into segments gives the same result as processing it at once.
+        # Arrange: Use segments shorter than a phrase, so that boundaries fall everywhere.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="a lot", synonym="many"),
+            SynonymGroup(words=["big", "large", "huge", "vast"])
+        ]
+        steganograph.isInitialized = True
+        text = "A big house, a lot of  big\ndogs and a\nlot of huge cats. " * 30
+        secret = "Parallel"
+        expected = steganograph.write(text, secret)
+
+        for workers, segmentSize in ((1, 1), (1, 7), (2, 50)):
+            # Act
+            encodedText = steganograph.write_parallel(text, secret, workers=workers, segmentSize=segmentSize)
+            decodedText = steganograph.read_parallel(encodedText, workers=workers, segmentSize=segmentSize)
+
+            # Assert
+            self.assertEqual(encodedText, expected)
+            self.assertEqual(decodedText, secret)
+
+        with self.assertRaises(ValueError):
+            steganograph.write_parallel(text[:100], secret, workers=1, segmentSize=10)
+        with self.assertRaises(ValueError):
+            steganograph.read_parallel(text, workers=1, segmentSize=10)
+
+    def test_rewrite(self):
+        # Test that a new secret only replaces the carriers whose bits differ.
+        # Arrange: Hide a secret that differs from the new one in a single bit.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            SynonymGroup(words=["big", "large", "huge", "vast"])
+        ]
+        steganograph.isInitialized = True
+        text = "A big house, a happy dog. " * 60
+        encodedText = steganograph.write(text, "a")
+
+        # Act
+        patch = steganograph.rewrite(encodedText, "c")
+        indexedPatch = steganograph.rewrite(encodedText, "c", steganograph.index_cover(encodedText))
+
+        # Assert: "a" and "c" differ in their seventh bit, the second bit of the fourth carrier.
+        self.assertEqual(len(patch), 1)
+        self.assertEqual(list(indexedPatch), list(patch))
+        self.assertEqual(steganograph.read(patch.apply(encodedText)), "c")
+        with self.assertRaises(ValueError):
+            steganograph.rewrite(encodedText, "a secret that is too long to fit")
+
+    def test_write_in_place(self):
+        # Test that a secret hidden in place in a file reads like one written by write.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful"), Synonym(word="big", synonym="huge")]
+        steganograph.isInitialized = True
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "cover.txt")
+        text = "A big dog is happy.\r\n" * 40
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+
+        patch = steganograph.write_in_place(path, "hi")
+
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            encodedText = file.read()
+        self.assertEqual(steganograph.read(encodedText), "hi")
+        self.assertEqual(patch.apply(text), encodedText)
+        self.assertEqual(len(patch), sum(1 for old, new in zip(text.split(), encodedText.split()) if old != new))
+        with self.assertRaises(ValueError):
+            steganograph.write_in_place(path, "a secret that is too long for the file")
+
+    def test_write_in_place_reads_up_to_the_secret(self):
+        # Test that the file is decoded only up to the last carrier of the secret, with and without an index.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        steganograph.CHUNK_SIZE = 64
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "cover.txt")
+        text = "Ünd happy.\n" * 200
+        iterMappedChunks = FileHelper.iter_mapped_chunks
+        decodedLengths = []
+
+        def iterChunks(path, chunkSize):
+            for chunk in iterMappedChunks(path, chunkSize):
+                decodedLengths.append(len(chunk))
+                yield chunk
+
+        for coverIndex in (None, steganograph.index_cover(text)):
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(text)
+            decodedLengths.clear()
+            with patch("helpers.fileHelper.FileHelper.iter_mapped_chunks", side_effect=iterChunks):
+                steganograph.write_in_place(path, "hi", coverIndex)
+
+            # "hi" and the END_OF_SECRET need the first 24 of 200 lines
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                self.assertEqual(file.read(), steganograph.write(text, "hi"))
+            self.assertLess(sum(decodedLengths), len(text) // 4)
+
+    def test_read_all(self):
+        # Test that every secret of a text holding two secrets one after another is found.
+        # Arrange: Write a second secret into the carriers behind the first one.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            SynonymGroup(words=["big", "large", "huge", "vast"])
+        ]
+        steganograph.isInitialized = True
+        text = "A big house, a happy dog. " * 60
+        firstText = steganograph.write(text, "ab")
+        end = next(steganograph.read_all(firstText)).end
+        encodedText = firstText[:end] + steganograph.write(firstText[end:], b"cd")
+
+        # Act
+        secrets = list(steganograph.read_all(encodedText))
+        streamedSecrets = list(steganograph.read_all(io.StringIO(encodedText), chunkSize=7))
+
+        # Assert: The second secret starts with the carrier behind the first one, chunks change nothing.
+        self.assertEqual([secret.value for secret in secrets], ["ab", b"cd"])
+        self.assertEqual((secrets[0].start, secrets[0].end, secrets[0].carriers), (2, end, range(0, 16)))
+        self.assertEqual(secrets[1].carriers.start, 16)
+        self.assertEqual(steganograph.read(encodedText[secrets[1].start:secrets[1].end + 1]), b"cd")
+        self.assertEqual([(secret.value, secret.start, secret.end, secret.carriers) for secret in streamedSecrets],
+                         [(secret.value, secret.start, secret.end, secret.carriers) for secret in secrets])
+
+    def test_read_all_continues_behind_corrupted_secret(self):
+        # Test that a frame with a wrong checksum is reported and the next secret is still found.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        steganograph.framed = steganograph.checksum = True
+        text = "I am happy. " * 200
+        firstText = steganograph.write(text, "a")
+        end = next(steganograph.read_all(firstText)).end
+        encodedText = firstText[:end] + steganograph.write(firstText[end:], "b")
+
+        # the last carrier of the first frame belongs to its checksum
+        lastCarrier = encodedText.rfind(" ", 0, end) + 1
+        corruptedWord = "happy" if encodedText[lastCarrier:end] == "joyful" else "joyful"
+        corruptedText = encodedText[:lastCarrier] + corruptedWord + encodedText[end:]
+        secrets = list(steganograph.read_all(corruptedText))
+
+        self.assertFalse(secrets[0].succeeded())
+        self.assertIsInstance(secrets[0].error, ValueError)
+        self.assertEqual(secrets[1].value, "b")
+
+    def test_decoder(self):
+        # Test that a text fed in small pieces, split inside words, decodes like the whole text.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful"), SynonymGroup(["big", "large", "huge", "vast"])]
+        steganograph.isInitialized = True
+        encodedText = steganograph.write("A big dog is happy. " * 100, "secret")
+
+        decoder = steganograph.decoder()
+        with self.assertRaises(ValueError):
+            decoder.result()
+        position = 0
+        while not decoder.feed(encodedText[position:position + 7]):
+            position += 7
+
+        self.assertEqual(decoder.result(), "secret")
+        self.assertEqual(decoder.position, min(position + 7, len(encodedText)))
+
+    def test_decoder_checkpoint(self):
+        # Test that a decoder restored from a checkpoint continues where the saved one stopped.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        steganograph.framed = True
+        encodedText = steganograph.write("I am happy. " * 200, "secret")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "feed.checkpoint")
+
+        decoder = steganograph.decoder()
+        # the checkpoint is taken inside a word
+        self.assertFalse(decoder.feed(encodedText[:103]))
+        decoder.save_checkpoint(path)
+        with open(path, "r") as file:
+            checkpoint = json.load(file)
+        restored = steganograph.decoder(checkpoint)
+
+        self.assertEqual(restored.position, 103)
+        self.assertTrue(restored.feed(encodedText[restored.position:]))
+        self.assertEqual(restored.result(), "secret")
+
+        other = Steganograph.__new__(Steganograph)
+        other.synonyms = [Synonym(word="sad", synonym="unhappy")]
+        other.isInitialized = True
+        with self.assertRaises(ValueError):
+            other.decoder(checkpoint)
+        with self.assertRaises(ValueError):
+            steganograph.decoder(dict(checkpoint, bitCount=checkpoint["bitCount"] + 8))
+
+    @patch('helpers.fileHelper.FileHelper.read_json_file')
+    def test_init_config_with_groups(self, mock_read_json_file):
+        # Test that pairs and groups of 2^k words can be mixed in a configuration.
+        mock_read_json_file.return_value = [
+            {"word": "happy", "synonym": "joyful"},
+            {"group": ["big", "large", "huge", "vast"]}
+        ]
+
+        steganograph = Steganograph("config.json")
+
+        self.assertIsInstance(steganograph.synonyms[1], SynonymGroup)
+        self.assertEqual(steganograph.codebook.lookup("huge"), (1, 2))
+        self.assertEqual(steganograph.codebook.bitCounts, [1, 2])
+
+    @patch('helpers.fileHelper.FileHelper.read_json_file')
+    def test_init_invalid_groups(self, mock_read_json_file):
+        # Test that groups with a wrong size or duplicated words are rejected.
+        invalidConfigs = {
+            "The value with the index 0 is invalid.": [{"group": ["big", "large", "huge"]}],
+            'The synonym "big" exists at least two times.': [{"group": ["big", "large"]}, {"word": "small", "synonym": "big"}],
+            'The synonym "huge" exists at least two times.': [{"group": ["big", "huge", "huge", "vast"]}]
+        }
+
+        for message, config in invalidConfigs.items():
+            mock_read_json_file.return_value = config
+            with self.assertRaises(ValueError) as context:
+                Steganograph("config.json")
+            self.assertEqual(str(context.exception), message)
+
+    def test_write_and_read_with_groups(self):
+        # Test that a group of four words carries two bits per occurrence.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            SynonymGroup(words=["big", "large", "huge", "vast"])
+        ]
+        steganograph.isInitialized = True
+        text = "A big house, a happy dog. " * 12
+
+        result = steganograph.write(text, "Hi")
+
+        # 'H' is 01001000: big carries 01, happy 0, big 01, happy 0, big 00
+        self.assertTrue(result.startswith("A large house, a happy dog. A large house, a happy dog. A big house"))
+        self.assertEqual(steganograph.read(result), "Hi")
+        self.assertEqual(steganograph.index_cover(text).capacity_bits, 36)
+        self.assertEqual(steganograph.write(text, "Hi", steganograph.index_cover(text)), result)
+
+    def test_write_and_read_framed(self):
+        # Test that framed secrets, including binary data, are read back and sentinel secrets still work.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            SynonymGroup(words=["big", "large", "huge", "vast"])
+        ]
+        steganograph.isInitialized = True
+        text = "A big house, a happy dog. " * 60
+        legacyText = steganograph.write(text, "legacy")
+        steganograph.framed = True
+        steganograph.checksum = True
+
+        framedText = steganograph.write(text, "Hi ö")
+        binaryText = steganograph.write(text, b"\xff\x00\xfe")
+
+        self.assertEqual(steganograph.read(framedText), "Hi ö")
+        self.assertEqual(steganograph.read(binaryText), b"\xff\x00\xfe")
+        self.assertEqual(steganograph.read_stream([binaryText[:7], binaryText[7:]]), b"\xff\x00\xfe")
+        self.assertEqual(steganograph.read(legacyText), "legacy")
+
+    def test_read_framed_stops_after_frame(self):
+        # Test that a frame is complete after exactly its own carriers, even if the cover ends right after.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.framed = True
+        steganograph.isInitialized = True
+        # marker, version, flags, length and one byte of payload need 40 carriers
+        text = "happy " * 40 + "end"
+
+        self.assertEqual(steganograph.read(steganograph.write(text, "A")), "A")
+        with self.assertRaises(ValueError):
+            steganograph.write("happy " * 39 + "end", "A")
+
+    def test_write_and_read_empty_secret(self):
+        # Test that an empty secret is written as a frame, as its END_OF_SECRET would look like a frame marker.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        # marker, version, flags and a zero length need 32 carriers
+        text = "happy " * 32 + "end"
+
+        self.assertEqual(steganograph.secret_bits(""), 32)
+        self.assertEqual(steganograph.read(steganograph.write(text, "")), "")
+        self.assertEqual(steganograph.read_stream([steganograph.write(text, "")]), "")
+
+    def test_write_and_read_compressed(self):
+        # Test that compressed secrets need fewer carriers and are decompressed without configuration.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        secret = "meet me at the station at nine"
+        # the uncompressed frame needs 8 * (4 + 30) carriers
+        text = "happy " * 200 + "end"
+        with self.assertRaises(ValueError):
+            steganograph.write(text, secret)
+        steganograph.compression = "auto"
+
+        hiddenText = steganograph.write(text, secret)
+        steganograph.compression = None
+
+        self.assertEqual(steganograph.read(hiddenText), secret)
+        self.assertEqual(steganograph.read_stream([hiddenText[:9], hiddenText[9:]]), secret)
+
+    def test_init_with_codebook_cache(self):
+        # Test that the compiled codebook is cached and invalidated when the configuration changes.
+        # Arrange: Write a configuration file into a temporary directory.
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        configPath = os.path.join(directory.name, "config.json")
+        cacheDirectory = os.path.join(directory.name, "cache")
+        with open(configPath, "w") as file:
+            file.write('[{"word": "happy", "synonym": "joyful"}, {"group": ["big", "large", "huge", "vast"]}]')
+
+        # Act: The first construction compiles the codebook, the second one loads it without validating it.
+        first = Steganograph(configPath, cacheDirectory=cacheDirectory)
+        with patch.object(Steganograph, '_Steganograph__validateAndApplyConfig',
+                          side_effect=AssertionError("The configuration was validated again.")):
+            second = Steganograph(configPath, cacheDirectory=cacheDirectory)
+
+        # Assert: Both instances work the same and exactly one cache entry exists, a mapped compact codebook.
+        self.assertEqual(len(os.listdir(cacheDirectory)), 1)
+        self.assertIsNotNone(second.codebook.path)
+        with open(second.codebook.path, "rb") as file:
+            self.assertEqual(file.read(4), b"CCB1")
+        self.assertEqual(second.write("happy big day " * 8, "hi"), first.write("happy big day " * 8, "hi"))
+        self.assertEqual(second.codebook.fingerprint(), first.codebook.fingerprint())
+        self.assertEqual(second.synonyms[0].word, "happy")
+        self.assertTrue(second.isInitialized)
+
+        # Act: Changing the configuration replaces the cache entry.
+        with open(configPath, "w") as file:
+            file.write('[{"word": "sad", "synonym": "unhappy"}]')
+        third = Steganograph(configPath, cacheDirectory=cacheDirectory)
+
+        self.assertEqual(third.codebook.lookup("unhappy"), (0, 1))
+        self.assertIsNone(third.codebook.lookup("happy"))
+        self.assertEqual(len(os.listdir(cacheDirectory)), 1)
+
+        # Act: A truncated cache entry is rejected and replaced.
+        cachePath = os.path.join(cacheDirectory, os.listdir(cacheDirectory)[0])
+        with open(cachePath, "rb") as file:
+            entry = file.read()
+        with open(cachePath, "wb") as file:
+            file.write(entry[:len(entry) // 2])
+        fourth = Steganograph(configPath, cacheDirectory=cacheDirectory)
+
+        self.assertEqual(fourth.codebook.lookup("unhappy"), (0, 1))
+        with open(cachePath, "rb") as file:
+            self.assertEqual(file.read(), entry)
     
+    def test_init_compact_with_codebook_cache(self):
+        # Test that a compact codebook is cached as a mapped file and hides the same bits as the normal one.
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        configPath = os.path.join(directory.name, "config.json")
+        cacheDirectory = os.path.join(directory.name, "cache")
+        with open(configPath, "w") as file:
+            file.write('[{"word": "happy", "synonym": "joyful"}, {"group": ["big", "large", "huge", "vast"]}]')
+
+        plain = Steganograph(configPath)
+        compiled = Steganograph(configPath, cacheDirectory=cacheDirectory, compact=True)
+        with patch('json.loads', side_effect=AssertionError("The configuration was parsed again.")):
+            mapped = Steganograph(configPath, cacheDirectory=cacheDirectory, compact=True)
+
+        text = "happy big day " * 8
+        self.assertIsNotNone(mapped.codebook.path)
+        self.assertIs(mapped.synonyms, mapped.codebook.synonyms)
+        self.assertEqual(compiled.codebook.fingerprint(), plain.codebook.fingerprint())
+        self.assertEqual(mapped.write(text, "hi"), plain.write(text, "hi"))
+        self.assertEqual(mapped.read(plain.write(text, "hi")), "hi")
+
+    def test_observer_statistics(self):
+        # Test that an observer receives the statistics of a write and a read without changing their results.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [
+            Synonym(word="happy", synonym="joyful"),
+            SynonymGroup(words=["big", "large", "huge", "vast"])
+        ]
+        steganograph.isInitialized = True
+        text = "A big house, a happy dog. " * 12
+        expected = steganograph.write(text, "Hi")
+        steganograph.observer = StatsObserver()
+
+        result = steganograph.write(text, "Hi")
+        writeStats = steganograph.observer.lastStats
+        secret = steganograph.read(result)
+        readStats = steganograph.observer.lastStats
+
+        self.assertEqual(result, expected)
+        self.assertEqual(secret, "Hi")
+        # "Hi" and the END_OF_SECRET take 24 of the 36 bits of the 72 words
+        self.assertEqual((writeStats.operation, writeStats.wordsScanned, writeStats.carriersMatched), ("write", 72, 24))
+        self.assertEqual((writeStats.bitsEmbedded, writeStats.remainingCapacityBits), (24, 12))
+        self.assertEqual(writeStats.charactersRead, len(text))
+        self.assertEqual(set(writeStats.phaseSeconds), {"secret", "tokenize", "lookup", "embed", "join"})
+        self.assertEqual((readStats.operation, readStats.bitsRead), ("read", 24))
+        self.assertEqual(set(readStats.phaseSeconds), {"tokenize", "lookup", "decode"})
+
+    def test_observer_progress_of_streams(self):
+        # Test that streaming operations report their progress after every chunk and scan the whole cover.
+        class RecordingObserver(StatsObserver):
+            def __init__(self):
+                super().__init__()
+                self.progress = []
+
+            def onProgress(self, stats):
+                self.progress.append(stats.charactersRead)
+
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful")]
+        steganograph.isInitialized = True
+        steganograph.STATS_WINDOW_SIZE = 7
+        text = "happy days, " * 40
+        chunks = [text[i:i + 50] for i in range(0, len(text), 50)]
+        steganograph.observer = RecordingObserver()
+        destination = io.StringIO()
+
+        steganograph.write_stream(chunks, destination, "A")
+        writeStats = steganograph.observer.lastStats
+
+        self.assertEqual(destination.getvalue(), steganograph.write(text, "A"))
+        self.assertEqual(steganograph.read_stream([destination.getvalue()]), "A")
+        self.assertEqual(len(steganograph.observer.progress), len(chunks) - 1)
+        self.assertEqual((writeStats.wordsScanned, writeStats.carriersMatched, writeStats.bitsEmbedded), (80, 40, 16))
+        self.assertEqual((writeStats.remainingCapacityBits, writeStats.charactersRead), (24, len(text)))
+
+    def test_write_and_read_with_phrases(self):
+        # Test that phrases are carriers and are found again when a chunk of a stream ends inside them.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="a lot", synonym="many"), Synonym(word="big", synonym="large")]
+        steganograph.isInitialized = True
+        text = "We ate a lot of big\npies. " * 12
+        chunks = [text[i:i + 11] for i in range(0, len(text), 11)]
+        destination = io.StringIO()
+
+        result = steganograph.write(text, "A")
+        steganograph.write_stream(chunks, destination, "A")
+
+        # 'A' is 01000001: "a lot" carries 0, big 1, "a lot" 0, big 0
+        self.assertTrue(result.startswith("We ate a lot of large\npies. We ate a lot of big\npies. We ate a lot"))
+        self.assertEqual(destination.getvalue(), result)
+        self.assertEqual(steganograph.read(result), "A")
+        self.assertEqual(steganograph.read_stream([result[i:i + 11] for i in range(0, len(result), 11)]), "A")
+        self.assertEqual(steganograph.index_cover(text).capacity_bits, 24)
+
+    @patch('helpers.fileHelper.FileHelper.read_json_file')
+    def test_init_ambiguous_phrases(self, mock_read_json_file):
+        # Test that a configuration with phrases that cannot be decoded unambiguously is rejected.
+        mock_read_json_file.return_value = [{"word": "in order to", "synonym": "to"}]
+
+        with self.assertRaises(ValueError) as context:
+            Steganograph("config.json")
+        self.assertEqual(str(context.exception),
+                         'The synonym "in order to" contains the word "to", which begins another synonym.')
+
+    def test_write_and_read_ignoring_case(self):
+        # Test that carriers are found in any case and the replacing words keep the case of the carriers.
+        steganograph = Steganograph.__new__(Steganograph)
+        steganograph.synonyms = [Synonym(word="happy", synonym="joyful"), Synonym(word="a lot", synonym="many")]
+        steganograph.isInitialized = True
+        steganograph.ignoreCase = True
+        text = "Happy people laugh A LOT. " * 12
+
+        result = steganograph.write(text, "A")
+
+        # 'A' is 01000001
+        self.assertTrue(result.startswith("Happy people laugh MANY. Happy people laugh A LOT. Happy"))
+        self.assertEqual(steganograph.read(result), "A")
+        steganograph.ignoreCase = False
+        with self.assertRaises(ValueError):
+            steganograph.read(result)
+
+    @patch('helpers.fileHelper.FileHelper.read_json_file')
+    def test_init_duplicate_ignoring_case(self, mock_read_json_file):
+        # Test that words differing in their case only are duplicates if the case is ignored.
+        mock_read_json_file.return_value = [{"word": "happy", "synonym": "joyful"}, {"word": "Happy", "synonym": "glad"}]
+
+        self.assertTrue(Steganograph("config.json").isInitialized)
+        with self.assertRaises(ValueError) as context:
+            Steganograph("config.json", ignoreCase=True)
+        self.assertEqual(str(context.exception), 'The synonym "Happy" exists at least two times.')
+
 if __name__ == '__main__':
     unittest.main()
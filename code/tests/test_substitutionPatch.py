@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from array import array
+from models.SubstitutionPatch import SubstitutionPatch
+
+
+def create_patch(text, replacements):
+    # Builds a patch from (start, old word, new word) triples
+    starts = array("q", [start for start, _, _ in replacements])
+    return SubstitutionPatch(starts, SubstitutionPatch.byte_offsets(text, starts),
+                             [old for _, old, _ in replacements], [new for _, _, new in replacements], len(text))
+
+
+class TestSubstitutionPatch(unittest.TestCase):
+    def test_byte_offsets(self):
+        # Indices behind multi-byte characters move in the encoded text
+        self.assertEqual(SubstitutionPatch.byte_offsets("abc", array("q", [1, 2])).tolist(), [1, 2])
+        self.assertEqual(SubstitutionPatch.byte_offsets("ä b ö c", array("q", [2, 6])).tolist(), [3, 8])
+
+    def test_apply_same_length(self):
+        # Words of the same length are overwritten without moving the rest
+        text = "big dog, big cat"
+        patch = create_patch(text, [(0, "big", "fat"), (9, "big", "old")])
+        buffer = bytearray(text.encode("utf-8"))
+
+        patch.apply_in_place(buffer)
+
+        self.assertIsNone(patch.first_resize())
+        self.assertEqual(patch.apply(text), "fat dog, old cat")
+        self.assertEqual(buffer, b"fat dog, old cat")
+
+    def test_apply_changing_length(self):
+        # The text behind the first word changing its length is shifted
+        text = "ä happy dog, über big cat"
+        patch = create_patch(text, [(2, "happy", "sadly"), (13, "über", "sehr"), (18, "big", "large")])
+        buffer = bytearray(text.encode("utf-8"))
+
+        patch.apply_in_place(buffer)
+
+        self.assertEqual(patch.first_resize(), 1)
+        self.assertEqual(patch.apply(text), "ä sadly dog, sehr large cat")
+        self.assertEqual(buffer.decode("utf-8"), "ä sadly dog, sehr large cat")
+
+    def test_apply_to_other_text(self):
+        # A patch is only applied to the text it was created for
+        patch = create_patch("big dog", [(0, "big", "fat")])
+        buffer = bytearray(b"old dog")
+
+        with self.assertRaises(ValueError):
+            patch.apply("old dog")
+        with self.assertRaises(ValueError):
+            patch.apply_in_place(buffer)
+        self.assertEqual(buffer, b"old dog")
+
+    def test_apply_to_file(self):
+        # Same-length words are written in place, otherwise the file is replaced by a patched copy
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "cover.txt")
+        text = "ä happy dog,\r\nüber big cat"
+        with open(path, "wb") as file:
+            file.write(text.encode("utf-8"))
+        inode = os.stat(path).st_ino
+
+        create_patch(text, [(2, "happy", "sadly")]).apply_to_file(path)
+        self.assertEqual(os.stat(path).st_ino, inode)
+
+        text = text.replace("happy", "sadly")
+        create_patch(text, [(2, "sadly", "happy"), (14, "über", "sehr"), (19, "big", "large")]).apply_to_file(path)
+        with open(path, "rb") as file:
+            self.assertEqual(file.read().decode("utf-8"), "ä happy dog,\r\nsehr large cat")
+        self.assertEqual(os.listdir(directory.name), ["cover.txt"])
+
+        with self.assertRaises(ValueError):
+            create_patch(text, [(2, "sadly", "happy")]).apply_to_file(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from helpers.tokenHelper import TokenHelper
+
+
+def reference_words(text):
+    # Splits the text character by character, like the original implementation did
+    words, current, start = [], "", 0
+    for index, char in enumerate(text):
+        if char.isalpha():
+            if not current:
+                start = index
+            current += char
+        elif current:
+            words.append((start, index, current))
+            current = ""
+    if current:
+        words.append((start, len(text), current))
+    return words
+
+
+class TestTokenHelper(unittest.TestCase):
+    def test_iter_words_simple_text(self):
+        # Words are separated by every non-alphabetic character
+        result = list(TokenHelper.iter_words("I am happy, today."))
+        self.assertEqual(result, [(0, 1, "I"), (2, 4, "am"), (5, 10, "happy"), (12, 17, "today")])
+
+    def test_iter_words_unicode(self):
+        # Non-ASCII letters are part of words, digits and underscores are not
+        result = [word for _, _, word in TokenHelper.iter_words("Straße_über 42fröhlich")]
+        self.assertEqual(result, ["Straße", "über", "fröhlich"])
+
+    def test_iter_words_numeric_letters(self):
+        # Numeric characters matched by the regex but not alphabetic split words like `str.isalpha` does
+        text = "ab²cd Ⅻx 一二 x½"
+        self.assertEqual(list(TokenHelper.iter_words(text)), reference_words(text))
+
+    def test_iter_words_matches_isalpha_for_all_characters(self):
+        # Every character of the basic multilingual plane is classified like `str.isalpha`
+        text = "".join(chr(code) for code in range(0x10000) if not 0xD800 <= code <= 0xDFFF)
+        self.assertEqual(list(TokenHelper.iter_words(text)), reference_words(text))
+
+    def test_iter_words_range(self):
+        # A word reaching the end of the range is cut off at it
+        result = list(TokenHelper.iter_words("one two three", 4, 6))
+        self.assertEqual(result, [(4, 6, "tw")])
+
+
+if __name__ == '__main__':
+    unittest.main()